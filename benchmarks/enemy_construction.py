@@ -0,0 +1,66 @@
+"""
+Enemy construction microbenchmark.
+
+Measures enemies constructed per second from raw template dictionaries
+(compiled on every construction) and from shared EnemyPrototypes.
+
+Usage:
+    python benchmarks/enemy_construction.py
+    python benchmarks/enemy_construction.py --count 50000 --template 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.entities import Enemy
+from src.entities.enemy_prototype import EnemyPrototype
+from src.utils.data_bundle import get_data_bundle
+
+PATH: list[tuple[int, int]] = [(0, 0), (400, 0), (400, 400), (800, 400)]
+
+
+def bench(count: int, make: Callable[[], Enemy]) -> float:
+    """Construct ``count`` enemies and return enemies per second."""
+    start = time.perf_counter()
+    for _ in range(count):
+        make()
+    return count / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Enemy construction throughput.")
+    parser.add_argument("--count", type=int, default=20_000, help="enemies per measurement")
+    parser.add_argument("--template", help="only measure this template id")
+    args = parser.parse_args(argv)
+
+    bundle = get_data_bundle()
+    keys = [args.template] if args.template else list(bundle.enemy_templates)
+
+    print(f"{'template':>8} {'abilities':<28} {'dict/s':>10} {'prototype/s':>12} {'speedup':>8}")
+    for key in keys:
+        template = dict(bundle.enemy_templates[key], id=key)
+        prototype = EnemyPrototype.from_template(template)
+
+        from_dict = bench(args.count, partial(Enemy, PATH, template))
+        from_prototype = bench(args.count, partial(Enemy, PATH, prototype))
+
+        abilities = ",".join(prototype.ability_names) or "-"
+        print(
+            f"{key:>8} {abilities:<28} {from_dict:>10,.0f} {from_prototype:>12,.0f} "
+            f"{from_prototype / from_dict:>7.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Entity memory benchmark.
+
+Uses tracemalloc to report the bytes allocated per live enemy and per live
+projectile when tens of thousands of them exist at once. Enemies share one
+waypoint path, so the numbers cover the entity objects themselves.
+
+Usage:
+    python benchmarks/entity_memory.py
+    python benchmarks/entity_memory.py --count 100000 --template 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.entities import Enemy, Projectile
+from src.entities.tower import get_tower_presets
+from src.utils.data_bundle import get_data_bundle
+
+PATH: list[tuple[int, int]] = [(0, 0), (400, 0), (400, 400), (800, 400)]
+
+
+def measure(count: int, make: Callable[[], object]) -> tuple[float, int]:
+    """Return (bytes per object, peak bytes) for ``count`` live objects."""
+    make()  # Warm up caches (shape surfaces, ability registry, ...)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    objects = [make() for _ in range(count)]
+
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_object = (current - before) / count
+    del objects
+    return per_object, peak - before
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bytes per live enemy and projectile.")
+    parser.add_argument("--count", type=int, default=50_000, help="live entities per measurement")
+    parser.add_argument("--template", default="1", help="enemy template id")
+    parser.add_argument("--preset", default="rapid", help="tower preset firing the projectiles")
+    args = parser.parse_args(argv)
+
+    prototype = get_data_bundle().enemy_prototypes[args.template]
+    presets = get_tower_presets()
+    stats = presets.get(args.preset) or next(iter(presets.values()))
+    target = Enemy(PATH, prototype)
+
+    def make_projectile() -> Projectile:
+        return Projectile(
+            (0, 0),
+            target,
+            stats.damage,
+            stats.damage_type,
+            speed=stats.projectile_speed,
+            explosive=stats.explosive,
+            explosion_radius=stats.explosion_radius,
+            shape=stats.projectile_shape,
+            color1=stats.projectile_color1,
+            color2=stats.projectile_color2,
+            size=stats.projectile_size,
+            source=stats.preset_name,
+        )
+
+    rows = [
+        (f"enemy (template {args.template})", measure(args.count, lambda: Enemy(PATH, prototype))),
+        (f"projectile ({stats.preset_name})", measure(args.count, make_projectile)),
+    ]
+
+    print(f"{args.count:,} live entities per measurement")
+    print(f"{'entity':<24} {'bytes/object':>13} {'peak MiB':>9}")
+    for name, (per_object, peak) in rows:
+        print(f"{name:<24} {per_object:>13,.0f} {peak / 2**20:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Idle timer benchmark.
+
+Attaches ability timers for many enemies that have timed abilities
+(healers, summoners, dashers) to a timer wheel, then advances the wheel
+tick by tick and reports the cost per tick. Cooldowns are seconds long,
+so most ticks have no due timers and should cost about the same as an
+empty wheel.
+
+Usage:
+    python benchmarks/idle_timers.py
+    python benchmarks/idle_timers.py --count 50000 --ticks 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.timer_wheel import TimerWheel
+from src.entities import Enemy
+from src.utils.data_bundle import get_data_bundle
+
+PATH: list[tuple[int, int]] = [(0, 0), (400, 0), (400, 400), (800, 400)]
+TICK_MS: float = 1000 / 60
+
+
+def run(count: int, ticks: int, template_ids: list[str]) -> tuple[float, int, int]:
+    """Return (microseconds per tick, timers pending at start, callbacks fired)."""
+    prototypes = get_data_bundle().enemy_prototypes
+    timers = TimerWheel()
+    enemies: list[Enemy] = []
+    for i in range(count):
+        enemy = Enemy(PATH, prototypes[template_ids[i % len(template_ids)]])
+        enemy.all_enemies = enemies  # Abilities look at the (empty) world list
+        enemy.enter_world(timers)
+    pending = len(timers)
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        timers.advance(TICK_MS)
+    elapsed = time.perf_counter() - start
+    return elapsed / ticks * 1e6, pending, timers.fired
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Timer wheel cost per tick with idle timers.")
+    parser.add_argument("--count", type=int, default=10_000, help="enemies with timed abilities")
+    parser.add_argument("--ticks", type=int, default=150, help="ticks to advance (60 per second)")
+    args = parser.parse_args(argv)
+
+    # Templates whose abilities run on timers
+    prototypes = get_data_bundle().enemy_prototypes
+    timed = [
+        key
+        for key, proto in prototypes.items()
+        if any(name in ("healer", "dash", "inispeed") for name in proto.ability_names)
+    ]
+    if not timed:
+        print("No enemy templates with timed abilities found.")
+        return 1
+
+    print(f"{args.ticks} ticks of {TICK_MS:.1f} ms, templates {', '.join(timed)}")
+    print(f"{'enemies':>8} {'pending':>8} {'fired':>8} {'us/tick':>9}")
+    for count in (0, args.count):
+        per_tick, pending, fired = run(count, args.ticks, timed)
+        print(f"{count:>8,} {pending:>8,} {fired:>8,} {per_tick:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Per-tick allocation benchmark.
+
+Builds a level with towers along its roads and slow, nearly unkillable
+enemies spread over the paths, so every tick moves enemies, retargets,
+fires and resolves projectiles without the population changing. After a
+warm-up it runs the world tick by tick under tracemalloc and reports:
+
+- transient memory: before each tick the traced peak is reset, and after
+  it the peak is compared with the memory still allocated. The difference
+  is the most memory the tick held in temporaries at once (lists built
+  per tower, vectors kept across a loop, ...). A temporary freed right
+  away only adds its own size, so the budget is kept tight.
+- retained memory: the blocks from the game's own code still allocated
+  per tick at the end (snapshot comparison), plus the interpreter-wide
+  block count from ``sys.getallocatedblocks``.
+
+Exits with status 1 when the mean transient memory per tick is above
+``--max-peak-bytes`` or more than ``--max-blocks`` blocks per tick remain.
+
+Usage:
+    python benchmarks/tick_allocations.py
+    python benchmarks/tick_allocations.py --level 1 --enemies 200 --ticks 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pygame as pg
+
+from src.config.settings import ENEMY_PATH_SPREAD, SIM_STEP_MS
+from src.core.game_world import GameWorld, GameWorldConfig
+from src.entities import Enemy
+from src.systems import BuildingBlueprint, BuildManager
+from src.utils.data_bundle import get_data_bundle
+from src.utils.path_utils import generate_offset_path
+
+TOWER_TYPES: list[str] = ["basic", "cannon", "rapid", "sniper", "flame"]
+SOURCE_FILTER = tracemalloc.Filter(True, str(PROJECT_ROOT / "src" / "*"))
+
+
+def build_world(level: int, towers: int, enemies: int, template: str) -> GameWorld:
+    """A world with towers beside the roads and ``enemies`` slow walkers on them."""
+    random.seed(1)
+    world = GameWorld(GameWorldConfig(level_config=get_data_bundle().levels_config[level]))
+    world.resources.resources.update(gold=10**9, wood=10**9, metal=10**9, health=10**9)
+
+    image = pg.Surface((40, 40))
+    spots = [
+        (x, y)
+        for x in range(20, 780, 45)
+        for y in range(20, 980, 45)
+        if 75
+        < min(
+            BuildManager._point_to_segment_distance(x, y, a[0], a[1], b[0], b[1])
+            for a, b in world.road_segments
+        )
+        < 110
+    ]
+    random.shuffle(spots)
+    built = 0
+    for pos in spots:
+        if built >= towers:
+            break
+        kind = TOWER_TYPES[built % len(TOWER_TYPES)]
+        blueprint = BuildingBlueprint(
+            f"Tower - {kind}", image, {"gold": 1}, 40, 40,
+            world.build_manager.build_tower, tower_type=kind,
+        )
+        built += world.try_build(pos, blueprint)
+
+    prototype = get_data_bundle().enemy_prototypes[template]
+    roads = list(world.waypoints)
+    for _ in range(enemies):
+        road = random.choice(roads)
+        path = generate_offset_path(
+            world.waypoints[road], random.uniform(-ENEMY_PATH_SPREAD, ENEMY_PATH_SPREAD)
+        )
+        enemy = Enemy(path, prototype)
+        enemy.road = road
+        enemy.speed = 0.1  # Stay on the map for the whole run
+        enemy.health = enemy.max_health = 10**12
+        enemy.armor = enemy.magic_resistance = 0
+        enemy.advance(random.uniform(0, 400))
+        enemy.all_enemies = world.enemies
+        enemy.enter_world(world.timers, world.particles, world.floating_texts)
+        world.enemies.append(enemy)
+    return world
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Blocks left allocated per steady-state tick.")
+    parser.add_argument("--level", type=int, default=0, help="level index")
+    parser.add_argument("--towers", type=int, default=15, help="towers to place")
+    parser.add_argument("--enemies", type=int, default=100, help="enemies on the roads")
+    parser.add_argument("--template", default="1", help="enemy template id")
+    parser.add_argument("--warmup", type=int, default=600, help="ticks before measuring")
+    parser.add_argument("--ticks", type=int, default=1000, help="measured ticks")
+    parser.add_argument(
+        "--max-peak-bytes",
+        type=float,
+        default=2048,
+        help="fail above this many transient bytes per tick (mean)",
+    )
+    parser.add_argument(
+        "--max-blocks", type=float, default=0.5, help="fail above this many blocks left per tick"
+    )
+    args = parser.parse_args(argv)
+
+    # Warm up traced, so state replaced every tick is in both snapshots
+    world = build_world(args.level, args.towers, args.enemies, args.template)
+    tracemalloc.start()
+    for _ in range(args.warmup):
+        world.step(SIM_STEP_MS)
+
+    gc.collect()
+    before = tracemalloc.take_snapshot().filter_traces([SOURCE_FILTER])
+    blocks_before = sys.getallocatedblocks()
+    transient: list[int] = []
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        tracemalloc.reset_peak()
+        world.step(SIM_STEP_MS)
+        current, peak = tracemalloc.get_traced_memory()
+        transient.append(peak - current)
+    elapsed = time.perf_counter() - start
+    peak_per_tick = sum(transient) / args.ticks
+    gc.collect()
+    blocks_after = sys.getallocatedblocks()
+    after = tracemalloc.take_snapshot().filter_traces([SOURCE_FILTER])
+    tracemalloc.stop()
+
+    growth = after.compare_to(before, "lineno")
+    per_tick = sum(stat.count_diff for stat in growth) / args.ticks
+
+    if world.is_game_over or len(world.enemies) < args.enemies:
+        print("Warning: enemies left the map during the run; use fewer ticks")
+    print(
+        f"{len(world.towers)} towers, {len(world.enemies)} enemies, "
+        f"{len(world.projectiles)} projectiles in flight"
+    )
+    print(f"{args.ticks} ticks, {elapsed / args.ticks * 1e6:,.0f} us/tick (traced)")
+    print(f"transient bytes per tick: {peak_per_tick:,.0f} mean, {max(transient):,} max")
+    print(f"blocks left per tick (game code): {per_tick:+.3f}")
+    print(f"blocks left per tick (process):   {(blocks_after - blocks_before) / args.ticks:+.3f}")
+    for stat in growth[:5]:
+        if stat.count_diff:
+            frame = stat.traceback[0]
+            print(f"  {stat.count_diff:+6d} blocks  {frame.filename}:{frame.lineno}")
+
+    world.close()
+    return 0 if peak_per_tick <= args.max_peak_bytes and per_tick <= args.max_blocks else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,18 @@ DEFAULT_START_GOLD: int = 100
 DEFAULT_START_WOOD: int = 50
 DEFAULT_START_METAL: int = 25
 
+# Building costs and factory payouts
+TOWER_COSTS: dict[str, dict[str, int]] = {
+    "basic": {"gold": 50},
+    "cannon": {"gold": 150, "wood": 70, "metal": 20},
+    "flame": {"gold": 200, "wood": 90},
+    "rapid": {"gold": 150, "wood": 10},
+    "sniper": {"gold": 200, "metal": 15},
+}
+TOWER_UPGRADE_COST: dict[str, int] = {"gold": 150, "wood": 50}
+FACTORY_COSTS: dict[str, dict[str, int]] = {"metal": {"gold": 50}, "wood": {"gold": 35}}
+FACTORY_PAYOUTS: dict[str, int] = {"metal": 10, "wood": 15}  # Resource produced per wave
+
 # Road/Path settings
 ROAD_COLLISION_THICKNESS: int = 100
 
@@ -32,6 +44,46 @@ ROAD_COLLISION_THICKNESS: int = 100
 GHOST_ALPHA: int = 120
 PAUSE_OVERLAY_ALPHA: int = 128
 
+# Particle effects
+PARTICLE_CAPACITY: int = 2048  # Live particles before the oldest are replaced
+PARTICLE_FRAME_BUDGET: int = 256  # Particles that may be emitted per tick
+
+# Floating combat text
+FLOATING_TEXT_MAX_VISIBLE: int = 64
+FLOATING_TEXT_MERGE_RADIUS: float = 40.0  # Repeats closer than this merge ("+5 ×3")
+FLOATING_TEXT_MERGE_WINDOW_MS: float = 400.0  # ...if the earlier text is younger than this
+FLOATING_TEXT_RISE_SPEED: float = 12.0  # Pixels per second
+
+# Tower targeting
+TARGET_LOCK_MS: float = 250.0  # Towers keep their targets this long before re-evaluating
+MAX_VOLLEYS_PER_STEP: int = 64  # Safety cap on volleys a tower fires within one tick
+HITSCAN_SPEED_THRESHOLD: float = 1.5  # Projectile speed (px/ms) resolved without an entity
+HITSCAN_TRACER_MS: float = 80.0  # How long a fast shot's tracer line stays visible
+ENEMY_PATH_SPREAD: float = 25.0  # Enemies walk up to this far beside the road's center line
+# Extra reach when computing tower path coverage (spread plus waypoint rounding)
+PATH_COVERAGE_MARGIN: float = ENEMY_PATH_SPREAD + 2.0
+
+# Game speed
+MIN_GAME_SPEED: float = 0.25
+MAX_UI_GAME_SPEED: float = 64.0  # Headless worlds are not capped
+SIM_RATE_HZ: int = 30  # Simulation ticks per second of game time, independent of FPS
+SIM_STEP_MS: float = 1000 / SIM_RATE_HZ  # Game time covered by one simulation tick
+MAX_SIM_STEPS_PER_FRAME: int = 64  # Past this a frame runs slower than the requested speed
+MAX_RENDER_SKIP: int = 7  # Frames in a row that may go unrendered while the simulation catches up
+
+# Garbage collection
+GC_WAVE_GEN2_THRESHOLD: int = 1_000_000  # Gen-1 collections before a full one during waves
+
+# Frame hitch detection
+HITCH_BUDGET_MS: float = 50.0  # Frames (update + render) slower than this are reported
+HITCH_HISTORY_FRAMES: int = 120  # Recent frames kept in the ring buffer
+HITCH_REPORT_CONTEXT: int = 5  # Times of the frames before a hitch included in its report
+HITCH_REPORTS_KEPT: int = 32  # Reports kept in memory
+
+# Sampling profiler
+PROFILER_SAMPLE_INTERVAL_MS: float = 5.0  # Time between stack samples
+PROFILER_OUTPUT: str = "profile.collapsed"  # Collapsed stacks, written when profiling stops
+
 # Spawn settings
 DEFAULT_INTER_ENEMY_SPAWN_DELAY_MS: int = 500
 
@@ -6,6 +6,7 @@ from .event_manager import (
     EnemyKilledEvent,
     EnemyReachedEndEvent,
     EnemySpawnedEvent,
+    EnemySummonedEvent,
     EventManager,
     FactoryBuiltEvent,
     FactoryProducedEvent,
@@ -13,22 +14,39 @@ from .event_manager import (
     GameOverEvent,
     ResourceChangedEvent,
     ResourceInsufficientEvent,
+    SubscriberTiming,
     TowerBuiltEvent,
     TowerSoldEvent,
     TowerUpgradedEvent,
     WaveCompletedEvent,
     WaveStartedEvent,
 )
-from .game import GameContext, GameEngine
+from .event_trace import EventTraceRecorder
+from .game import GameContext, GameEngine, RenderPacer
 from .game_state import GameState
 from .game_world import GamePhase, GameWorld, GameWorldConfig, WaveRewards
+from .gc_manager import GCManager
+from .hitch_detector import FrameRecord, HitchDetector
+from .instrumentation import Instrumentation
+from .sampling_profiler import SamplingProfiler
+from .timer_wheel import TimerHandle, TimerWheel
 
 __all__ = [
     "GameState",
     "EventManager",
     "GameEvent",
+    "SubscriberTiming",
     "GameEngine",
     "GameContext",
+    "RenderPacer",
+    "EventTraceRecorder",
+    "TimerWheel",
+    "TimerHandle",
+    "Instrumentation",
+    "GCManager",
+    "HitchDetector",
+    "FrameRecord",
+    "SamplingProfiler",
     # Game world
     "GameWorld",
     "GameWorldConfig",
@@ -41,6 +59,7 @@ __all__ = [
     "EnemySpawnedEvent",
     "EnemyKilledEvent",
     "EnemyReachedEndEvent",
+    "EnemySummonedEvent",
     "WaveStartedEvent",
     "WaveCompletedEvent",
     "ResourceChangedEvent",
@@ -20,10 +20,21 @@ Usage:
 
     # Cleanup
     events.unsubscribe(GameEvent.ENEMY_KILLED, on_enemy_killed)
+
+Deferred dispatch:
+    # Queue events and deliver them once per tick
+    events = EventManager(deferred=True)
+    events.emit(GameEvent.RESOURCE_CHANGED, ...)  # queued, coalesced per resource
+    events.flush()                                # delivered here
+
+    # Skip building event data nobody will receive
+    if events.has_subscribers(GameEvent.ENEMY_SPAWNED):
+        events.emit(GameEvent.ENEMY_SPAWNED, EnemySpawnedEvent(enemy=enemy))
 """
 
 from __future__ import annotations
 
+import time
 from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -35,7 +46,7 @@ if TYPE_CHECKING:
 
 
 # Event Data Classes - These define the exact structure of event data
-@dataclass
+@dataclass(slots=True)
 class TowerBuiltEvent:
     """Data for TOWER_BUILT event."""
 
@@ -44,7 +55,7 @@ class TowerBuiltEvent:
     tower_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TowerUpgradedEvent:
     """Data for TOWER_UPGRADED event."""
 
@@ -54,7 +65,7 @@ class TowerUpgradedEvent:
     new_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TowerSoldEvent:
     """Data for TOWER_SOLD event."""
 
@@ -62,30 +73,41 @@ class TowerSoldEvent:
     refund_amount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemySpawnedEvent:
     """Data for ENEMY_SPAWNED event."""
 
     enemy: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyKilledEvent:
     """Data for ENEMY_KILLED event."""
 
     enemy: Any
     gold_reward: int
+    source: str | None = None  # Tower preset or ability that dealt the killing blow
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyReachedEndEvent:
     """Data for ENEMY_REACHED_END event."""
 
     enemy: Any
     damage: int
+    road: str | None = None
+
+
+@dataclass(slots=True)
+class EnemySummonedEvent:
+    """Data for ENEMY_SUMMONED event."""
+
+    enemy: Any
+    summoner: Any
+    ability: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveStartedEvent:
     """Data for WAVE_STARTED event."""
 
@@ -93,7 +115,7 @@ class WaveStartedEvent:
     wave_data: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class WaveCompletedEvent:
     """Data for WAVE_COMPLETED event."""
 
@@ -101,7 +123,7 @@ class WaveCompletedEvent:
     rewards: dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceChangedEvent:
     """Data for RESOURCE_CHANGED event."""
 
@@ -111,7 +133,7 @@ class ResourceChangedEvent:
     change: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceInsufficientEvent:
     """Data for RESOURCE_INSUFFICIENT event."""
 
@@ -120,14 +142,14 @@ class ResourceInsufficientEvent:
     available: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GameOverEvent:
     """Data for GAME_OVER event."""
 
     won: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityUsedEvent:
     """Data for ABILITY_USED event."""
 
@@ -136,14 +158,14 @@ class AbilityUsedEvent:
     cost: dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityReadyEvent:
     """Data for ABILITY_READY event."""
 
     ability_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FactoryBuiltEvent:
     """Data for FACTORY_BUILT event."""
 
@@ -152,7 +174,7 @@ class FactoryBuiltEvent:
     resource_type: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class FactoryProducedEvent:
     """Data for FACTORY_PRODUCED event."""
 
@@ -173,6 +195,7 @@ class GameEvent(Enum):
     ENEMY_SPAWNED = auto()
     ENEMY_KILLED = auto()
     ENEMY_REACHED_END = auto()
+    ENEMY_SUMMONED = auto()
 
     # Wave events
     WAVE_STARTED = auto()
@@ -198,17 +221,69 @@ class GameEvent(Enum):
     FACTORY_PRODUCED = auto()
 
 
+# Data class carried by each event (None for events emitted without data)
+EVENT_DATA_TYPES: dict[GameEvent, type | None] = {
+    GameEvent.TOWER_BUILT: TowerBuiltEvent,
+    GameEvent.TOWER_UPGRADED: TowerUpgradedEvent,
+    GameEvent.TOWER_SOLD: TowerSoldEvent,
+    GameEvent.ENEMY_SPAWNED: EnemySpawnedEvent,
+    GameEvent.ENEMY_KILLED: EnemyKilledEvent,
+    GameEvent.ENEMY_REACHED_END: EnemyReachedEndEvent,
+    GameEvent.ENEMY_SUMMONED: EnemySummonedEvent,
+    GameEvent.WAVE_STARTED: WaveStartedEvent,
+    GameEvent.WAVE_COMPLETED: WaveCompletedEvent,
+    GameEvent.ALL_WAVES_COMPLETED: None,
+    GameEvent.RESOURCE_CHANGED: ResourceChangedEvent,
+    GameEvent.RESOURCE_INSUFFICIENT: ResourceInsufficientEvent,
+    GameEvent.GAME_PAUSED: None,
+    GameEvent.GAME_RESUMED: None,
+    GameEvent.GAME_OVER: GameOverEvent,
+    GameEvent.GAME_WON: None,
+    GameEvent.ABILITY_USED: AbilityUsedEvent,
+    GameEvent.ABILITY_READY: AbilityReadyEvent,
+    GameEvent.FACTORY_BUILT: FactoryBuiltEvent,
+    GameEvent.FACTORY_PRODUCED: FactoryProducedEvent,
+}
+
+
 # Type alias for event callbacks - now receives a dataclass
 EventCallback = Callable[[Any], None]
 
 
+@dataclass(slots=True)
+class SubscriberTiming:
+    """Cumulative dispatch cost of one subscriber for one event."""
+
+    event: GameEvent
+    subscriber: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
 class EventManager:
     """
     Central event bus for game-wide pub/sub communication.
+
+    In deferred mode ``emit`` only queues events; they are delivered in order
+    by ``flush``, which the game world calls once per tick. Queued
+    RESOURCE_CHANGED events for the same resource are merged while the change
+    keeps its sign, so income and spending stay separate.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, deferred: bool = False) -> None:
         self._listeners: dict[GameEvent, list[EventCallback]] = defaultdict(list)
+        self.deferred = deferred
+        self._queue: list[tuple[GameEvent, Any]] = []
+        self._pending_resource_changes: dict[str, ResourceChangedEvent] = {}
+
+        # Profiling
+        self._timing_enabled = False
+        self._timings: dict[tuple[GameEvent, EventCallback], SubscriberTiming] = {}
 
     def subscribe(self, event: GameEvent, callback: EventCallback) -> None:
         """
@@ -224,23 +299,123 @@ class EventManager:
         if callback in self._listeners[event]:
             self._listeners[event].remove(callback)
 
+    def has_subscribers(self, event: GameEvent) -> bool:
+        """Check whether anyone listens to an event (without creating an entry)."""
+        return bool(self._listeners.get(event))
+
     def emit(self, event: GameEvent, data: Any) -> None:
         """
         Emit an event to all subscribers.
 
+        Events without subscribers are dropped. In deferred mode the event is
+        queued until the next ``flush``.
+
         Args:
             event: The event type to emit
             data: Event data (should be an appropriate event dataclass)
         """
+        if not self._listeners.get(event):
+            return
+
+        if not self.deferred:
+            self._dispatch(event, data)
+            return
+
+        if event is GameEvent.RESOURCE_CHANGED and isinstance(data, ResourceChangedEvent):
+            pending = self._pending_resource_changes.get(data.resource_type)
+            if pending is not None and (pending.change < 0) == (data.change < 0):
+                pending.new_value = data.new_value
+                pending.change += data.change
+                return
+            # Copy so merging never mutates an object the emitter still holds
+            data = ResourceChangedEvent(
+                resource_type=data.resource_type,
+                old_value=data.old_value,
+                new_value=data.new_value,
+                change=data.change,
+            )
+            self._pending_resource_changes[data.resource_type] = data
+
+        self._queue.append((event, data))
+
+    def flush(self) -> int:
+        """
+        Deliver all queued events in emission order.
+
+        Events emitted by handlers during the flush are queued for the next one.
+
+        Returns:
+            Number of events delivered.
+        """
+        if not self._queue:
+            return 0
+
+        queue = self._queue
+        self._queue = []
+        self._pending_resource_changes = {}
+
+        for event, data in queue:
+            self._dispatch(event, data)
+        return len(queue)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of events waiting for the next flush."""
+        return len(self._queue)
+
+    def _dispatch(self, event: GameEvent, data: Any) -> None:
+        """Call every subscriber of an event, isolating handler errors."""
+        if self._timing_enabled:
+            self._dispatch_timed(event, data)
+            return
+
+        for callback in self._listeners[event]:
+            try:
+                callback(data)
+            except Exception as e:
+                print(f"Error in event handler for {event}: {e}")
+
+    def _dispatch_timed(self, event: GameEvent, data: Any) -> None:
         for callback in self._listeners[event]:
+            start = time.perf_counter()
             try:
                 callback(data)
             except Exception as e:
                 print(f"Error in event handler for {event}: {e}")
+            elapsed = time.perf_counter() - start
+
+            key = (event, callback)
+            timing = self._timings.get(key)
+            if timing is None:
+                name = getattr(callback, "__qualname__", repr(callback))
+                timing = SubscriberTiming(event=event, subscriber=name)
+                self._timings[key] = timing
+            timing.calls += 1
+            timing.total_seconds += elapsed
+            if elapsed > timing.max_seconds:
+                timing.max_seconds = elapsed
+
+    # -------------------------------------------------------------------------
+    # Profiling
+    # -------------------------------------------------------------------------
+
+    def enable_timing(self, enabled: bool = True) -> None:
+        """Turn per-subscriber cumulative timing on or off."""
+        self._timing_enabled = enabled
+
+    def get_timings(self) -> list[SubscriberTiming]:
+        """Get per-subscriber timings, most expensive first."""
+        return sorted(self._timings.values(), key=lambda t: t.total_seconds, reverse=True)
+
+    def reset_timings(self) -> None:
+        """Discard collected subscriber timings."""
+        self._timings.clear()
 
     def clear(self) -> None:
-        """Remove all event subscriptions."""
+        """Remove all event subscriptions and drop queued events."""
         self._listeners.clear()
+        self._queue.clear()
+        self._pending_resource_changes.clear()
 
     def clear_event(self, event: GameEvent) -> None:
         """Remove all subscriptions for a specific event."""
@@ -248,4 +423,4 @@ class EventManager:
 
     def subscriber_count(self, event: GameEvent) -> int:
         """Get the number of subscribers for an event."""
-        return len(self._listeners[event])
+        return len(self._listeners.get(event, ()))
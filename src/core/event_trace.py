@@ -0,0 +1,246 @@
+"""
+Streaming event trace recorder.
+
+Subscribes to every GameEvent and streams one compact JSON line per event to
+a rotating set of segment files for offline analysis of long sessions:
+
+    [tick, wave, "EVENT_NAME", {payload}]
+
+Payload fields come from the event data classes in ``event_manager``;
+entities are replaced by their ``handle``. The first line of every segment is
+a header describing that schema:
+
+    ["#", TRACE_FORMAT_VERSION, {"EVENT_NAME": [field, ...], ...}]
+
+The game loop only pushes raw (tick, wave, event, data) tuples onto a bounded
+queue. Encoding and file writes happen on a background thread.
+
+Usage:
+    recorder = EventTraceRecorder(events, "traces", prefix="level1")
+    recorder.start()
+    ...
+    recorder.stop()
+    print(recorder.records_written, recorder.dropped)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from .event_manager import EVENT_DATA_TYPES, EventManager, GameEvent
+
+TRACE_FORMAT_VERSION: int = 1
+SEGMENT_SUFFIX: str = ".jsonl"
+
+# Sentinel telling the writer thread to finish
+_STOP = object()
+
+
+def trace_schema() -> dict[str, list[str]]:
+    """Field names recorded for each event, derived from the event data classes."""
+    schema: dict[str, list[str]] = {}
+    for event, data_type in EVENT_DATA_TYPES.items():
+        if data_type is None:
+            schema[event.name] = []
+        else:
+            schema[event.name] = [f.name for f in dataclasses.fields(data_type)]
+    return schema
+
+
+def _encode_value(value: Any) -> Any:
+    """Reduce a payload value to JSON-friendly data; entities become handles."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    handle = getattr(value, "handle", None)
+    if handle is not None:
+        return handle
+    if isinstance(value, (tuple, list)):
+        return [_encode_value(v) for v in value]
+    if isinstance(value, dict):
+        # Keep only scalar entries (e.g. wave_data carries pre-built enemies)
+        return {
+            str(k): v
+            for k, v in value.items()
+            if v is None or isinstance(v, (bool, int, float, str))
+        }
+    return None
+
+
+def encode_payload(data: Any) -> dict[str, Any]:
+    """Encode an event data class into a flat payload dictionary."""
+    if data is None or not dataclasses.is_dataclass(data):
+        return {}
+    return {f.name: _encode_value(getattr(data, f.name)) for f in dataclasses.fields(data)}
+
+
+class EventTraceRecorder:
+    """
+    Records every game event to rotating JSON-lines segment files.
+
+    Args:
+        events: Event manager to subscribe to.
+        directory: Directory receiving the segment files.
+        prefix: Segment file name prefix (a timestamp is appended).
+        tick_source: Returns the current simulation tick.
+        max_segment_bytes: Start a new segment after this many bytes.
+        max_segments: Delete the oldest segments beyond this count (None keeps all).
+        queue_size: Capacity of the queue feeding the writer thread.
+        block_on_full: Apply backpressure instead of dropping when the queue is full.
+    """
+
+    def __init__(
+        self,
+        events: EventManager,
+        directory: str | Path,
+        prefix: str = "trace",
+        tick_source: Callable[[], int] | None = None,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segments: int | None = None,
+        queue_size: int = 10_000,
+        block_on_full: bool = False,
+    ) -> None:
+        self.events = events
+        self.directory = Path(directory)
+        self.prefix = f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}"
+        self.tick_source = tick_source or (lambda: 0)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self.block_on_full = block_on_full
+
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+        self._callbacks: dict[GameEvent, Callable[[Any], None]] = {}
+        self._wave: int = -1
+
+        # Writer state (owned by the writer thread)
+        self._file: Any = None
+        self._segment_index: int = 0
+        self._segment_bytes: int = 0
+        self._segments: list[Path] = []
+
+        # Statistics
+        self.records_written: int = 0
+        self.dropped: int = 0
+        self.write_errors: int = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def segments(self) -> list[Path]:
+        """Segment files written so far, oldest first."""
+        return list(self._segments)
+
+    def start(self) -> None:
+        """Subscribe to all events and start the writer thread."""
+        if self._thread is not None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._writer_loop, name="event-trace", daemon=True)
+        self._thread.start()
+
+        for event in GameEvent:
+            callback = partial(self._on_event, event)
+            self._callbacks[event] = callback
+            self.events.subscribe(event, callback)
+
+    def stop(self) -> None:
+        """Unsubscribe, drain the queue and close the current segment."""
+        if self._thread is None:
+            return
+
+        for event, callback in self._callbacks.items():
+            self.events.unsubscribe(event, callback)
+        self._callbacks.clear()
+
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _on_event(self, event: GameEvent, data: Any) -> None:
+        """Queue a raw record; runs on the game thread and never touches the disk."""
+        if event is GameEvent.WAVE_STARTED and data is not None:
+            self._wave = data.wave_index
+
+        item = (self.tick_source(), self._wave, event, data)
+        if self.block_on_full:
+            self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _writer_loop(self) -> None:
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Drain whatever else is waiting so writes happen in chunks
+            while len(batch) < 512:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            for item in batch:
+                if item is _STOP:
+                    running = False
+                    break
+                tick, wave, event, data = item
+                record = [tick, wave, event.name, encode_payload(data)]
+                lines.append(json.dumps(record, separators=(",", ":")))
+
+            if lines:
+                self._write("\n".join(lines) + "\n", len(lines))
+
+        self._close_segment()
+
+    def _write(self, text: str, count: int) -> None:
+        try:
+            if self._file is None or self._segment_bytes >= self.max_segment_bytes:
+                self._open_next_segment()
+            self._file.write(text)
+            self._segment_bytes += len(text)
+            self.records_written += count
+        except OSError as e:
+            self.write_errors += 1
+            print(f"Error writing event trace: {e}")
+
+    def _open_next_segment(self) -> None:
+        self._close_segment()
+
+        path = self.directory / f"{self.prefix}.{self._segment_index:04d}{SEGMENT_SUFFIX}"
+        self._segment_index += 1
+        self._file = open(path, "w", encoding="utf-8")
+        header = json.dumps(["#", TRACE_FORMAT_VERSION, trace_schema()], separators=(",", ":"))
+        self._file.write(header + "\n")
+        self._segment_bytes = len(header) + 1
+        self._segments.append(path)
+
+        if self.max_segments is not None:
+            while len(self._segments) > self.max_segments:
+                oldest = self._segments.pop(0)
+                try:
+                    oldest.unlink()
+                except OSError:
+                    pass
+
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
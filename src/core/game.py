@@ -7,13 +7,23 @@ the main loop, and high-level game state.
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import pygame as pg
 
 from ..config import FPS
-from ..config.settings import GAME_WIDTH, GAME_HEIGHT
+from ..config.settings import (
+    GAME_HEIGHT,
+    GAME_WIDTH,
+    HITCH_BUDGET_MS,
+    MAX_RENDER_SKIP,
+    PROFILER_OUTPUT,
+    PROFILER_SAMPLE_INTERVAL_MS,
+)
 from .event_manager import EventManager
+from .sampling_profiler import SamplingProfiler
 
 if TYPE_CHECKING:
     from ..ui.screens.base_screen import BaseScreen
@@ -29,6 +39,11 @@ class GameContext:
         levels_config: list[dict] | None = None,
         display: pg.Surface | None = None,  # Alias for screen
         scale: float = 1.0,  # Scale factor for mouse coordinate transformation
+        trace_dir: str | None = None,  # Record game events of each level here
+        hitch_report: str | None = None,  # Append slow-frame reports to this file
+        hitch_budget_ms: float = HITCH_BUDGET_MS,  # Frames slower than this are hitches
+        profile_path: str | None = None,  # Collapsed stacks of the sampling profiler
+        profile_interval_ms: float = PROFILER_SAMPLE_INTERVAL_MS,
     ):
         self.display = screen or display
         self.clock = clock or pg.time.Clock()
@@ -36,6 +51,11 @@ class GameContext:
         self.levels_config: list[dict] = levels_config or []
         self.current_level_config: dict | None = None
         self.scale = scale  # Current window scale factor
+        self.trace_dir = trace_dir
+        self.hitch_report = hitch_report
+        self.hitch_budget_ms = hitch_budget_ms
+        # Started by --profile or the P key in a level; writes its output when stopped
+        self.profiler = SamplingProfiler(profile_interval_ms, profile_path or PROFILER_OUTPUT)
         self._mouse_pos: tuple[int, int] = (0, 0)  # Transformed mouse position in game coordinates
 
     @property
@@ -54,6 +74,38 @@ class GameContext:
         return (GAME_WIDTH, GAME_HEIGHT)
 
 
+class RenderPacer:
+    """
+    Decides when a frame may go unrendered.
+
+    A frame is skipped when its update was the expensive part and rendering
+    would push it past the frame budget, e.g. while fast-forwarding. Events
+    are still handled every frame, and at most ``max_skip`` frames in a row
+    are skipped.
+    """
+
+    def __init__(self, fps: int = FPS, max_skip: int = MAX_RENDER_SKIP) -> None:
+        self.frame_budget = 1.0 / fps
+        self.max_skip = max_skip
+        self.render_cost = 0.0  # Smoothed seconds per render
+        self.skipped = 0  # Frames skipped in a row
+        self.total_skipped = 0
+
+    def should_render(self, update_seconds: float) -> bool:
+        """Whether to render a frame whose update took ``update_seconds``."""
+        overrun = update_seconds + self.render_cost > self.frame_budget
+        if overrun and update_seconds >= self.render_cost and self.skipped < self.max_skip:
+            self.skipped += 1
+            self.total_skipped += 1
+            return False
+        self.skipped = 0
+        return True
+
+    def rendered(self, seconds: float) -> None:
+        """Record how long a render took."""
+        self.render_cost += (seconds - self.render_cost) * 0.25
+
+
 class GameEngine:
     """Main game engine managing the game loop and screen stack."""
 
@@ -75,6 +127,7 @@ class GameEngine:
 
         self._running = True
         self._screen_stack: list[BaseScreen] = []
+        self.render_pacer = RenderPacer()
 
     @property
     def current_screen(self) -> BaseScreen | None:
@@ -126,29 +179,63 @@ class GameEngine:
         if self.current_screen:
             self.current_screen.render(surface)
 
-    def run(self) -> None:
+    def run(
+        self,
+        translate_event: Callable[[pg.event.Event], pg.event.Event | None] | None = None,
+        present: Callable[[], None] | None = None,
+        fps: int = FPS,
+    ) -> None:
+        """
+        Run the main loop until quit.
+
+        Frames are paced at ``fps``; screens simulate in fixed ticks of their
+        own (see ``GameWorld.update``) and draw in between them, so the render
+        rate does not change gameplay.
+
+        Args:
+            translate_event: Maps window events to game events; None drops one.
+            present: Shows the rendered frame (default: flip the display).
+            fps: Render rate cap.
+        """
         self._running = True
+        self.render_pacer.frame_budget = 1.0 / fps
 
-        while self._running and self._screen_stack:
+        while self.is_running():
             # Calculate delta time
-            dt = self._clock.tick(FPS) / 1000.0
+            dt = self._clock.tick(fps) / 1000.0
 
             # Process events
             for event in pg.event.get():
                 if event.type == pg.QUIT:
                     self._running = False
-                elif self.current_screen:
-                    self.current_screen.handle_event(event)
-
-            # Update current screen
-            if self.current_screen:
-                self.current_screen.update(dt)
-                self.current_screen.render(self._display)
-
-            pg.display.flip()
+                    continue
+                if translate_event is not None:
+                    translated = translate_event(event)
+                    if translated is None:
+                        continue
+                    event = translated
+                self.handle_event(event)
+
+            # Update current screen, rendering only if the frame has room for it
+            if not self.is_running():
+                break
+            start = time.perf_counter()
+            self.update(dt)
+            if not self.is_running():
+                break
+            rendered = time.perf_counter()
+            if not self.render_pacer.should_render(rendered - start):
+                continue
+            self.render(self._display)
+            if present is not None:
+                present()
+            else:
+                pg.display.flip()
+            self.render_pacer.rendered(time.perf_counter() - rendered)
 
         self.shutdown()
 
     def shutdown(self) -> None:
+        self.context.profiler.stop()
         self.clear_screens()
         pg.quit()
@@ -4,6 +4,7 @@ Game World - Pure game state and logic.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
@@ -11,27 +12,42 @@ from typing import TYPE_CHECKING, Any
 import pygame as pg
 
 from ..config.paths import DATA_DIR
-from ..entities import Enemy, Projectile
+from ..config.settings import MIN_GAME_SPEED, SIM_STEP_MS
+from ..entities import Enemy, Projectile, TargetOrder
 from ..systems import (
     BuildingBlueprint,
     BuildManager,
+    DamageLedger,
+    Explosions,
+    FloatingTextLayer,
+    HitscanSystem,
+    ParticleSystem,
     PlayerAbilities,
     ResourcesManager,
     SpawnController,
+    StatusEffects,
     WaveLoader,
 )
+from ..utils.data_bundle import get_data_bundle
+from ..utils.path_utils import PathTrack
+from ..utils.spatial_grid import SpatialGrid
 from ..utils.waypoint_loader import load_waypoints
 from .event_manager import (
     EnemyKilledEvent,
     EnemyReachedEndEvent,
+    EnemySummonedEvent,
     EventManager,
     GameEvent,
     GameOverEvent,
     WaveCompletedEvent,
 )
+from .event_trace import EventTraceRecorder
+from .instrumentation import Instrumentation
+from .timer_wheel import TimerWheel
 
 if TYPE_CHECKING:
     from ..entities import Factory, Tower
+    from .hitch_detector import HitchDetector
 
 
 class GamePhase(Enum):
@@ -49,6 +65,9 @@ class GameWorldConfig:
 
     level_config: dict[str, Any]
     events: EventManager | None = None
+    deferred_events: bool = True  # Queue events and flush them once per tick
+    trace_dir: str | None = None  # Record all events to this directory
+    max_game_speed: float | None = None  # None leaves the speed uncapped (headless runs)
 
 
 @dataclass
@@ -66,6 +85,8 @@ class GameWorld:
     def __init__(self, config: GameWorldConfig) -> None:
         self.level_config = config.level_config
         self.events = config.events or EventManager()
+        if config.deferred_events:
+            self.events.deferred = True
 
         # Systems
         self.build_manager = BuildManager(events=self.events)
@@ -78,8 +99,31 @@ class GameWorld:
             events=self.events,
         )
 
+        # Game clock; abilities, effects and cooldowns schedule on it
+        self.timers = TimerWheel()
+
+        # Enemy positions for area queries, rebuilt by the systems that need it
+        self.enemy_grid = SpatialGrid(cell_size=64)
+        self.status_effects = StatusEffects(self.timers, self.enemy_grid)
+
+        # All damage is buffered here and applied once per tick
+        self.damage = DamageLedger()
+
+        # Enemies by path progress, sorted once per tick and shared by all towers
+        self.target_order = TargetOrder()
+
+        # Per-wave performance counters
+        self.instrumentation = Instrumentation()
+
+        # Optional per-frame breakdown for slow-frame reports, set by the screen
+        self.hitches: HitchDetector | None = None
+
+        # Short-lived visuals (explosion rings, boss glitches)
+        self.particles = ParticleSystem(self.timers)
+        self.floating_texts = FloatingTextLayer(self.timers)
+
         # Player abilities
-        self.player_abilities = PlayerAbilities()
+        self.player_abilities = PlayerAbilities(self.timers, self.status_effects, self.damage)
         self.abilities_enabled = self.level_config.get("are_abilities_enabled", True)
 
         self._load_level_data()
@@ -87,23 +131,61 @@ class GameWorld:
         # Entities
         self.enemies: list[Enemy] = []
         self.projectiles: list[Projectile] = []
+        self._enemy_snapshot: list[Enemy] = []  # Reused copy to iterate while enemies change
+
+        # Explosions are batched per tick; fast shots resolve as timed hits
+        self.explosions = Explosions(self.enemy_grid, self.damage, self.particles)
+        self.hitscan = HitscanSystem(self.timers, self.damage, self.explosions, self.particles)
+        self.build_manager.hitscan = self.hitscan
 
         # State
         self.phase = GamePhase.BUILD
         self.current_wave: int = 0
         self.game_speed: float = 1.0
+        self.max_game_speed = config.max_game_speed
+        self.tick: int = 0
+
+        # Game time (ms) not yet simulated, and how far the renderer is
+        # between the previous tick and the latest one (0-1)
+        self._accumulator = 0.0
+        self.interpolation = 1.0
+
+        # Optional event trace
+        self.trace_recorder: EventTraceRecorder | None = None
+        if config.trace_dir:
+            self.trace_recorder = EventTraceRecorder(
+                self.events,
+                config.trace_dir,
+                prefix=str(self.level_config.get("id", "level")),
+                tick_source=lambda: self.tick,
+            )
+            self.trace_recorder.start()
 
     def _load_level_data(self) -> None:
-        """Load waypoints and waves."""
-        waypoints_path = DATA_DIR / self.level_config["waypoints_path"]
-        self.waypoints = load_waypoints(str(waypoints_path))
-        self.road_segments = BuildManager.generate_road_segments(self.waypoints)
-
-        waves_path = DATA_DIR / self.level_config["waves_path"]
-        templates_path = DATA_DIR / "enemyTemplates.json"
-        self.waves_data = WaveLoader.load_all_waves(
-            str(waves_path), str(templates_path), self.waypoints
-        )
+        """Load waypoints and waves, preferring the compiled data bundle."""
+        bundle = get_data_bundle()
+        waypoints_file = self.level_config["waypoints_path"]
+        waves_file = self.level_config["waves_path"]
+
+        if waypoints_file in bundle.waypoints:
+            self.waypoints = bundle.waypoints[waypoints_file]
+            self.road_segments = bundle.road_segments[waypoints_file]
+            self.path_tracks: dict[str, PathTrack] = bundle.path_tracks[waypoints_file]
+        else:
+            self.waypoints = load_waypoints(str(DATA_DIR / waypoints_file))
+            self.road_segments = BuildManager.generate_road_segments(self.waypoints)
+            self.path_tracks = {name: PathTrack(points) for name, points in self.waypoints.items()}
+        self.build_manager.path_tracks = self.path_tracks
+        self.target_order.tracks = self.path_tracks
+
+        if waves_file in bundle.waves:
+            self.waves_data = WaveLoader.build_waves(
+                bundle.waves[waves_file], bundle.enemy_prototypes, self.waypoints
+            )
+        else:
+            self.waves_data = WaveLoader.load_all_waves(
+                str(DATA_DIR / waves_file), str(DATA_DIR / "enemyTemplates.json"), self.waypoints
+            )
 
     @property
     def total_waves(self) -> int:
@@ -146,16 +228,19 @@ class GameWorld:
         adjusted = (position[0] - blueprint.width // 2, position[1] - blueprint.height // 2)
 
         if blueprint.name == "Tower Upgrade":
-            return self.build_manager.upgrade_tower(position, blueprint, self.resources)
-
-        if not self.build_manager.can_build_at(
+            built = self.build_manager.upgrade_tower(position, blueprint, self.resources)
+        elif not self.build_manager.can_build_at(
             adjusted, blueprint, self.resources, self.road_segments
         ):
-            return False
+            built = False
+        elif blueprint.build_function:
+            built = blueprint.build_function(adjusted, blueprint, self.resources)
+        else:
+            built = False
 
-        if blueprint.build_function:
-            return blueprint.build_function(adjusted, blueprint, self.resources)
-        return False
+        if built and self.hitches is not None:
+            self.hitches.note("builds")
+        return built
 
     def use_ability(self, ability_name: str, target_pos: tuple[int, int]) -> bool:
         """Use a player ability at target position."""
@@ -167,58 +252,185 @@ class GameWorld:
 
         return self.player_abilities.use(ability_name, self.resources, target_pos, self.enemies)
 
+    def cycle_tower_priority(self, position: tuple[int, int]) -> bool:
+        """Switch the tower at position to its next targeting priority."""
+        tower = self.build_manager.get_tower_at(position)
+        if tower is None:
+            return False
+
+        tower.priority = tower.priority.next()
+        tower.locked_targets = []
+        self.floating_texts.push(f"Target: {tower.priority.value}", tower.pos, (255, 255, 255))
+        return True
+
     def set_game_speed(self, speed: float) -> None:
-        """Set game speed multiplier (0.25 - 4.0)."""
-        self.game_speed = max(0.25, min(4.0, speed))
+        """Set game speed multiplier (at least 0.25, at most ``max_game_speed``)."""
+        if self.max_game_speed is not None:
+            speed = min(self.max_game_speed, speed)
+        self.game_speed = max(MIN_GAME_SPEED, speed)
+
+    def close(self) -> None:
+        """Release background resources (event trace writer)."""
+        if self.trace_recorder is not None:
+            self.events.flush()
+            self.trace_recorder.stop()
+            self.trace_recorder = None
+        self.timers.clear()
+        self.particles.clear()
+        self.floating_texts.clear()
+        self.explosions.clear()
+        self.damage.clear()
 
     # -------------------------------------------------------------------------
     # Update
     # -------------------------------------------------------------------------
 
-    def update(self, dt: float) -> None:
-        """Update all game systems."""
+    def update(self, dt: float, max_steps: int | None = None) -> int:
+        """
+        Advance the world by ``dt`` seconds of real time at the current speed.
+
+        The scaled time is simulated in fixed ticks of ``SIM_STEP_MS``, so
+        gameplay does not depend on the frame rate and high speeds run more
+        ticks rather than longer ones. Time short of a whole tick carries
+        over to the next call and sets ``interpolation`` for drawing. With
+        ``max_steps`` any time beyond that many ticks is dropped.
+        Returns the number of ticks run.
+        """
+        self._accumulator += dt * 1000 * self.game_speed
+        steps = int(self._accumulator / SIM_STEP_MS + 1e-9)
+        if max_steps is not None and steps > max_steps:
+            steps = max_steps
+            self._accumulator = steps * SIM_STEP_MS
+        self._accumulator = max(0.0, self._accumulator - steps * SIM_STEP_MS)
+        self.interpolation = min(1.0, self._accumulator / SIM_STEP_MS)
+
+        for ran in range(steps):
+            if self.is_game_over:
+                return ran
+            self.step(SIM_STEP_MS)
+        return steps
+
+    def step(self, game_dt: float) -> None:
+        """Run one simulation tick covering ``game_dt`` ms of game time."""
         if self.is_game_over:
             return
 
-        game_dt = dt * 1000 * self.game_speed
+        self.tick += 1
+        clock = time.perf_counter
+        started = clock()
 
+        self.particles.update()
+        self.floating_texts.update()
+
+        # Run due ability, effect and cooldown timers (may summon enemies)
+        count_before = len(self.enemies)
+        self.timers.advance(game_dt)
+        if len(self.enemies) > count_before:
+            self._admit_summons(count_before)
+        timers_done = clock()
+
+        self._update_enemies(game_dt)
+        enemies_done = clock()
+
+        # Spawns come after the enemy update: a late spawn is already placed
+        # where it would be at the end of this tick
         if self.phase == GamePhase.WAVE:
+            self.damage.combat_ms += game_dt
+            count_before = len(self.enemies)
             wave_complete = self.spawn_controller.update(game_dt, self.enemies)
+            for enemy in self.enemies[count_before:]:
+                enemy.all_enemies = self.enemies
+                enemy.enter_world(self.timers, self.particles, self.floating_texts)
+            if self.hitches is not None:
+                self.hitches.note("spawns", len(self.enemies) - count_before)
             if wave_complete:
                 self._on_wave_complete()
+        spawns_done = clock()
 
-        self._update_enemies(game_dt)
         self._update_towers(game_dt)
+        towers_done = clock()
         self._update_projectiles(game_dt)
+        projectiles_done = clock()
 
-        if self.abilities_enabled:
-            self.player_abilities.update(game_dt, self.enemies)
+        self.status_effects.update(self.enemies, self.tick)
 
         if self.resources.is_dead():
             self._on_defeat()
 
+        self.events.flush()
+
+        hitches = self.hitches
+        if hitches is not None:
+            hitches.tick()
+            hitches.add_time("timers", timers_done - started)
+            hitches.add_time("enemies", enemies_done - timers_done)
+            hitches.add_time("spawns", spawns_done - enemies_done)
+            hitches.add_time("towers", towers_done - spawns_done)
+            hitches.add_time("projectiles", projectiles_done - towers_done)
+            hitches.add_time("effects_events", clock() - projectiles_done)
+
     def _update_enemies(self, game_dt: float) -> None:
-        for enemy in self.enemies[:]:
+        snapshot = self._enemy_snapshot
+        snapshot[:] = self.enemies
+        for enemy in snapshot:
             enemy.all_enemies = self.enemies
+            count_before = len(self.enemies)
             enemy.update(game_dt)
 
+            # Summoning abilities append new enemies to the shared list
+            if len(self.enemies) > count_before:
+                self._admit_summons(count_before)
+
             if enemy.is_dead():
                 self._on_enemy_killed(enemy)
             elif enemy.has_finished():
                 self._on_enemy_reached_end(enemy)
+        snapshot.clear()
 
     def _update_towers(self, dt: float) -> None:
-        for tower in self.build_manager.towers:
-            tower.update(dt)
-            tower.attack(self.enemies, self.projectiles)
+        self.target_order.rebuild(self.enemies)
+        self.build_manager.update_towers(
+            self.timers.time, self.target_order, self.projectiles, step_ms=dt
+        )
+        self.instrumentation.add("target_scans", self.target_order.full_scans)
+        self.instrumentation.add("target_scans_avoided", self.target_order.scans_avoided)
+        self.instrumentation.add("tower_sleep_ticks", self.target_order.towers_asleep)
 
     def _update_projectiles(self, game_dt: float) -> None:
-        for proj in self.projectiles[:]:
-            proj.update(game_dt, self.enemies)
-            if not proj.active:
+        # Finished projectiles are dropped by compacting the list in place
+        projectiles = self.projectiles
+        kept = 0
+        for proj in projectiles:
+            # Hits are recorded in the damage ledger and applied together below
+            proj.update(game_dt)
+            if proj.active:
+                projectiles[kept] = proj
+                kept += 1
+            else:
+                if proj.exploded:
+                    self.explosions.add(
+                        proj.pos.x,
+                        proj.pos.y,
+                        proj.explosion_radius,
+                        proj.damage,
+                        proj.damage_type,
+                        proj.source,
+                        proj.tower,
+                    )
+                elif proj.hit:
+                    self.damage.record(
+                        proj.target, proj.damage, proj.damage_type, proj.source, proj.tower
+                    )
+                self.damage.shot(proj.source, proj.tower, wasted=not proj.hit)
                 if hasattr(proj, "on_removed"):
                     proj.on_removed()
-                self.projectiles.remove(proj)
+        del projectiles[kept:]
+
+        self.instrumentation.add("explosions", len(self.explosions))
+        if self.hitches is not None:
+            self.hitches.note("explosions", len(self.explosions))
+        self.explosions.resolve(self.enemies, self.tick)
+        self.damage.flush()
 
     # -------------------------------------------------------------------------
     # Event Handlers
@@ -226,24 +438,50 @@ class GameWorld:
 
     def _on_enemy_killed(self, enemy: Enemy) -> None:
         gold_reward = enemy.gold_reward
+        enemy.leave_world()
+        self.status_effects.clear(enemy)
         self.enemies.remove(enemy)
         self.resources.add_resource("gold", gold_reward)
 
-        self.events.emit(
-            GameEvent.ENEMY_KILLED,
-            EnemyKilledEvent(enemy=enemy, gold_reward=gold_reward),
-        )
+        if self.events.has_subscribers(GameEvent.ENEMY_KILLED):
+            self.events.emit(
+                GameEvent.ENEMY_KILLED,
+                EnemyKilledEvent(
+                    enemy=enemy, gold_reward=gold_reward, source=enemy.last_hit_by
+                ),
+            )
 
     def _on_enemy_reached_end(self, enemy: Enemy) -> None:
         damage = enemy.damage
         self.resources.spend_resource("health", damage)
         self.resources.add_resource("gold", enemy.gold_reward)
+        enemy.leave_world()
+        self.status_effects.clear(enemy)
         self.enemies.remove(enemy)
 
-        self.events.emit(
-            GameEvent.ENEMY_REACHED_END,
-            EnemyReachedEndEvent(enemy=enemy, damage=damage),
-        )
+        if self.events.has_subscribers(GameEvent.ENEMY_REACHED_END):
+            self.events.emit(
+                GameEvent.ENEMY_REACHED_END,
+                EnemyReachedEndEvent(enemy=enemy, damage=damage, road=enemy.road),
+            )
+
+    def _admit_summons(self, start: int) -> None:
+        """Start timers for enemies summoned since ``start`` and report them."""
+        summoned = self.enemies[start:]
+        for enemy in summoned:
+            enemy.enter_world(self.timers, self.particles, self.floating_texts)
+            if self.hitches is not None:
+                self.hitches.note(f"summons:{enemy.summoned_by or 'unknown'}")
+
+        if not self.events.has_subscribers(GameEvent.ENEMY_SUMMONED):
+            return
+        for enemy in summoned:
+            self.events.emit(
+                GameEvent.ENEMY_SUMMONED,
+                EnemySummonedEvent(
+                    enemy=enemy, summoner=enemy.summoner, ability=enemy.summoned_by or "unknown"
+                ),
+            )
 
     def _on_wave_complete(self) -> None:
         wave_data = self.waves_data[self.current_wave]
@@ -258,6 +496,7 @@ class GameWorld:
         self.resources.add_resource("wood", rewards.wood)
         self.resources.add_resource("metal", rewards.metal)
         self.build_manager.give_factory_payouts(self.resources)
+        self.instrumentation.end_wave(self.current_wave)
 
         self.events.emit(
             GameEvent.WAVE_COMPLETED,
@@ -0,0 +1,107 @@
+"""
+Garbage collector pause management.
+
+Entities reference each other (enemies share ``all_enemies``, projectiles
+hold their targets, events hold entities), so the cyclic collector keeps
+finding work during waves, and a full (generation 2) collection over
+everything loaded for the level is long enough to stutter.
+
+- After a level loads, everything alive is moved out of the collector's
+  reach with ``gc.freeze`` (templates, blueprints, path tracks, surfaces,
+  pre-built wave enemies). Frozen objects are still freed by reference
+  counting, they are just never scanned.
+- During waves full collections are deferred by raising the generation 2
+  threshold; the deferred collection runs when the wave ends.
+- Every collection is timed through ``gc.callbacks``.
+
+Usage:
+    gc_manager = GCManager(world.instrumentation)
+    gc_manager.level_loaded()
+    ...
+    gc_manager.wave_started()
+    gc_manager.wave_ended()
+    ...
+    gc_manager.close()
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from typing import TYPE_CHECKING, Any
+
+from ..config.settings import GC_WAVE_GEN2_THRESHOLD
+
+if TYPE_CHECKING:
+    from .instrumentation import Instrumentation
+
+
+class GCManager:
+    """
+    Collector policy for one level, plus pause timing.
+
+    Args:
+        instrumentation: Receives ``gc_collections`` and ``gc_pause_us``
+            counters for collections during waves (optional).
+    """
+
+    def __init__(self, instrumentation: Instrumentation | None = None) -> None:
+        self.instrumentation = instrumentation
+        self.collections = [0, 0, 0]  # Per generation
+        self.last_pause_ms = 0.0
+        self.max_pause_ms = 0.0
+        self.wave_pause_ms = 0.0  # Pause time in the current (or last) wave
+        self.frozen = 0  # Objects moved to the permanent generation
+
+        self._thresholds = gc.get_threshold()
+        self._started_at = 0.0
+        self._deferring = False
+        gc.callbacks.append(self._on_gc)
+
+    def level_loaded(self) -> None:
+        """Collect once, then freeze everything alive so it is never scanned again."""
+        gc.collect()
+        gc.freeze()
+        self.frozen = gc.get_freeze_count()
+
+    def wave_started(self) -> None:
+        """Defer full collections until the wave ends."""
+        self.wave_pause_ms = 0.0
+        if not self._deferring:
+            self._thresholds = gc.get_threshold()
+            gen0, gen1, _ = self._thresholds
+            gc.set_threshold(gen0, gen1, GC_WAVE_GEN2_THRESHOLD)
+            self._deferring = True
+
+    def wave_ended(self) -> None:
+        """Restore the thresholds and run the deferred full collection."""
+        if self._deferring:
+            gc.set_threshold(*self._thresholds)
+            self._deferring = False
+            gc.collect()
+
+    def close(self) -> None:
+        """Restore the collector's defaults for whatever runs next."""
+        if self._deferring:
+            gc.set_threshold(*self._thresholds)
+            self._deferring = False
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        gc.unfreeze()
+        self.frozen = 0
+
+    def _on_gc(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._started_at = time.perf_counter()
+            return
+
+        pause_ms = (time.perf_counter() - self._started_at) * 1000
+        self.collections[info["generation"]] += 1
+        self.last_pause_ms = pause_ms
+        self.max_pause_ms = max(self.max_pause_ms, pause_ms)
+        if not self._deferring:
+            return
+        self.wave_pause_ms += pause_ms
+        if self.instrumentation is not None:
+            self.instrumentation.add("gc_collections")
+            self.instrumentation.add("gc_pause_us", int(pause_ms * 1000))
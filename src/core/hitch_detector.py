@@ -0,0 +1,205 @@
+"""
+Frame hitch detector.
+
+Keeps a ring buffer of the most recent frames: how long each took, the
+time spent per subsystem, what happened in it (spawns, summons,
+explosions, builds, saves, ...) and the entity counts at its end. A frame
+over the budget is reported with that breakdown, plus the times of the
+frames before it, so a stutter can be attributed without a profiler.
+
+Reports are kept in memory (``hitches``) and, with a report path, appended
+to that file as one JSON line each. The game thread only queues a report;
+a background thread, started with the first hitch, encodes and writes it.
+
+Usage:
+    detector = HitchDetector(budget_ms=50, report_path="hitches.jsonl")
+    world.hitches = detector
+    ...
+    detector.begin_frame()
+    world.update(dt)
+    detector.add_time("update", ...)
+    detector.note("level_config_saves")
+    detector.end_frame({"enemies": len(world.enemies)})
+    ...
+    detector.close()  # Writes the queued reports
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..config.settings import (
+    HITCH_BUDGET_MS,
+    HITCH_HISTORY_FRAMES,
+    HITCH_REPORT_CONTEXT,
+    HITCH_REPORTS_KEPT,
+)
+
+# Sentinel telling the writer thread to finish
+_STOP = object()
+
+
+@dataclass(slots=True)
+class FrameRecord:
+    """Timing and activity of one frame; records are reused by the ring buffer."""
+
+    frame: int = -1
+    total_ms: float = 0.0
+    ticks: int = 0  # Simulation ticks run in the frame
+    sections: dict[str, float] = field(default_factory=dict)  # Ms per subsystem
+    events: dict[str, int] = field(default_factory=dict)  # What happened, by kind
+    counts: dict[str, int] = field(default_factory=dict)  # Entities at the end
+
+    def reset(self, frame: int) -> None:
+        self.frame = frame
+        self.total_ms = 0.0
+        self.ticks = 0
+        self.sections.clear()
+        self.events.clear()
+        self.counts.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "frame": self.frame,
+            "total_ms": round(self.total_ms, 3),
+            "ticks": self.ticks,
+            "sections": {name: round(ms, 3) for name, ms in self.sections.items()},
+            "events": dict(self.events),
+            "counts": dict(self.counts),
+        }
+
+
+class HitchDetector:
+    """
+    Ring buffer of frame records that reports frames over ``budget_ms``.
+
+    Args:
+        budget_ms: Frames slower than this are hitches.
+        history: Number of recent frames kept.
+        report_path: File that hitch reports are appended to (optional).
+    """
+
+    def __init__(
+        self,
+        budget_ms: float = HITCH_BUDGET_MS,
+        history: int = HITCH_HISTORY_FRAMES,
+        report_path: str | Path | None = None,
+    ) -> None:
+        self.budget_ms = budget_ms
+        self.report_path = Path(report_path) if report_path else None
+        self.hitches: deque[dict[str, Any]] = deque(maxlen=HITCH_REPORTS_KEPT)
+        self.hitch_count = 0
+        self.frame = 0
+
+        self._records = [FrameRecord() for _ in range(max(1, history))]
+        self._current: FrameRecord | None = None
+        self._started_at = 0.0
+
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._writer: threading.Thread | None = None
+
+    def begin_frame(self) -> None:
+        """Start a new frame, closing the previous one if it was not ended."""
+        if self._current is not None:
+            self.end_frame()
+        record = self._records[self.frame % len(self._records)]
+        record.reset(self.frame)
+        self._current = record
+        self._started_at = time.perf_counter()
+
+    def add_time(self, section: str, seconds: float) -> None:
+        """Add ``seconds`` spent in ``section`` to the current frame."""
+        record = self._current
+        if record is not None:
+            record.sections[section] = record.sections.get(section, 0.0) + seconds * 1000
+
+    def note(self, kind: str, count: int = 1) -> None:
+        """Count ``count`` occurrences of ``kind`` (e.g. "spawns") in the current frame."""
+        record = self._current
+        if record is not None and count:
+            record.events[kind] = record.events.get(kind, 0) + count
+
+    def tick(self) -> None:
+        """Count a simulation tick in the current frame."""
+        if self._current is not None:
+            self._current.ticks += 1
+
+    def end_frame(self, counts: dict[str, int] | None = None) -> FrameRecord | None:
+        """Close the current frame; reports it if it went over the budget."""
+        record = self._current
+        if record is None:
+            return None
+        record.total_ms = (time.perf_counter() - self._started_at) * 1000
+        if counts:
+            record.counts.update(counts)
+        self._current = None
+        self.frame += 1
+
+        if record.total_ms > self.budget_ms:
+            self._report(record)
+        return record
+
+    def recent(self) -> list[FrameRecord]:
+        """Completed frames still in the buffer, oldest first."""
+        size = len(self._records)
+        first = max(0, self.frame - size)
+        return [self._records[i % size] for i in range(first, self.frame)]
+
+    def _report(self, record: FrameRecord) -> None:
+        report = record.to_dict()
+        report["budget_ms"] = self.budget_ms
+        previous = self.recent()[-HITCH_REPORT_CONTEXT - 1 : -1]
+        report["previous_ms"] = [round(frame.total_ms, 3) for frame in previous]
+
+        self.hitch_count += 1
+        self.hitches.append(report)
+        if self.report_path is not None:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    args=(self.report_path,),
+                    name="hitch-reports",
+                    daemon=True,
+                )
+                self._writer.start()
+            self._queue.put(report)
+
+    def close(self) -> None:
+        """Write the queued reports and stop the writer thread."""
+        if self._writer is None:
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._writer = None
+
+    def _writer_loop(self, path: Path) -> None:
+        """Append queued reports to ``path``, keeping the file open between hitches."""
+        try:
+            f = open(path, "a")
+        except OSError as e:
+            print(f"Warning: Could not write hitch report: {e}")
+            f = None
+        try:
+            while True:
+                report = self._queue.get()
+                if report is _STOP:
+                    break
+                if f is None:
+                    continue
+                try:
+                    f.write(json.dumps(report) + "\n")
+                    f.flush()
+                except OSError as e:
+                    print(f"Warning: Could not write hitch report: {e}")
+                    f.close()
+                    f = None
+        finally:
+            if f is not None:
+                f.close()
@@ -0,0 +1,44 @@
+"""
+Per-wave performance counters.
+
+Systems add to named counters while a wave runs; when the wave completes
+the totals are stored as one record and the counters start again from
+zero.
+
+Usage:
+    instrumentation.add("target_scans", 3)
+    ...
+    record = instrumentation.end_wave(wave_index)
+    print(instrumentation.report())
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+
+class Instrumentation:
+    """Named counters, totalled per wave."""
+
+    def __init__(self) -> None:
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self.waves: list[dict[str, int]] = []  # One record per completed wave
+
+    def add(self, name: str, amount: int = 1) -> None:
+        if amount:
+            self.counters[name] += amount
+
+    def end_wave(self, wave_index: int) -> dict[str, int]:
+        """Store the current counters as the record for ``wave_index`` and reset them."""
+        record = {"wave": wave_index, **self.counters}
+        self.waves.append(record)
+        self.counters.clear()
+        return record
+
+    def report(self) -> str:
+        """One line per completed wave, e.g. ``wave 0: target_scans=120 ...``."""
+        lines = []
+        for record in self.waves:
+            fields = " ".join(f"{name}={value}" for name, value in record.items() if name != "wave")
+            lines.append(f"wave {record['wave']}: {fields}")
+        return "\n".join(lines)
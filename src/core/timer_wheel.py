@@ -0,0 +1,189 @@
+"""
+Hierarchical timer wheel.
+
+Schedules callbacks against the game clock (milliseconds of game time).
+Timers are bucketed by expiry tick across a few wheel levels, each level
+covering ``slots`` times the span of the level below. Advancing the clock
+only visits the current slot of the finest level and, whenever a level
+wraps, re-buckets one slot of the next level, so the per-tick cost depends
+on the timers that are due, not on how many are pending.
+
+Timers fire no earlier than their deadline and at most one resolution step
+late. Timers due in the same step fire in scheduling order.
+
+Usage:
+    timers = TimerWheel()
+    handle = timers.schedule(3000, ability.on_cooldown, enemy)
+    timers.advance(dt_ms)   # once per tick
+    handle.cancel()         # e.g. when the enemy is removed
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from typing import Any
+
+
+class TimerHandle:
+    """A scheduled callback; cancel it to stop it from firing."""
+
+    __slots__ = ("deadline", "callback", "args", "expiry_tick", "cancelled", "_wheel")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        deadline: float,
+        expiry_tick: int,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.expiry_tick = expiry_tick
+        self.cancelled = False
+        self._wheel: TimerWheel | None = wheel
+
+    @property
+    def pending(self) -> bool:
+        return self._wheel is not None
+
+    def cancel(self) -> None:
+        """Cancel the timer. Safe to call more than once or after it fired."""
+        if self._wheel is not None:
+            self.cancelled = True
+            self._wheel._pending -= 1
+            self._wheel = None
+            self.args = ()
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel keyed on game time in milliseconds.
+
+    Args:
+        resolution_ms: Length of one wheel tick.
+        slot_bits: Each level has ``2 ** slot_bits`` slots.
+        levels: Number of levels; later deadlines wait in an overflow list.
+    """
+
+    def __init__(self, resolution_ms: float = 5.0, slot_bits: int = 6, levels: int = 4) -> None:
+        self.resolution_ms = resolution_ms
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels: list[list[list[TimerHandle]]] = [
+            [[] for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._overflow: list[TimerHandle] = []
+
+        self.time: float = 0.0  # Current game time (ms)
+        self._tick: int = 0  # Last processed wheel tick
+        self._pending: int = 0
+        self.fired: int = 0  # Total callbacks run
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def schedule(self, delay_ms: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """Run ``callback(*args)`` once ``delay_ms`` of game time has passed."""
+        return self.schedule_at(self.time + max(0.0, delay_ms), callback, *args)
+
+    def schedule_at(self, deadline: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """Run ``callback(*args)`` once the game clock reaches ``deadline``."""
+        expiry_tick = max(self._tick, math.ceil(deadline / self.resolution_ms))
+        handle = TimerHandle(self, deadline, expiry_tick, callback, args)
+        self._pending += 1
+        self._insert(handle)
+        return handle
+
+    def advance(self, dt_ms: float) -> int:
+        """Move the clock forward and run every timer that became due."""
+        self.time += dt_ms
+        target_tick = math.floor(self.time / self.resolution_ms)
+        fired = 0
+
+        # Run timers that were scheduled for the current tick after it was processed
+        fired += self._fire_slot(self._tick)
+
+        while self._tick < target_tick:
+            if not self._pending:
+                # Nothing scheduled; cancelled handles left in buckets are
+                # dropped whenever their bucket is visited, so just jump
+                self._tick = target_tick
+                break
+            self._tick += 1
+            self._cascade()
+            fired += self._fire_slot(self._tick)
+
+        self.fired += fired
+        return fired
+
+    def clear(self) -> None:
+        """Cancel every pending timer."""
+        for level in self._levels:
+            for bucket in level:
+                for handle in bucket:
+                    handle.cancel()
+                bucket.clear()
+        for handle in self._overflow:
+            handle.cancel()
+        self._overflow.clear()
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _insert(self, handle: TimerHandle) -> None:
+        expiry = handle.expiry_tick
+        current = self._tick
+        bits = self._bits
+        # Lowest level at which expiry and now share every coarser slot index
+        for level in range(len(self._levels)):
+            shift = bits * (level + 1)
+            if expiry >> shift == current >> shift:
+                self._levels[level][(expiry >> (bits * level)) & self._mask].append(handle)
+                return
+        self._overflow.append(handle)
+
+    def _cascade(self) -> None:
+        """Re-bucket coarser slots whose span starts at the current tick."""
+        tick = self._tick
+        bits = self._bits
+        if tick & self._mask:
+            return
+
+        levels = len(self._levels)
+        if tick & ((1 << (bits * levels)) - 1) == 0 and self._overflow:
+            overflow, self._overflow = self._overflow, []
+            for handle in overflow:
+                if not handle.cancelled:
+                    self._insert(handle)
+
+        for level in range(levels - 1, 0, -1):
+            if tick & ((1 << (bits * level)) - 1):
+                continue
+            index = (tick >> (bits * level)) & self._mask
+            bucket = self._levels[level][index]
+            if bucket:
+                self._levels[level][index] = []
+                for handle in bucket:
+                    if not handle.cancelled:
+                        self._insert(handle)
+
+    def _fire_slot(self, tick: int) -> int:
+        slots = self._levels[0]
+        index = tick & self._mask
+        fired = 0
+        # Callbacks may schedule timers due in this same tick; keep draining
+        while slots[index]:
+            bucket = slots[index]
+            slots[index] = []
+            for handle in bucket:
+                if handle.cancelled:
+                    continue
+                handle._wheel = None
+                self._pending -= 1
+                fired += 1
+                handle.callback(*handle.args)
+        return fired
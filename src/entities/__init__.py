@@ -2,8 +2,10 @@
 
 from .base_entity import BaseEntity
 from .enemy import Enemy
+from .enemy_prototype import EnemyPrototype
 from .factory import Factory
 from .projectile import Projectile
+from .targeting import TargetOrder, TargetPriority
 from .tower import Tower, TowerStats, create_tower, load_tower_presets
 
 __all__ = [
@@ -13,6 +15,9 @@ __all__ = [
     "create_tower",
     "load_tower_presets",
     "Enemy",
+    "EnemyPrototype",
     "Projectile",
     "Factory",
+    "TargetOrder",
+    "TargetPriority",
 ]
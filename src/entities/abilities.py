@@ -4,54 +4,114 @@ Enemy abilities system.
 
 from __future__ import annotations
 
-import json
 import random
 from math import inf
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol
 
 import pygame as pg
 
 from ..config.settings import GAME_HEIGHT, GAME_WIDTH
-from ..config.paths import DATA_DIR
 
 if TYPE_CHECKING:
+    from ..core.timer_wheel import TimerHandle, TimerWheel
+    from ..systems.particle_system import ParticleSystem
     from .enemy import Enemy
+    from .enemy_prototype import EnemyPrototype
 
 
-# Lazy-loaded enemy templates cache
-_loaded_enemy_templates: dict | None = None
+class EnemyStats(Protocol):
+    """The stats abilities modify when an enemy prototype is compiled."""
 
+    health: float
+    max_health: float
+    speed: float
+    armor: int
+    magic_resistance: float
+    attack_range: float
+    is_invisible: bool
 
-def _get_enemy_templates() -> dict:
-    """Load and cache enemy templates."""
-    global _loaded_enemy_templates
 
-    if _loaded_enemy_templates is None:
-        file_path = DATA_DIR / "enemyTemplates.json"
-        try:
-            with open(file_path) as f:
-                _loaded_enemy_templates = json.load(f)
-        except FileNotFoundError:
-            print(f"ERROR: Could not find enemyTemplates.json at {file_path}")
-            _loaded_enemy_templates = {}
-        except json.JSONDecodeError:
-            print(f"ERROR: Could not decode enemyTemplates.json at {file_path}")
-            _loaded_enemy_templates = {}
+def _get_enemy_prototypes() -> dict[str, EnemyPrototype]:
+    """Compiled enemy prototypes from the shared data bundle."""
+    from ..utils.data_bundle import get_data_bundle
 
-    return _loaded_enemy_templates
+    return get_data_bundle().enemy_prototypes
 
 
 class EnemyAbility:
     """Base class for enemy abilities."""
 
     name: str = ""
+    key: str = ""  # Registry key this instance was created from (e.g. "summoner1")
+    # Stateful abilities get one instance per enemy; others only modify stats once
+    stateful: bool = False
+    # Polled abilities get on_update every tick; the rest run from timers
+    polled: bool = False
 
-    def apply(self, enemy: Enemy) -> None:
-        pass
+    def apply(self, enemy: EnemyStats) -> None:
+        """Modify the stats of the prototype being compiled."""
+
+    def bind(self, enemy: Enemy) -> None:
+        """Set up a stateful ability's own copy for a newly created enemy."""
+
+    def attach(
+        self, enemy: Enemy, timers: TimerWheel, particles: ParticleSystem | None = None
+    ) -> None:
+        """Start the ability's timers once the enemy enters the world."""
+
+    def detach(self) -> None:
+        """Cancel pending timers when the enemy leaves the world."""
 
     def on_update(self, enemy: Enemy, dt: float) -> None:
-        if getattr(enemy, "disabled_abilities", {}).get("active", False):
-            return
+        pass
+
+
+class TimedAbility(EnemyAbility):
+    """
+    A stateful ability driven by a single timer on the world's timer wheel.
+
+    Subclasses implement ``on_timer`` and return the delay (ms) until the
+    next call, or None to stop. While the enemy is silenced the timer is
+    pushed back to the end of the silence.
+    """
+
+    stateful = True
+    silenceable: bool = True
+
+    def __init__(self) -> None:
+        self._timers: TimerWheel | None = None
+        self._timer: TimerHandle | None = None
+
+    def first_delay_ms(self) -> float | None:
+        return None
+
+    def on_timer(self, enemy: Enemy) -> float | None:
+        return None
+
+    def attach(
+        self, enemy: Enemy, timers: TimerWheel, particles: ParticleSystem | None = None
+    ) -> None:
+        self._timers = timers
+        self._schedule(enemy, self.first_delay_ms())
+
+    def detach(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule(self, enemy: Enemy, delay_ms: float | None) -> None:
+        self.detach()
+        if delay_ms is not None and self._timers is not None:
+            self._timer = self._timers.schedule(delay_ms, self._fire, enemy)
+
+    def _fire(self, enemy: Enemy) -> None:
+        self._timer = None
+        if self.silenceable and self._timers is not None:
+            remaining = enemy.silenced_until - self._timers.time
+            if remaining > 0:
+                self._schedule(enemy, remaining)
+                return
+        self._schedule(enemy, self.on_timer(enemy))
 
 
 class FastAbility(EnemyAbility):
@@ -59,7 +119,7 @@ class FastAbility(EnemyAbility):
 
     name = "fast"
 
-    def apply(self, enemy: Enemy) -> None:
+    def apply(self, enemy: EnemyStats) -> None:
         enemy.speed += 1
 
 
@@ -68,7 +128,7 @@ class MagicResistantAbility(EnemyAbility):
 
     name = "magic_resistant"
 
-    def apply(self, enemy: Enemy) -> None:
+    def apply(self, enemy: EnemyStats) -> None:
         enemy.magic_resistance = inf
 
 
@@ -77,7 +137,7 @@ class RangedAbility(EnemyAbility):
 
     name = "ranged"
 
-    def apply(self, enemy: Enemy) -> None:
+    def apply(self, enemy: EnemyStats) -> None:
         enemy.attack_range += 50
 
 
@@ -86,34 +146,32 @@ class TankAbility(EnemyAbility):
 
     name = "tank"
 
-    def apply(self, enemy: Enemy) -> None:
+    def apply(self, enemy: EnemyStats) -> None:
         enemy.armor += 4
         enemy.max_health *= 2
         enemy.health *= 2
         enemy.speed -= 0.5
 
 
-class HealerAbility(EnemyAbility):
+class HealerAbility(TimedAbility):
     """Periodically heals nearby injured allies."""
 
     name = "healer"
 
     def __init__(self, heal_amount: int, range: int = 150, cooldown: float = 3.0):
+        super().__init__()
         self.heal_amount = heal_amount
         self.range = range
         self.cooldown = cooldown
-        self.timer = 0.0
-
-    def on_update(self, enemy: Enemy, dt: float) -> None:
-        if getattr(enemy, "disabled_abilities", {}).get("active", False):
-            return
 
-        self.timer += dt / 1000.0
-        if self.timer < self.cooldown:
-            return
+    def first_delay_ms(self) -> float | None:
+        return self.cooldown * 1000
 
-        self.timer = 0.0
+    def on_timer(self, enemy: Enemy) -> float | None:
+        self._heal(enemy)
+        return self.cooldown * 1000
 
+    def _heal(self, enemy: Enemy) -> None:
         if not hasattr(enemy, "pos") or not hasattr(enemy, "all_enemies"):
             return
 
@@ -134,46 +192,35 @@ class HealerAbility(EnemyAbility):
         target = min(nearby, key=lambda e: e.health / e.max_health)
         target.health = min(target.max_health, target.health + self.heal_amount)
 
-        if hasattr(target, "special_texts"):
-            target.special_texts.append(
-                {
-                    "text": f"+{self.heal_amount}",
-                    "pos": target.pos.copy(),
-                    "lifetime": 1.0,
-                    "color": (0, 255, 0),
-                }
-            )
+        target.show_text(f"+{self.heal_amount}", (0, 255, 0))
 
 
-class SummonerAbility(EnemyAbility):
+class SummonerAbility(TimedAbility):
     """Periodically summons additional enemies."""
 
     name = "summoner"
 
     def __init__(self, summon_count: int, summon_type_id: str, cooldown: float = 5.0):
+        super().__init__()
         self.summon_count = summon_count
         self.summon_type_id = str(summon_type_id)
         self.cooldown = cooldown
-        self.timer = 0.0
 
-    def on_update(self, enemy: Enemy, dt: float) -> None:
-        if getattr(enemy, "disabled_abilities", {}).get("active", False):
-            return
+    def first_delay_ms(self) -> float | None:
+        return self.cooldown * 1000
 
-        from .enemy import Enemy as EnemyClass
+    def on_timer(self, enemy: Enemy) -> float | None:
+        self._summon(enemy)
+        return self.cooldown * 1000
 
-        self.timer += dt / 1000.0
-        if self.timer < self.cooldown:
-            return
-
-        self.timer = 0.0
+    def _summon(self, enemy: Enemy) -> None:
+        from .enemy import Enemy as EnemyClass
 
         if not hasattr(enemy, "all_enemies"):
             return
 
-        templates = _get_enemy_templates()
-        template = templates.get(self.summon_type_id)
-        if not template:
+        prototype = _get_enemy_prototypes().get(self.summon_type_id)
+        if prototype is None:
             print(f"Warning: Summoner could not find template ID {self.summon_type_id}")
             return
 
@@ -195,13 +242,14 @@ class SummonerAbility(EnemyAbility):
                 resume_path = []
 
             path = loop + [pg.Vector2(p) for p in resume_path]
-            new_enemy = EnemyClass(path, template)
+            new_enemy = EnemyClass(path, prototype)
+            new_enemy.continue_road(enemy, len(loop))
+            new_enemy.summoned_by = self.key or self.name
+            new_enemy.summoner = enemy
             new_enemy.all_enemies = enemy.all_enemies
             enemy.all_enemies.append(new_enemy)
 
-        enemy.special_texts.append(
-            {"text": "Summon!", "pos": enemy.pos.copy(), "lifetime": 1.0, "color": (150, 150, 255)}
-        )
+        enemy.show_text("Summon!", (150, 150, 255))
 
 
 class InvisibleAbility(EnemyAbility):
@@ -209,11 +257,11 @@ class InvisibleAbility(EnemyAbility):
 
     name = "invisible"
 
-    def apply(self, enemy: Enemy) -> None:
+    def apply(self, enemy: EnemyStats) -> None:
         enemy.is_invisible = True
 
 
-class DashAbility(EnemyAbility):
+class DashAbility(TimedAbility):
     """Periodically dashes forward at high speed."""
 
     name = "dash"
@@ -221,66 +269,70 @@ class DashAbility(EnemyAbility):
     def __init__(
         self, speed_multiplier: float = 2.0, dash_duration: float = 1.0, cooldown: float = 5.0
     ):
+        super().__init__()
         self.speed_multiplier = speed_multiplier
         self.dash_duration = dash_duration
         self.cooldown = cooldown
-        self.timer = 0.0
         self.dashing = False
-        self.dash_timer = 0.0
         self.original_speed = 1.0
 
-    def apply(self, enemy: Enemy) -> None:
+    def bind(self, enemy: Enemy) -> None:
         self.original_speed = enemy.speed
 
-    def on_update(self, enemy: Enemy, dt: float) -> None:
-        if getattr(enemy, "disabled_abilities", {}).get("active", False):
-            return
-
-        dt_sec = dt / 1000.0
-        self.timer += dt_sec
+    def first_delay_ms(self) -> float | None:
+        return self.cooldown * 1000
 
+    def on_timer(self, enemy: Enemy) -> float | None:
         if self.dashing:
-            self.dash_timer += dt_sec
-            if self.dash_timer >= self.dash_duration:
-                enemy.speed = self.original_speed
-                self.dashing = False
-                self.dash_timer = 0.0
-        elif self.timer >= self.cooldown:
-            self.original_speed = enemy.speed
-            enemy.speed *= self.speed_multiplier
-            self.dashing = True
-            self.dash_timer = 0.0
-            self.timer = 0.0
-
-            if hasattr(enemy, "special_texts"):
-                enemy.special_texts.append(
-                    {
-                        "text": "DASH!",
-                        "pos": enemy.pos.copy(),
-                        "lifetime": 0.7,
-                        "color": (255, 200, 50),
-                    }
-                )
+            # Dash over; the cooldown counts from the start of the dash
+            enemy.speed = self.original_speed
+            self.dashing = False
+            return max(0.0, self.cooldown - self.dash_duration) * 1000
+
+        self.original_speed = enemy.speed
+        enemy.speed *= self.speed_multiplier
+        self.dashing = True
+
+        enemy.show_text("DASH!", (255, 200, 50), lifetime=0.7)
+        return self.dash_duration * 1000
 
 
 class BossAbility(EnemyAbility):
     """Boss behavior with phases, teleportation, and glitch effects."""
 
     name = "boss"
+    stateful = True
+    polled = True  # Stage changes follow health every tick
+
+    GLITCH_INTERVAL_MS: float = 150.0
+    GLITCH_LIFETIME_MS: float = 300.0
+    GLITCH_COLORS: tuple[tuple[int, int, int], ...] = ((255, 0, 255), (0, 255, 255), (150, 0, 255))
 
     def __init__(self) -> None:
         self.stage = 1
-        self.phase_timer = 0.0
         self.phase_cooldown = 5.0
-        self.glitch_spawn_timer = 0.0
-        self.active_glitches: list[dict] = []
+        self._particles: ParticleSystem | None = None
+        self._timers: TimerWheel | None = None
+        self._phase_timer: TimerHandle | None = None
+        self._glitch_timer: TimerHandle | None = None
 
-    def apply(self, enemy: Enemy) -> None:
+    def apply(self, enemy: EnemyStats) -> None:
         enemy.is_invisible = True
 
-    def on_update(self, enemy: Enemy, dt: float) -> None:
-        dt_sec = dt / 1000.0
+    def attach(
+        self, enemy: Enemy, timers: TimerWheel, particles: ParticleSystem | None = None
+    ) -> None:
+        self._timers = timers
+        self._particles = particles
+
+    def detach(self) -> None:
+        for handle in (self._phase_timer, self._glitch_timer):
+            if handle is not None:
+                handle.cancel()
+        self._phase_timer = None
+        self._glitch_timer = None
 
+    def on_update(self, enemy: Enemy, dt: float) -> None:
         # Phase transitions based on health
         if enemy.health < enemy.max_health * 0.8 and self.stage == 1:
             enemy.is_invisible = False
@@ -289,52 +341,51 @@ class BossAbility(EnemyAbility):
         if enemy.health < enemy.max_health * 0.6:
             self.stage = 20
 
-        if self.stage > 1:
-            self._update_phase(enemy, dt_sec)
-
-            # Spawn glitch effects
-            self.glitch_spawn_timer += dt_sec
-            if self.glitch_spawn_timer >= 0.15:
-                self.glitch_spawn_timer = 0
-                self._spawn_glitches()
+        # Phases and glitches start with the second stage
+        if self.stage > 1 and self._phase_timer is None and self._timers is not None:
+            self._phase_timer = self._timers.schedule(
+                self.phase_cooldown * 1000, self._on_phase, enemy
+            )
+            self._glitch_timer = self._timers.schedule(self.GLITCH_INTERVAL_MS, self._on_glitch)
 
-        # Update glitch lifetimes
-        for glitch in self.active_glitches[:]:
-            glitch["time"] -= dt_sec
-            if glitch["time"] <= 0:
-                self.active_glitches.remove(glitch)
+    def _on_phase(self, enemy: Enemy) -> None:
+        self.phase_cooldown = random.randint(1, 3)
 
-    def _update_phase(self, enemy: Enemy, dt: float) -> None:
-        self.phase_timer += dt
+        # Teleport back and summon
+        if enemy.curr_waypoint > 0:
+            enemy.curr_waypoint -= 1
+            enemy.pos = pg.Vector2(enemy.waypoints[enemy.curr_waypoint])
+            self._summon_nearby(enemy, count=7)
 
-        if self.phase_timer >= self.phase_cooldown:
-            self.phase_timer = 0
-            self.phase_cooldown = random.randint(1, 3)
+        if self._timers is not None:
+            self._phase_timer = self._timers.schedule(
+                self.phase_cooldown * 1000, self._on_phase, enemy
+            )
 
-            # Teleport back and summon
-            if enemy.curr_waypoint > 0:
-                enemy.curr_waypoint -= 1
-                enemy.pos = pg.Vector2(enemy.waypoints[enemy.curr_waypoint])
-                self._summon_nearby(enemy, count=7)
+    def _on_glitch(self) -> None:
+        self._spawn_glitches()
+        if self._timers is not None:
+            self._glitch_timer = self._timers.schedule(self.GLITCH_INTERVAL_MS, self._on_glitch)
 
     def _spawn_glitches(self) -> None:
+        """Scatter a burst of glitch squares over the screen."""
+        from ..systems.particle_system import ParticleKind
+
         for _ in range(self.stage * 3):
-            glitch = {
-                "pos": pg.Vector2(
-                    random.randint(0, GAME_WIDTH), random.randint(0, GAME_HEIGHT)
-                ),
-                "size": random.randint(10, 40),
-                "color": random.choice([(255, 0, 255), (0, 255, 255), (150, 0, 255)]),
-                "time": 0.3,
-            }
-            self.active_glitches.append(glitch)
+            x = random.randint(0, GAME_WIDTH)
+            y = random.randint(0, GAME_HEIGHT)
+            size = random.randint(10, 40)
+            color = random.choice(self.GLITCH_COLORS)
+            if self._particles is not None:
+                self._particles.emit(
+                    ParticleKind.SQUARE, x, y, size, color, self.GLITCH_LIFETIME_MS
+                )
 
     def _summon_nearby(self, enemy: Enemy, count: int = 7, radius: int = 40) -> None:
         from .enemy import Enemy as EnemyClass
 
-        templates = _get_enemy_templates()
-        template = templates.get("1")
-        if not template:
+        prototype = _get_enemy_prototypes().get("1")
+        if prototype is None:
             return
 
         for _ in range(count):
@@ -353,18 +404,14 @@ class BossAbility(EnemyAbility):
                 resume_path = []
 
             path = loop + [pg.Vector2(p) for p in resume_path]
-            new_enemy = EnemyClass(path, template)
+            new_enemy = EnemyClass(path, prototype)
+            new_enemy.continue_road(enemy, len(loop))
+            new_enemy.summoned_by = self.key or self.name
+            new_enemy.summoner = enemy
             new_enemy.all_enemies = enemy.all_enemies
             enemy.all_enemies.append(new_enemy)
 
-        enemy.special_texts.append(
-            {
-                "text": "PHASE SUMMON",
-                "pos": enemy.pos.copy(),
-                "lifetime": 1.0,
-                "color": (200, 100, 255),
-            }
-        )
+        enemy.show_text("PHASE SUMMON", (200, 100, 255))
 
 
 class Abilities:
@@ -390,19 +437,27 @@ class Abilities:
                 "dash": DashAbility(4.0, 1.0, 3.0),
                 "boss": BossAbility(),
             }
+            for key, ability in cls.ABILITY_REGISTRY.items():
+                ability.key = key
+
+    __slots__ = ("abilities",)
 
     def __init__(self) -> None:
         self._init_registry()
         self.abilities: list[EnemyAbility] = []
-        self.abilities_dict = self.ABILITY_REGISTRY
+
+    @property
+    def abilities_dict(self) -> dict[str, EnemyAbility]:
+        return self.ABILITY_REGISTRY
 
     def add_ability(self, ability_name: str) -> None:
         if ability_name in self.abilities_dict:
             # Create a new instance for abilities with state
             ability = self.abilities_dict[ability_name]
-            if isinstance(ability, (HealerAbility, SummonerAbility, DashAbility, BossAbility)):
+            if ability.stateful:
                 # Clone stateful abilities by creating new instance
                 ability = self._create_ability_instance(ability_name)
+                ability.key = ability_name
             self.abilities.append(ability)
 
     def _create_ability_instance(self, name: str) -> EnemyAbility:
@@ -437,13 +492,26 @@ class Abilities:
     def remove_ability(self, name: str) -> None:
         self.abilities = [a for a in self.abilities if getattr(a, "name", "") != name]
 
-    def apply_all(self, enemy: Enemy) -> None:
+    def apply_all(self, stats: EnemyStats) -> None:
         for ability in self.abilities:
-            ability.apply(enemy)
+            ability.apply(stats)
 
     def update_all(self, enemy: Enemy, dt: float) -> None:
         for ability in self.abilities:
-            ability.on_update(enemy, dt)
+            if ability.polled:
+                ability.on_update(enemy, dt)
+
+    def attach_all(
+        self, enemy: Enemy, timers: TimerWheel, particles: ParticleSystem | None = None
+    ) -> None:
+        for ability in self.abilities:
+            if ability.stateful:
+                ability.attach(enemy, timers, particles)
+
+    def detach_all(self) -> None:
+        for ability in self.abilities:
+            if ability.stateful:
+                ability.detach()
 
     def get_ability(self, ability_key: str) -> EnemyAbility | None:
         for ability in self.abilities:
@@ -2,16 +2,24 @@
 Base entity class for all game objects.
 """
 
+import itertools
 from abc import ABC, abstractmethod
 
 import pygame as pg
 
+# Process-wide source of entity handles (stable ids for traces and stats)
+_entity_handles = itertools.count(1)
+
 
 class BaseEntity(ABC):
     """Abstract base class for all game entities."""
 
+    __slots__ = ("_pos", "_prev", "handle")
+
     def __init__(self, pos: tuple[int, int]) -> None:
         self._pos = pg.Vector2(pos)
+        self._prev = pg.Vector2(self._pos)  # Position before the latest tick
+        self.handle: int = next(_entity_handles)
 
     @property
     def pos(self) -> pg.Vector2:
@@ -19,7 +27,9 @@ class BaseEntity(ABC):
 
     @pos.setter
     def pos(self, value: tuple[int, int] | pg.Vector2) -> None:
+        # A placed entity jumps there instead of being drawn sliding across
         self._pos = pg.Vector2(value)
+        self._prev.update(self._pos)
 
     @property
     def x(self) -> float:
@@ -29,6 +39,16 @@ class BaseEntity(ABC):
     def y(self) -> float:
         return self._pos.y
 
+    def remember_position(self) -> None:
+        """Keep the current position as the start of the coming tick's movement."""
+        self._prev.update(self._pos)
+
+    def draw_pos(self, alpha: float) -> tuple[float, float]:
+        """Position ``alpha`` (0-1) of the way from the previous tick to the current one."""
+        prev, pos = self._prev, self._pos
+        px, py = prev.x, prev.y
+        return px + (pos.x - px) * alpha, py + (pos.y - py) * alpha
+
     @abstractmethod
     def update(self, dt: float) -> None:
         pass
@@ -46,6 +66,8 @@ class BaseEntity(ABC):
 class DummyEntity(BaseEntity):
     """A placeholder entity for testing or as a target."""
 
+    __slots__ = ("health", "max_health", "_healthbar_length", "_healthbar_height")
+
     def __init__(self, pos: tuple[int, int], health: int = 1000) -> None:
         super().__init__(pos)
         self.health = health
@@ -13,19 +13,102 @@ import pygame as pg
 
 from ..config.settings import GAME_WIDTH
 from .base_entity import BaseEntity
+from .enemy_prototype import EnemyPrototype
 
 if TYPE_CHECKING:
+    from ..core.timer_wheel import TimerWheel
+    from ..systems.floating_text import FloatingTextLayer
+    from ..systems.particle_system import ParticleSystem
+    from ..utils.path_utils import PathTrack
     from .abilities import EnemyAbility
 
-# Global font cache
-_enemy_font: pg.font.Font | None = None
+# Pre-rendered enemy shapes keyed by (color, radius, shape, invisible)
+_shape_cache: dict[tuple[tuple[int, int, int], int, str, bool], pg.Surface] = {}
+
+
+def _get_shape_surface(
+    color: tuple[int, int, int], radius: int, shape: str, invisible: bool
+) -> pg.Surface:
+    """Get the pre-rendered surface for an enemy look, rendering it on first use."""
+    key = (color, radius, shape, invisible)
+    surface = _shape_cache.get(key)
+    if surface is None:
+        surface = _shape_cache[key] = _render_shape(color, radius, shape, invisible)
+    return surface
+
+
+def _render_shape(
+    color: tuple[int, int, int], radius: int, shape: str, invisible: bool
+) -> pg.Surface:
+    """Render an enemy shape onto a transparent surface."""
+    r, g, b = color
+    draw_alpha = 60 if invisible else 255
+
+    size = radius * 2
+    surface = pg.Surface((size, size), pg.SRCALPHA)
+
+    center = radius
+
+    if shape == "circle":
+        pg.draw.circle(surface, (r, g, b, draw_alpha), (center, center), radius)
+    elif shape == "square":
+        pg.draw.rect(surface, (r, g, b, draw_alpha), (0, 0, size, size))
+    elif shape == "triangle":
+        points: list[tuple[float, float]] = [(center, 0), (0, size), (size, size)]
+        pg.draw.polygon(surface, (r, g, b, draw_alpha), points)
+    elif shape == "hexagon":
+        points = []
+        for i in range(6):
+            angle_rad = i * math.pi / 3
+            x = center + radius * math.cos(angle_rad)
+            y = center + radius * math.sin(angle_rad)
+            points.append((x, y))
+        pg.draw.polygon(surface, (r, g, b, draw_alpha), points)
+    elif shape == "glitch_hex":
+        direction = pg.Vector2(radius, 0)
+        points = [
+            (center + d.x, center + d.y) for d in [direction.rotate(i * 60) for i in range(6)]
+        ]
+        pg.draw.polygon(surface, (r, g, b, draw_alpha), points, width=2)
+
+    return surface
 
 
 class Enemy(BaseEntity):
     """An enemy that moves along waypoints toward the player's base."""
 
+    # Constant per-type data (id, color, shape, ...) is read from the shared prototype
+    __slots__ = (
+        "prototype",
+        "waypoints",
+        "curr_waypoint",
+        "road",
+        "road_base",
+        "road_start",
+        "speed",
+        "health",
+        "max_health",
+        "armor",
+        "magic_resistance",
+        "is_invisible",
+        "incoming_damage",
+        "slow_factor",
+        "silenced_until",
+        "revealed",
+        "last_hit_by",
+        "summoned_by",
+        "summoner",
+        "order_tick",
+        "texts",
+        "abilities",
+        "all_enemies",
+        "_pre_rendered_shape",
+    )
+
     def __init__(
-        self, waypoints: list[tuple[int, int]] | list[pg.Vector2], template: dict[str, Any]
+        self,
+        waypoints: list[tuple[int, int]] | list[pg.Vector2],
+        template: EnemyPrototype | dict[str, Any],
     ) -> None:
         # Convert Vector2s to tuples if needed
         converted_waypoints: list[tuple[int, int]] = [
@@ -33,142 +116,196 @@ class Enemy(BaseEntity):
         ]
         super().__init__(converted_waypoints[0] if converted_waypoints else (0, 0))
 
-        self.id = int(template.get("id", 1))
+        # Raw template dicts are still accepted (tools, tests), but compiling
+        # them here is the slow path; spawners pass shared prototypes.
+        if isinstance(template, EnemyPrototype):
+            prototype = template
+        else:
+            prototype = EnemyPrototype.from_template(template)
+        self.prototype = prototype
+
         self.waypoints = waypoints
         self.curr_waypoint = 0
+        self.road: str | None = None  # Name of the road this enemy follows
 
-        # Stats
-        self.speed = template.get("speed", 1.0)
-        self.health = template.get("health", 300)
-        self.max_health = self.health
-        self.armor = template.get("armor", 1)
-        self.magic_resistance = template.get("magic_resistance", 1)
+        # Waypoint i follows road segment i + road_base, from waypoint road_start on
+        self.road_base = 0
+        self.road_start = 0
 
-        # Combat
-        self.attack_range = template.get("attack_range", 50)
-        self.attack_speed = template.get("attack_speed", 1.0)
-        self.attack_cooldown = 0
-        self.damage_multiplier = 1
-        self.damage = template.get("damage", 10)
-        self.gold_reward = template.get("gold_reward", 5)
+        # Stats (ability modifiers already applied by the prototype)
+        self.speed = prototype.speed
+        self.health = prototype.health
+        self.max_health = self.health
+        self.armor = prototype.armor
+        self.magic_resistance = prototype.magic_resistance
 
         # Ability state
-        self.is_invisible = False
+        self.is_invisible = prototype.is_invisible
         self.incoming_damage = 0
-        self.disabled_abilities = {"active": False, "timer": 0.0, "expires_in": 0.0}
-        self.was_glued = False  # For player glue ability
+
+        # Combined status effects, maintained by the world's StatusEffects
+        self.slow_factor: float = 1.0
+        self.silenced_until: float = 0.0  # Game time (ms)
+        self.revealed: bool = False
+
+        # Attribution (for events and statistics)
+        self.last_hit_by: str | None = None  # Source of the most recent damage
+        self.summoned_by: str | None = None  # Ability key if created by a summon
+        self.summoner: Enemy | None = None  # Enemy that summoned this one
+
+        # Last TargetOrder rebuild that included this enemy (see TargetOrder.contains)
+        self.order_tick: int = -1
 
         # Visual
-        self.color = tuple(template.get("color", [255, 255, 255]))
-        self.radius = template.get("radius", 10)
-        self.shape = template.get("shape", "circle")
-        self.special_texts: list[dict] = []
+        self.texts: FloatingTextLayer | None = None  # World text layer, set by enter_world
 
-        # Abilities
+        # Abilities: shared instances for stat modifiers, fresh ones for stateful abilities
         from .abilities import Abilities
 
         self.abilities = Abilities()
-        for ability_name in template.get("abilities", []):
+        for ability_name in prototype.ability_names:
             self.abilities.add_ability(ability_name)
-        self.abilities.apply_all(self)
+        for ability in self.abilities.abilities:
+            if ability.stateful:
+                ability.bind(self)
 
         # Reference to all enemies (set by spawner)
         self.all_enemies: list[Enemy] = []
-        self.enemies_ref: list[Enemy] = []  # Alias
-
-        # Pre-render shape for efficiency
-        self._pre_rendered_shape: pg.Surface | None = None
-        self._render_shape()
-
-    def _render_shape(self) -> None:
-        """Pre-render the enemy shape for efficient drawing."""
-        r, g, b = self.color
-        draw_alpha = 60 if self.is_invisible else 255
-
-        size = self.radius * 2
-        self._pre_rendered_shape = pg.Surface((size, size), pg.SRCALPHA)
-
-        center = self.radius
-
-        if self.shape == "circle":
-            pg.draw.circle(
-                self._pre_rendered_shape, (r, g, b, draw_alpha), (center, center), self.radius
-            )
-        elif self.shape == "square":
-            pg.draw.rect(self._pre_rendered_shape, (r, g, b, draw_alpha), (0, 0, size, size))
-        elif self.shape == "triangle":
-            points = [(center, 0), (0, size), (size, size)]
-            pg.draw.polygon(self._pre_rendered_shape, (r, g, b, draw_alpha), points)
-        elif self.shape == "hexagon":
-            points = []
-            for i in range(6):
-                angle_rad = i * math.pi / 3
-                x = center + self.radius * math.cos(angle_rad)
-                y = center + self.radius * math.sin(angle_rad)
-                points.append((x, y))
-            pg.draw.polygon(self._pre_rendered_shape, (r, g, b, draw_alpha), points)
-        elif self.shape == "glitch_hex":
-            direction = pg.Vector2(self.radius, 0)
-            points = [
-                (center + d.x, center + d.y) for d in [direction.rotate(i * 60) for i in range(6)]
-            ]
-            pg.draw.polygon(self._pre_rendered_shape, (r, g, b, draw_alpha), points, width=2)
+
+        # Pre-rendered shape, shared by all enemies that look the same
+        self._pre_rendered_shape: pg.Surface | None = _get_shape_surface(
+            prototype.color, prototype.radius, prototype.shape, self.is_invisible
+        )
+
+    @property
+    def id(self) -> int:
+        return self.prototype.id
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        return self.prototype.color
+
+    @property
+    def radius(self) -> int:
+        return self.prototype.radius
+
+    @property
+    def shape(self) -> str:
+        return self.prototype.shape
+
+    @property
+    def damage(self) -> int:
+        return self.prototype.damage
+
+    @property
+    def gold_reward(self) -> int:
+        return self.prototype.gold_reward
+
+    @property
+    def attack_range(self) -> float:
+        return self.prototype.attack_range
+
+    @property
+    def attack_speed(self) -> float:
+        return self.prototype.attack_speed
 
     def update(self, dt: float) -> None:
         """Update enemy position and state (dt in milliseconds)."""
-        # Move toward next waypoint
-        if self.curr_waypoint + 1 < len(self.waypoints):
-            next_target = pg.Vector2(self.waypoints[self.curr_waypoint + 1])
-            direction = next_target - self._pos
-            if direction.length_squared() > 0:
-                direction = direction.normalize()
-
-            move_distance = self.speed * (dt / 20.0)  # Legacy timing
-            self._pos += direction * move_distance
-
-            if self._pos.distance_to(next_target) < move_distance:
-                self._pos = next_target
-                self.curr_waypoint += 1
-
-        # Update abilities
-        if self.abilities:
-            self.abilities.update_all(self, dt)
-
-        # Update floating texts
-        for ft in self.special_texts[:]:
-            ft["lifetime"] -= dt / 1000.0
-            ft["pos"].y -= 0.2
-            if ft["lifetime"] <= 0:
-                self.special_texts.remove(ft)
-
-        # Update ability disable timer
-        if self.disabled_abilities["active"]:
-            self.disabled_abilities["timer"] += dt
-            if self.disabled_abilities["timer"] >= self.disabled_abilities["expires_in"] * 1000:
-                self.disabled_abilities["active"] = False
-                self.disabled_abilities["timer"] = 0.0
-
-    def draw(self, surface: pg.Surface) -> None:
-        global _enemy_font
+        self.remember_position()
+
+        # Move toward next waypoint (in place, no temporary vectors)
+        next_index = self.curr_waypoint + 1
+        if next_index < len(self.waypoints):
+            pos = self._pos
+            target = self.waypoints[next_index]
+            tx, ty = target[0], target[1]
+            dx, dy = tx - pos.x, ty - pos.y
+            distance = math.hypot(dx, dy)
+
+            move_distance = self.speed * self.slow_factor * (dt / 20.0)  # Legacy timing
+            if distance <= move_distance or distance - move_distance < move_distance:
+                # Reached this step, or closer than one more step after it: snap
+                pos.update(tx, ty)
+                self.curr_waypoint = next_index
+            else:
+                scale = move_distance / distance
+                pos.update(pos.x + dx * scale, pos.y + dy * scale)
+
+        # Polled abilities (timer-driven ones fire from the world's timer wheel)
+        self.abilities.update_all(self, dt)
+
+    def move_speed(self) -> float:
+        """Current walking speed in pixels per millisecond."""
+        return self.speed * self.slow_factor / 20.0
+
+    def velocity(self) -> tuple[float, float]:
+        """Current movement (px/ms) toward the next waypoint; zero at the end."""
+        if self.curr_waypoint + 1 >= len(self.waypoints):
+            return 0.0, 0.0
+        target = self.waypoints[self.curr_waypoint + 1]
+        dx = target[0] - self._pos.x
+        dy = target[1] - self._pos.y
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return 0.0, 0.0
+        speed = self.move_speed()
+        return dx / length * speed, dy / length * speed
+
+    def advance(self, distance: float) -> None:
+        """Walk ``distance`` pixels further along the waypoints at once (late spawns)."""
+        waypoints = self.waypoints
+        x, y = self._pos.x, self._pos.y
+        while distance > 0 and self.curr_waypoint + 1 < len(waypoints):
+            nx, ny = waypoints[self.curr_waypoint + 1][0], waypoints[self.curr_waypoint + 1][1]
+            segment = math.hypot(nx - x, ny - y)
+            if distance < segment:
+                t = distance / segment
+                x, y = x + (nx - x) * t, y + (ny - y) * t
+                break
+            distance -= segment
+            x, y = nx, ny
+            self.curr_waypoint += 1
+        self._pos.update(x, y)
+
+    def position_ahead(self, distance: float) -> tuple[float, float]:
+        """Where the enemy will be after walking ``distance`` further along its waypoints."""
+        waypoints = self.waypoints
+        x, y = self._pos.x, self._pos.y
+        for i in range(self.curr_waypoint + 1, len(waypoints)):
+            nx, ny = waypoints[i][0], waypoints[i][1]
+            segment = math.hypot(nx - x, ny - y)
+            if distance <= segment:
+                t = distance / segment if segment > 0 else 0.0
+                return x + (nx - x) * t, y + (ny - y) * t
+            distance -= segment
+            x, y = nx, ny
+        return x, y
+
+    def enter_world(
+        self,
+        timers: TimerWheel,
+        particles: ParticleSystem | None = None,
+        texts: FloatingTextLayer | None = None,
+    ) -> None:
+        """Start ability timers and connect world visuals; called on spawn or summon."""
+        self.texts = texts
+        self.abilities.attach_all(self, timers, particles)
+
+    def leave_world(self) -> None:
+        """Cancel ability timers; called when the enemy dies or reaches the end."""
+        self.abilities.detach_all()
 
+    def show_text(self, text: str, color: tuple[int, int, int], lifetime: float = 1.0) -> None:
+        """Show floating text at the enemy's position (no-op outside a world)."""
+        if self.texts is not None:
+            self.texts.push(text, self._pos, color, lifetime)
+
+    def draw(self, surface: pg.Surface, alpha: float = 1.0) -> None:
+        """Draw the enemy ``alpha`` of the way through its latest tick's movement."""
         # Draw shape
         if self._pre_rendered_shape:
-            surface.blit(
-                self._pre_rendered_shape, (self._pos.x - self.radius, self._pos.y - self.radius)
-            )
-
-        # Initialize font
-        if _enemy_font is None:
-            if not pg.font.get_init():
-                pg.font.init()
-            _enemy_font = pg.font.Font(None, 24)
-
-        # Draw floating texts
-        for ft in self.special_texts:
-            alpha = int(255 * (ft["lifetime"] / 1.0))
-            text_surface = _enemy_font.render(ft["text"], True, ft["color"])
-            text_surface.set_alpha(alpha)
-            surface.blit(text_surface, (ft["pos"].x - text_surface.get_width() // 2, ft["pos"].y - 20))
+            x, y = self.draw_pos(alpha)
+            surface.blit(self._pre_rendered_shape, (x - self.radius, y - self.radius))
 
         # Draw boss health bar if applicable
         if self.has_ability_type("boss"):
@@ -194,15 +331,27 @@ class Enemy(BaseEntity):
         text.set_alpha(200)
         surface.blit(text, (bar_x, bar_y + 3))
 
-    def take_damage(self, amount: int, damage_type: str = "physical") -> None:
-        """Apply damage after armor/magic resistance."""
+    def take_damage(
+        self, amount: int, damage_type: str = "physical", source: str | None = None
+    ) -> None:
+        """Apply damage after armor/magic resistance. Source names the attacker."""
+        self.apply_damage(self.mitigate(amount, damage_type), source)
+
+    def mitigate(self, amount: int, damage_type: str = "physical") -> int:
+        """Damage left after armor or magic resistance."""
         if damage_type == "magic":
-            amount -= self.magic_resistance
+            if amount <= self.magic_resistance:  # Also covers infinite resistance
+                return 0
+            amount -= int(self.magic_resistance)
         elif damage_type == "physical":
             amount -= self.armor
+        return max(0, amount)
 
-        amount = max(0, amount)
+    def apply_damage(self, amount: int, source: str | None = None) -> None:
+        """Apply damage that has already been mitigated."""
         self.health -= amount
+        if source is not None and amount > 0:
+            self.last_hit_by = source
 
         if self.health < 0:
             self.health = 0
@@ -213,14 +362,34 @@ class Enemy(BaseEntity):
     def has_finished(self) -> bool:
         return bool(self.curr_waypoint >= len(self.waypoints) - 1)
 
+    def continue_road(self, summoner: Enemy, lead_in: int) -> None:
+        """
+        Follow the summoner's road after ``lead_in`` extra waypoints.
+
+        Summons start with a short loop and then resume the summoner's
+        remaining waypoints; the loop itself is not on the road.
+        """
+        self.road = summoner.road
+        shift = summoner.curr_waypoint + 1 - lead_in
+        self.road_base = summoner.road_base + shift
+        self.road_start = max(lead_in - 1, summoner.road_start - shift)
+
+    def road_progress(self, track: PathTrack) -> float:
+        """Arc length along the road's center line, or -1 while off the road."""
+        if self.curr_waypoint < self.road_start:
+            return -1.0
+        return track.project(self.curr_waypoint + self.road_base, self._pos.x, self._pos.y)
+
     def distance_to_end(self) -> float:
+        """Remaining path length from the current position."""
+        waypoints = self.waypoints
+        x, y = self._pos.x, self._pos.y
         total_distance = 0.0
-        current = self._pos
 
-        for i in range(self.curr_waypoint + 1, len(self.waypoints)):
-            next_wp = pg.Vector2(self.waypoints[i])
-            total_distance += current.distance_to(next_wp)
-            current = next_wp
+        for i in range(self.curr_waypoint + 1, len(waypoints)):
+            nx, ny = waypoints[i][0], waypoints[i][1]
+            total_distance += math.hypot(nx - x, ny - y)
+            x, y = nx, ny
 
         return total_distance
 
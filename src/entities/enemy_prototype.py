@@ -0,0 +1,85 @@
+"""
+Compiled enemy prototypes.
+
+Enemy templates are parsed once into immutable prototypes. Stat changes
+from abilities (tank, fast, magic_resistant, ranged, invisible, ...) are
+already folded into the prototype, so creating an enemy only copies fields
+and instantiates the abilities that keep per-enemy state.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from ..utils.interning import intern_color, intern_str
+
+
+@dataclass(frozen=True, slots=True)
+class EnemyPrototype:
+    """Immutable enemy stats with ability stat modifiers applied."""
+
+    id: int
+    health: float
+    speed: float
+    armor: int
+    magic_resistance: float  # Infinite for magic_resistant enemies
+    attack_range: float
+    attack_speed: float
+    damage: int
+    gold_reward: int
+    color: tuple[int, int, int]
+    radius: int
+    shape: str
+    is_invisible: bool
+    ability_names: tuple[str, ...]
+
+    @classmethod
+    def from_template(cls, template: dict[str, Any], template_id: Any = 1) -> EnemyPrototype:
+        """Compile a template dictionary (as stored in enemyTemplates.json)."""
+        from .abilities import Abilities
+
+        # Run every ability's apply() once against plain stats
+        stats = SimpleNamespace(
+            health=template.get("health", 300),
+            speed=template.get("speed", 1.0),
+            armor=template.get("armor", 1),
+            magic_resistance=template.get("magic_resistance", 1),
+            attack_range=template.get("attack_range", 50),
+            is_invisible=False,
+        )
+        stats.max_health = stats.health
+
+        abilities = Abilities()
+        for name in template.get("abilities", []):
+            abilities.add_ability(name)
+        abilities.apply_all(stats)
+
+        return cls(
+            id=int(template.get("id", template_id)),
+            health=stats.health,
+            speed=stats.speed,
+            armor=stats.armor,
+            magic_resistance=stats.magic_resistance,
+            attack_range=stats.attack_range,
+            attack_speed=template.get("attack_speed", 1.0),
+            damage=template.get("damage", 10),
+            gold_reward=template.get("gold_reward", 5),
+            color=intern_color(template.get("color", [255, 255, 255])),
+            radius=template.get("radius", 10),
+            shape=intern_str(template.get("shape", "circle")),
+            is_invisible=stats.is_invisible,
+            ability_names=tuple(a.key for a in abilities.abilities),
+        )
+
+
+def compile_enemy_prototypes(templates: dict[str, dict[str, Any]]) -> dict[str, EnemyPrototype]:
+    """Compile all templates, keyed like the templates file."""
+    prototypes = {}
+    for key, template in templates.items():
+        try:
+            prototypes[key] = EnemyPrototype.from_template(template, template_id=key)
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Skipping enemy template '{key}': {e}")
+    return prototypes
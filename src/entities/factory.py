@@ -16,6 +16,8 @@ class Factory(BaseEntity):
     Produces a set amount of a specific resource at the end of each wave.
     """
 
+    __slots__ = ("resource_type", "production_rate", "image", "_width", "_height")
+
     def __init__(
         self,
         pos: tuple[int, int],
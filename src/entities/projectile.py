@@ -4,19 +4,76 @@ Projectile entity.
 
 from __future__ import annotations
 
+import math
 import random
 from typing import TYPE_CHECKING
 
 import pygame as pg
 
+from ..utils.interning import intern_color
 from .base_entity import BaseEntity
 
 if TYPE_CHECKING:
     from .enemy import Enemy
+    from .tower import Tower
+
+
+def contact_time(
+    ax: float, ay: float, vx: float, vy: float, speed: float, horizon: float
+) -> float | None:
+    """
+    Earliest time in [0, horizon] at which a shot can reach a moving target.
+
+    The target starts at offset (ax, ay) from the shot and moves with
+    velocity (vx, vy); the shot travels ``speed`` in any direction. Returns
+    None if they cannot meet within ``horizon``.
+    """
+    c = ax * ax + ay * ay
+    if c == 0:
+        return 0.0
+
+    # |A + V t| <= speed * t  <=>  a t^2 + 2 b t + c <= 0
+    a = vx * vx + vy * vy - speed * speed
+    b = ax * vx + ay * vy
+    if a == 0:
+        t = -c / (2 * b) if b < 0 else -1.0
+    else:
+        disc = b * b - a * c
+        if disc < 0:
+            return None
+        t = (-b - math.sqrt(disc)) / a
+    return t if 0 <= t <= horizon else None
 
 
 class Projectile(BaseEntity):
-    """A projectile that tracks and damages enemies. Can be explosive."""
+    """
+    A projectile that tracks an enemy. Can be explosive.
+
+    It only flies and marks a ``hit`` (and ``exploded``); the world records
+    the damage of finished projectiles in its damage ledger.
+    """
+
+    __slots__ = (
+        "target",
+        "damage",
+        "damage_type",
+        "speed",
+        "explosive",
+        "explosion_radius",
+        "shape",
+        "size",
+        "source",
+        "tower",
+        "active",
+        "hit",
+        "exploded",
+        "spawn_delay",
+        "color",
+    )
+
+    # Explosion ring shown by the world's particle system
+    EXPLOSION_DURATION: float = 0.3  # Seconds
+    EXPLOSION_COLOR: tuple[int, int, int] = (255, 100, 0)
 
     def __init__(
         self,
@@ -31,6 +88,8 @@ class Projectile(BaseEntity):
         color1: tuple[int, int, int] | None = (255, 255, 0),
         color2: tuple[int, int, int] | None = None,
         size: int = 5,
+        source: str | None = None,
+        tower: Tower | None = None,
     ) -> None:
         # Convert Vector2 to tuple if needed
         if isinstance(pos, pg.Vector2):
@@ -45,13 +104,18 @@ class Projectile(BaseEntity):
         self.explosion_radius = explosion_radius
         self.shape = shape
         self.size = size
+        self.source = source  # Tower preset that fired this projectile
+        self.tower = tower
 
-        # Active state
+        # Active state; ``hit`` tells a hit apart from a target lost in flight
         self.active = True
+        self.hit = False
 
-        # Explosion effect state
-        self.explosion_timer = 0.0
-        self.explosion_duration = 0.3
+        # Time (ms) into its first step at which the projectile was fired
+        self.spawn_delay = 0.0
+
+        # Set when an explosive projectile hits; the world shows the explosion ring
+        self.exploded = False
 
         # Determine color
         if color2 and color1:
@@ -59,7 +123,7 @@ class Projectile(BaseEntity):
             r = random.randint(min(color1[0], color2[0]), max(color1[0], color2[0]))
             g = random.randint(min(color1[1], color2[1]), max(color1[1], color2[1]))
             b = random.randint(min(color1[2], color2[2]), max(color1[2], color2[2]))
-            self.color = (r, g, b)
+            self.color = intern_color((r, g, b))
         else:
             self.color = color1 or (255, 255, 0)
 
@@ -67,82 +131,65 @@ class Projectile(BaseEntity):
         if self.target and hasattr(self.target, "remove_incoming_damage"):
             self.target.remove_incoming_damage(self.damage)
 
-    def _apply_damage(self, enemies: list[Enemy] | None = None) -> None:
-        """Apply damage to target or area if explosive."""
-        self._pos = pg.Vector2(self.target.pos)
-
-        if self.explosive and enemies is not None:
-            # Area damage
-            for enemy in enemies:
-                distance = self._pos.distance_to(enemy.pos)
-                if distance <= self.explosion_radius:
-                    # Damage falloff based on distance
-                    damage_factor = max(0.5, 1 - (distance / self.explosion_radius) * 0.5)
-                    enemy.take_damage(
-                        int(self.damage * damage_factor), damage_type=self.damage_type
-                    )
-        else:
-            # Single target damage
-            self.target.take_damage(self.damage, damage_type=self.damage_type)
-
+    def _hit(self) -> None:
+        """Mark the hit (and explosion); the world records the damage in its damage ledger."""
+        self._pos.update(self.target.pos)
         self.active = False
+        self.hit = True
+        self.exploded = self.explosive
 
-        if self.explosive:
-            self.explosion_timer = self.explosion_duration
-
-    def update(self, dt: float, enemies: list[Enemy] | None = None) -> None:
+    def update(self, dt: float) -> None:
         """Update projectile position and check for hit. dt in ms."""
-        # Handle explosion effect timer
         if not self.active:
-            if self.explosive and self.explosion_timer > 0:
-                self.explosion_timer -= dt / 1000.0
             return
+        self.remember_position()
 
-        # Check if target is dead
-        if self.target.is_dead():
+        # Check if target is dead or has left at the end of its path
+        if self.target.is_dead() or self.target.has_finished():
             self.active = False
             return
 
-        # Move toward target
-        direction = self.target.pos - self._pos
-        distance = direction.length()
+        # Fired partway through this step: only travel for the rest of it
+        if self.spawn_delay:
+            dt -= self.spawn_delay
+            self.spawn_delay = 0.0
+            if dt <= 0:
+                return
+
+        # Swept test over the whole step (the target has already moved), so
+        # long steps cannot carry the target past the projectile unnoticed
+        target_pos = self.target.pos
+        vx, vy = self.target.velocity()
+        ax = target_pos.x - vx * dt - self._pos.x
+        ay = target_pos.y - vy * dt - self._pos.y
+        if contact_time(ax, ay, vx, vy, self.speed, dt) is not None:
+            self._hit()
+            return
 
-        move_distance = self.speed * dt
+        # Move toward target
+        pos = self._pos
+        dx, dy = target_pos.x - pos.x, target_pos.y - pos.y
+        distance = math.hypot(dx, dy)
+        if distance > 0:
+            scale = self.speed * dt / distance
+            pos.update(pos.x + dx * scale, pos.y + dy * scale)
+
+    def draw(self, surface: pg.Surface, alpha: float = 1.0) -> None:
+        """Draw the projectile ``alpha`` of the way through its latest tick's movement."""
+        if not self.active:
+            return
 
-        if distance < move_distance:
-            # Hit target
-            self._apply_damage(enemies)
-        else:
-            # Move toward target
-            direction = direction.normalize()
-            self._pos += direction * move_distance
-
-    def draw(self, surface: pg.Surface) -> None:
-        """Draw the projectile or explosion effect."""
-        if self.active:
-            # Draw projectile
-            if self.shape == "circle":
-                pg.draw.circle(surface, self.color, (int(self._pos.x), int(self._pos.y)), self.size)
-            elif self.shape == "square":
-                rect = pg.Rect(
-                    self._pos.x - self.size // 2, self._pos.y - self.size // 2, self.size, self.size
-                )
-                pg.draw.rect(surface, self.color, rect)
-            elif self.shape == "triangle":
-                half = self.size // 2
-                points = [
-                    (self._pos.x, self._pos.y - half),
-                    (self._pos.x - half, self._pos.y + half),
-                    (self._pos.x + half, self._pos.y + half),
-                ]
-                pg.draw.polygon(surface, self.color, points)
-
-        elif self.explosive and self.explosion_timer > 0:
-            # Draw explosion ring
-            pg.draw.circle(
-                surface,
-                (255, 100, 0),
-                (int(self._pos.x), int(self._pos.y)),
-                self.explosion_radius,
-                2,
-            )
+        x, y = self.draw_pos(alpha)
+        if self.shape == "circle":
+            pg.draw.circle(surface, self.color, (int(x), int(y)), self.size)
+        elif self.shape == "square":
+            rect = pg.Rect(x - self.size // 2, y - self.size // 2, self.size, self.size)
+            pg.draw.rect(surface, self.color, rect)
+        elif self.shape == "triangle":
+            half = self.size // 2
+            points = [
+                (x, y - half),
+                (x - half, y + half),
+                (x + half, y + half),
+            ]
+            pg.draw.polygon(surface, self.color, points)
@@ -0,0 +1,191 @@
+"""
+Shared enemy orderings for tower targeting.
+
+The world sorts enemies by path progress once per tick; towers filter
+that order instead of sorting their own candidates. Orderings for the
+other priorities are derived from it on first use within a tick.
+
+Towers also keep (lock) their targets between re-evaluations; the order
+counts how many full scans towers made this tick and how many a lock
+saved, and tells whether a locked enemy is still in the world.
+
+When road tracks are known, enemies are also indexed by their progress
+along each road. A tower with precomputed path coverage then only looks
+at enemies inside its covered intervals, and sleeps while there are none.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..utils.path_utils import PathTrack
+    from .enemy import Enemy
+
+# Road name -> sorted arc-length intervals covered by a tower
+Coverage = dict[str, tuple[tuple[float, float], ...]]
+
+
+class TargetPriority(Enum):
+    """Which enemies a tower prefers."""
+
+    FIRST = "first"  # Furthest along the path
+    LAST = "last"  # Least far along the path
+    STRONGEST = "strongest"  # Most health
+    WEAKEST = "weakest"  # Least health
+    CLOSEST = "closest"  # Nearest to the tower
+
+    def next(self) -> TargetPriority:
+        """The following priority, wrapping around (for cycling in the UI)."""
+        members = list(TargetPriority)
+        return members[(members.index(self) + 1) % len(members)]
+
+
+class TargetOrder:
+    """
+    Enemy orderings for the current tick.
+
+    Args:
+        tracks: Road center lines by road name, for coverage queries.
+    """
+
+    def __init__(self, tracks: dict[str, PathTrack] | None = None) -> None:
+        self.tracks = tracks or {}
+        self.progress: list[Enemy] = []  # Closest to the end first
+        self._derived: dict[TargetPriority, list[Enemy]] = {}
+
+        # Per road: arc lengths (sorted) and the matching ranks in ``progress``.
+        # The lists are refilled in place every tick.
+        self._road_keys: dict[str, list[float]] = {}
+        self._road_ranks: dict[str, list[int]] = {}
+        self._off_road: list[int] = []  # Ranks of enemies not placed on a road
+        self._arcs: list[float] = []  # Arc length by rank (-1 off the road)
+
+        self.tick = 0  # Rebuilds so far; stamped on the enemies of each one
+
+        # Tower target scans this tick
+        self.full_scans = 0
+        self.scans_avoided = 0
+        self.towers_asleep = 0
+
+    def rebuild(self, enemies: list[Enemy]) -> None:
+        """Sort enemies by remaining path length; call once per tick."""
+        self.tick += 1
+        tick = self.tick
+        for enemy in enemies:
+            enemy.order_tick = tick
+        self.progress[:] = enemies
+        self.progress.sort(key=_distance_to_end)
+        self._derived.clear()
+        self.full_scans = 0
+        self.scans_avoided = 0
+        self.towers_asleep = 0
+        self._index_roads()
+
+    def _index_roads(self) -> None:
+        off_road = self._off_road
+        off_road.clear()
+        road_ranks = self._road_ranks
+        for stale in road_ranks.values():
+            stale.clear()
+        if not self.tracks:
+            off_road.extend(range(len(self.progress)))
+            return
+
+        arcs = self._arcs
+        arcs.clear()
+        for rank, enemy in enumerate(self.progress):
+            road = enemy.road
+            track = self.tracks.get(road) if road is not None else None
+            arc = enemy.road_progress(track) if track is not None else -1.0
+            arcs.append(arc)
+            if road is None or arc < 0:
+                off_road.append(rank)
+            else:
+                ranks = road_ranks.get(road)
+                if ranks is None:
+                    ranks = road_ranks[road] = []
+                    self._road_keys[road] = []
+                ranks.append(rank)
+
+        # Stable sort: equal arc lengths keep progress order
+        for road, ranks in road_ranks.items():
+            ranks.sort(key=arcs.__getitem__)
+            keys = self._road_keys[road]
+            keys.clear()
+            keys.extend(map(arcs.__getitem__, ranks))
+
+    def contains(self, enemy: Enemy) -> bool:
+        """Whether ``enemy`` was in the world at this tick's rebuild."""
+        return enemy.order_tick == self.tick
+
+    def any_within(self, coverage: Coverage) -> bool:
+        """Whether any enemy may be inside the covered intervals."""
+        if self._off_road:
+            return True
+        for road, intervals in coverage.items():
+            keys = self._road_keys.get(road)
+            if not keys:
+                continue
+            for start, end in intervals:
+                i = bisect_left(keys, start)
+                if i < len(keys) and keys[i] <= end:
+                    return True
+        return False
+
+    def ordered_within(self, priority: TargetPriority, coverage: Coverage) -> list[Enemy]:
+        """Like ``ordered``, restricted to enemies inside the covered intervals."""
+        ranks = list(self._off_road)
+        for road, intervals in coverage.items():
+            keys = self._road_keys.get(road)
+            if not keys:
+                continue
+            road_ranks = self._road_ranks[road]
+            for start, end in intervals:
+                ranks.extend(road_ranks[bisect_left(keys, start) : bisect_right(keys, end)])
+        ranks.sort()
+
+        progress = self.progress
+        order = [progress[rank] for rank in ranks]
+        if priority is TargetPriority.LAST:
+            order.reverse()
+        elif priority is TargetPriority.STRONGEST:
+            order.sort(key=_negative_health)
+        elif priority is TargetPriority.WEAKEST:
+            order.sort(key=_health)
+        return order
+
+    def ordered(self, priority: TargetPriority) -> list[Enemy]:
+        """
+        Enemies in preference order for ``priority``.
+
+        CLOSEST returns the progress order; the tower sorts its in-range
+        candidates by distance itself. Ties keep progress order.
+        """
+        if priority is TargetPriority.FIRST or priority is TargetPriority.CLOSEST:
+            return self.progress
+
+        order = self._derived.get(priority)
+        if order is None:
+            if priority is TargetPriority.LAST:
+                order = self.progress[::-1]
+            elif priority is TargetPriority.STRONGEST:
+                order = sorted(self.progress, key=_negative_health)
+            else:
+                order = sorted(self.progress, key=_health)
+            self._derived[priority] = order
+        return order
+
+
+def _distance_to_end(enemy: Enemy) -> float:
+    return enemy.distance_to_end()
+
+
+def _health(enemy: Enemy) -> float:
+    return enemy.health
+
+
+def _negative_health(enemy: Enemy) -> float:
+    return -enemy.health
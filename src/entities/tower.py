@@ -5,20 +5,26 @@ Tower entity and related classes.
 from __future__ import annotations
 
 import json
+import math
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import pygame as pg
 
 from ..config.paths import DATA_DIR
+from ..config.settings import MAX_VOLLEYS_PER_STEP, TARGET_LOCK_MS
+from ..utils.interning import intern_color, intern_str
 from .base_entity import BaseEntity
+from .targeting import Coverage, TargetOrder, TargetPriority
 
 if TYPE_CHECKING:
+    from ..systems.damage_ledger import DamageStats
+    from ..systems.hitscan import HitscanSystem
     from .enemy import Enemy
     from .projectile import Projectile
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectileConfig:
     """Configuration for projectiles fired by a tower."""
 
@@ -29,7 +35,7 @@ class ProjectileConfig:
     speed: float = 10.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TowerVisualConfig:
     """Configuration for tower visual appearance."""
 
@@ -39,7 +45,7 @@ class TowerVisualConfig:
     color: tuple[int, int, int] = (200, 200, 200)
 
 
-@dataclass
+@dataclass(slots=True)
 class TowerStats:
     """Complete statistics for a tower type."""
 
@@ -93,15 +99,32 @@ class TowerStats:
 class Tower(BaseEntity):
     """A defensive tower that attacks enemies within range."""
 
+    __slots__ = (
+        "stats",
+        "reload_ready_at",
+        "current_magazine_shots",
+        "is_reloading_magazine",
+        "magazine_ready_at",
+        "angle",
+        "can_see_invisible",
+        "priority",
+        "locked_targets",
+        "lock_expires_at",
+        "coverage",
+        "asleep",
+        "hitscan",
+        "damage_stats",
+    )
+
     def __init__(self, pos: tuple[int, int], stats: TowerStats) -> None:
         super().__init__(pos)
         self.stats = stats
 
-        # Firing state
-        self.current_reload: float = 0.0
+        # Firing state; reloads are deadlines on the world clock (ms)
+        self.reload_ready_at: float = 0.0
         self.current_magazine_shots: int = stats.magazine_size
         self.is_reloading_magazine: bool = False
-        self.current_magazine_reload_timer: float = 0.0
+        self.magazine_ready_at: float = 0.0
 
         # Visual state
         self.angle: float = 0.0
@@ -109,30 +132,49 @@ class Tower(BaseEntity):
         # Special abilities
         self.can_see_invisible: bool = False
 
+        # Targeting
+        self.priority: TargetPriority = TargetPriority.FIRST
+        self.locked_targets: list[Enemy] = []
+        self.lock_expires_at: float = 0.0
+
+        # Road intervals within range (set by the build manager); None = consider all enemies
+        self.coverage: Coverage | None = None
+        self.asleep: bool = False
+
+        # Resolves this tower's shots without projectiles (fast presets only)
+        self.hitscan: HitscanSystem | None = None
+
+        # Damage counters kept by the world's damage ledger (created on first hit)
+        self.damage_stats: DamageStats | None = None
+
     def is_in_range(self, enemy: Enemy) -> bool:
         return self.distance_to(enemy) <= self.stats.range
 
     def get_valid_targets(
         self, enemies: list[Enemy], can_see_invisible: bool = False
-    ) -> list[dict]:
-        """Get targets sorted by distance to end, filtered by visibility and range."""
+    ) -> list[Enemy]:
+        """Filter enemies (keeping their order) by visibility, range and damage."""
 
         potential_targets = []
 
         for enemy in enemies:
             # Skip invisible enemies if we can't see them
-            if enemy.is_invisible and not (self.can_see_invisible or can_see_invisible):
+            if (
+                enemy.is_invisible
+                and not enemy.revealed
+                and not (self.can_see_invisible or can_see_invisible)
+            ):
                 continue
 
-            # Skip dead enemies or out of range
-            if enemy.is_dead() or not self.is_in_range(enemy):
+            # Skip dead enemies, enemies that reached the end, or out of range
+            if enemy.is_dead() or enemy.has_finished() or not self.is_in_range(enemy):
                 continue
 
             # Calculate effective health (accounting for incoming damage)
             effective_health = enemy.health - enemy.incoming_damage
 
             # Calculate potential damage after resistances
-            potential_damage = self.stats.damage
+            potential_damage: float = self.stats.damage
             if self.stats.damage_type == "physical":
                 potential_damage -= enemy.armor
             elif self.stats.damage_type == "magic":
@@ -141,43 +183,136 @@ class Tower(BaseEntity):
 
             # Only target if we can deal damage and enemy isn't effectively dead
             if effective_health > 0 and potential_damage > 0:
-                distance = (
-                    enemy.distance_to_end() if hasattr(enemy, "distance_to_end") else float("inf")
-                )
-                potential_targets.append({"enemy": enemy, "distance": distance})
+                potential_targets.append(enemy)
 
-        # Sort by distance to end (closest to base first)
-        potential_targets.sort(key=lambda t: float(str(t["distance"])))
         return potential_targets
 
-    def attack(self, enemies: list[Enemy], projectiles: list[Projectile]) -> None:
-        from .projectile import Projectile
-
-        potential_targets = self.get_valid_targets(enemies, self.can_see_invisible)
-
+    def select_targets(self, targets: TargetOrder) -> list[Enemy]:
+        """Valid targets in this tower's priority order."""
+        if self.coverage is None:
+            order = targets.ordered(self.priority)
+        else:
+            order = targets.ordered_within(self.priority, self.coverage)
+        candidates = self.get_valid_targets(order, self.can_see_invisible)
+        if self.priority is TargetPriority.CLOSEST and len(candidates) > 1:
+            candidates.sort(key=self.distance_to)
+        return candidates
+
+    def current_targets(self, targets: TargetOrder, now: float) -> list[Enemy]:
+        """
+        Locked targets while all of them are still valid, otherwise a fresh selection.
+
+        The lock is dropped when a target dies, reaches the end, leaves the
+        world or range, or is already covered by incoming damage, or after
+        ``TARGET_LOCK_MS``.
+        """
+        locked = self.locked_targets
+        if locked and now < self.lock_expires_at:
+            for enemy in locked:
+                if not targets.contains(enemy):
+                    break
+            else:
+                still_valid = self.get_valid_targets(locked, self.can_see_invisible)
+                if len(still_valid) == len(locked):
+                    targets.scans_avoided += 1
+                    return locked
+
+        targets.full_scans += 1
+        selected = self.select_targets(targets)
+        self.locked_targets = selected[: self.stats.max_targets]
+        self.lock_expires_at = now + TARGET_LOCK_MS
+        return self.locked_targets
+
+    def attack(
+        self,
+        targets: TargetOrder,
+        projectiles: list[Projectile],
+        now: float,
+        step_ms: float = 0.0,
+    ) -> None:
+        """
+        Aim and fire at enemies in range.
+
+        ``targets`` holds the world's enemy orderings for this tick and
+        ``now`` is the world clock in milliseconds. The tick covers the
+        ``step_ms`` before ``now``; the tower fires every volley its reload
+        and magazine allow in that window, each at its own time, so long
+        steps (fast-forward, low FPS) do not lose damage.
+        """
+        step_start = now - step_ms
+        fire_at = max(self.reload_ready_at, step_start)
+
+        potential_targets = self.current_targets(targets, now)
         if not potential_targets:
             return
 
-        # Rotate to face closest target
-        first_target = potential_targets[0]["enemy"]
-        direction = pg.Vector2(first_target.pos) - self._pos
-        if direction.length_squared() > 0:
-            self.angle = direction.angle_to(pg.Vector2(1, 0))
+        # Rotate to face the preferred target
+        target_pos = potential_targets[0].pos
+        dx, dy = target_pos.x - self._pos.x, target_pos.y - self._pos.y
+        if dx or dy:
+            self.angle = -math.degrees(math.atan2(dy, dx))
 
-        # Check if we can fire
-        if self.current_reload > 0 or self.current_magazine_shots <= 0:
-            return
+        volleys = 0
+        while fire_at <= now and volleys < MAX_VOLLEYS_PER_STEP:
+            # Finish magazine reload
+            if self.is_reloading_magazine and fire_at >= self.magazine_ready_at:
+                self.current_magazine_shots = self.stats.magazine_size
+                self.is_reloading_magazine = False
+
+            if self.current_magazine_shots <= 0:
+                if not self.is_reloading_magazine:
+                    return
+                # Wait for the magazine, possibly later in this step
+                fire_at = max(fire_at, self.magazine_ready_at)
+                continue
+
+            if volleys:
+                potential_targets = self.current_targets(targets, fire_at)
+                if not potential_targets:
+                    return
+
+            if not self._fire_volley(potential_targets, projectiles, fire_at, step_start):
+                return
+            volleys += 1
+
+            self.reload_ready_at = fire_at + self.stats.reload_time * 1000
+
+            # Start magazine reload once the magazine is no longer full
+            if not self.is_reloading_magazine:
+                self.is_reloading_magazine = True
+                self.magazine_ready_at = fire_at + self.stats.magazine_reload_time * 1000
+
+            fire_at = self.reload_ready_at
+
+    def _fire_volley(
+        self,
+        potential_targets: list[Enemy],
+        projectiles: list[Projectile],
+        fire_at: float,
+        step_start: float,
+    ) -> int:
+        """
+        Fire at targets up to max_targets at time ``fire_at``. Returns the number of shots.
+
+        Projectiles only travel for the part of the step after ``fire_at``;
+        hitscan shots are scheduled from ``fire_at``.
+        """
+        from .projectile import Projectile
 
-        # Fire at targets up to max_targets
         attacked_count = 0
-        for target_info in potential_targets:
+        for target in potential_targets:
             if attacked_count >= self.stats.max_targets:
                 break
             if self.current_magazine_shots <= 0:
                 break
 
-            target = target_info["enemy"]
             target.add_incoming_damage(self.stats.damage)
+            self.current_magazine_shots -= 1
+            attacked_count += 1
+
+            if self.hitscan is not None:
+                self.hitscan.fire(self._pos, target, self.stats, fire_at, tower=self)
+                continue
 
             # Create projectile
             projectile = Projectile(
@@ -192,40 +327,16 @@ class Tower(BaseEntity):
                 color1=self.stats.projectile_color1,
                 color2=self.stats.projectile_color2,
                 size=self.stats.projectile_size,
+                source=self.stats.preset_name,
+                tower=self,
             )
+            projectile.spawn_delay = fire_at - step_start
             projectiles.append(projectile)
 
-            self.current_magazine_shots -= 1
-            attacked_count += 1
-
-        # Start reload
-        if attacked_count > 0:
-            self.current_reload = self.stats.reload_time
-
-            # Start magazine reload if needed
-            if self.current_magazine_shots <= 0 and not self.is_reloading_magazine:
-                self.is_reloading_magazine = True
-                self.current_magazine_reload_timer = self.stats.magazine_reload_time
+        return attacked_count
 
     def update(self, dt: float) -> None:
-        """Update tower timers. dt in milliseconds."""
-        dt_sec = dt / 1000.0
-        
-        # Update shot reload
-        if self.current_reload > 0:
-            self.current_reload = max(0, self.current_reload - dt_sec)
-
-        # Update magazine reload
-        if self.is_reloading_magazine:
-            self.current_magazine_reload_timer -= dt_sec
-            if self.current_magazine_reload_timer <= 0:
-                self.current_magazine_shots = self.stats.magazine_size
-                self.is_reloading_magazine = False
-                self.current_magazine_reload_timer = 0
-        elif self.current_magazine_shots < self.stats.magazine_size:
-            # Start magazine reload
-            self.is_reloading_magazine = True
-            self.current_magazine_reload_timer = self.stats.magazine_reload_time
+        """Towers have no per-tick state; reloads are checked against ``now`` in attack."""
 
     def draw(self, surface: pg.Surface, draw_range: bool = False) -> None:
         # Draw tower shape
@@ -305,14 +416,22 @@ def load_tower_presets(json_path: str | None = None) -> dict[str, TowerStats]:
         _TOWER_PRESETS = _default_tower_presets()
         return _TOWER_PRESETS
 
+    _TOWER_PRESETS = parse_tower_presets(raw)
+    return _TOWER_PRESETS
+
+
+def parse_tower_presets(raw: dict) -> dict[str, TowerStats]:
+    """Convert raw preset JSON into TowerStats, skipping invalid entries."""
     presets: dict[str, TowerStats] = {}
 
     for name, data in raw.items():
         try:
-            # Convert color lists to tuples
-            color1 = tuple(data["projectile_color1"]) if data.get("projectile_color1") else None
-            color2 = tuple(data["projectile_color2"]) if data.get("projectile_color2") else None
-            visual_color = tuple(data.get("tower_visual_color", [200, 200, 200]))
+            # Convert color lists to shared tuples
+            color1 = data.get("projectile_color1")
+            color2 = data.get("projectile_color2")
+            color1 = intern_color(color1) if color1 else None
+            color2 = intern_color(color2) if color2 else None
+            visual_color = intern_color(data.get("tower_visual_color", [200, 200, 200]))
             visual_points = [tuple(p) for p in data.get("tower_visual_points", [])]
 
             stats = TowerStats(
@@ -322,19 +441,19 @@ def load_tower_presets(json_path: str | None = None) -> dict[str, TowerStats]:
                 magazine_size=data.get("magazine_size", 1),
                 magazine_reload_time=data.get("magazine_reload_time", 1.0),
                 max_targets=data.get("max_targets", 1),
-                damage_type=data.get("damage_type", "physical"),
+                damage_type=intern_str(data.get("damage_type", "physical")),
                 explosive=data.get("explosive", False),
                 explosion_radius=data.get("explosion_radius", 30),
-                projectile_shape=data.get("projectile_shape", "circle"),
+                projectile_shape=intern_str(data.get("projectile_shape", "circle")),
                 projectile_color1=color1,
                 projectile_color2=color2,
                 projectile_size=data.get("projectile_size", 5),
                 projectile_speed=data.get("projectile_speed", 1.0),
-                tower_visual_shape_type=data.get("tower_visual_shape_type", "circle"),
+                tower_visual_shape_type=intern_str(data.get("tower_visual_shape_type", "circle")),
                 tower_visual_points=visual_points,
                 tower_visual_size=data.get("tower_visual_size", 8),
                 tower_visual_color=visual_color,
-                preset_name=name,
+                preset_name=intern_str(name),
             )
             presets[name] = stats
         except Exception as e:
@@ -344,14 +463,21 @@ def load_tower_presets(json_path: str | None = None) -> dict[str, TowerStats]:
         print("Error: No valid tower presets loaded. Using defaults.")
         presets = _default_tower_presets()
 
-    _TOWER_PRESETS = presets
     return presets
 
 
 def get_tower_presets() -> dict[str, TowerStats]:
-    """Get loaded tower presets, loading from file if needed."""
+    """Get loaded tower presets, using the data bundle if needed."""
+    global _TOWER_PRESETS
+
     if not _TOWER_PRESETS:
-        load_tower_presets()
+        from ..utils.data_bundle import get_data_bundle
+
+        bundle = get_data_bundle()
+        if bundle.tower_presets:
+            _TOWER_PRESETS = dict(bundle.tower_presets)
+        else:
+            load_tower_presets()
     return _TOWER_PRESETS
 
 
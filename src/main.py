@@ -5,31 +5,36 @@ A pygame tower defense game with multiple levels, tower types,
 enemy abilities, and resource management.
 """
 
-import json
+import argparse
+import copy
 import sys
 
 import pygame as pg
 
 from .config import DEFAULT_LEVELS_CONFIG, FPS
-from .config.settings import GAME_WIDTH, GAME_HEIGHT, WINDOW_SCALE_FACTOR
-from .config.paths import ASSETS_DIR, DATA_DIR
+from .config.settings import (
+    GAME_WIDTH,
+    GAME_HEIGHT,
+    HITCH_BUDGET_MS,
+    PROFILER_OUTPUT,
+    PROFILER_SAMPLE_INTERVAL_MS,
+    WINDOW_SCALE_FACTOR,
+)
+from .config.paths import ASSETS_DIR
 from .core import GameContext, GameEngine
 from .ui.screens import MainMenuScreen
 
 
 def load_levels_config() -> list[dict]:
-    """Load levels configuration from file."""
-    config_path = DATA_DIR / "levels_config.json"
-
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                data: list[dict] = json.load(f)
-                return data
-        except (OSError, json.JSONDecodeError) as e:
-            print(f"Warning: Could not load levels config: {e}")
-            print("Using default configuration.")
+    """Load levels configuration from the data bundle."""
+    from .utils.data_bundle import get_data_bundle
 
+    levels = get_data_bundle().levels_config
+    if levels is not None:
+        # The game edits and saves this list (unlocks), keep the bundle intact
+        return copy.deepcopy(levels)
+
+    print("Using default configuration.")
     return DEFAULT_LEVELS_CONFIG
 
 
@@ -50,8 +55,57 @@ def calculate_window_size() -> tuple[int, int]:
     return window_size, window_size
 
 
-def main() -> int:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Tower Defense")
+    parser.add_argument(
+        "--trace",
+        metavar="DIR",
+        help="record every game event of each level to rotating trace files in DIR",
+    )
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=FPS,
+        help=f"render rate cap (default {FPS}); the simulation rate does not change",
+    )
+    parser.add_argument(
+        "--hitch-report",
+        metavar="FILE",
+        help="append a JSON report of every frame over the hitch budget to FILE",
+    )
+    parser.add_argument(
+        "--hitch-budget",
+        type=float,
+        default=HITCH_BUDGET_MS,
+        metavar="MS",
+        help=f"frame time that counts as a hitch (default {HITCH_BUDGET_MS:g} ms)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=PROFILER_OUTPUT,
+        metavar="FILE",
+        help=(
+            "sample the game's stacks from launch to exit and write them in collapsed-stack "
+            f"(flame graph) format to FILE (default {PROFILER_OUTPUT}); "
+            "without this, P starts and stops sampling in a level"
+        ),
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=PROFILER_SAMPLE_INTERVAL_MS,
+        metavar="MS",
+        help=f"time between profiler samples (default {PROFILER_SAMPLE_INTERVAL_MS:g} ms)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
+    args = parse_args(argv)
+
     # Initialize pygame
     pg.init()
     pg.mixer.init()
@@ -86,7 +140,12 @@ def main() -> int:
         screen=game_surface, 
         clock=clock, 
         levels_config=levels_config,
-        scale=scale
+        scale=scale,
+        trace_dir=args.trace,
+        hitch_report=args.hitch_report,
+        hitch_budget_ms=args.hitch_budget,
+        profile_path=args.profile,
+        profile_interval_ms=args.profile_interval,
     )
 
     engine = GameEngine(context)
@@ -94,53 +153,48 @@ def main() -> int:
     # Start with main menu
     engine.push_screen(MainMenuScreen(context, engine))
 
-    # Main game loop
-    running = True
-    while running:
-        # Handle events
-        for event in pg.event.get():
-            if event.type == pg.QUIT:
-                running = False
-            elif event.type == pg.VIDEORESIZE:
-                # Window was resized - update scale
-                window_width, window_height = event.w, event.h
-                scale = min(window_width / GAME_WIDTH, window_height / GAME_HEIGHT)
-                context.scale = scale
-            elif event.type == pg.MOUSEMOTION:
-                # Transform mouse position to game coordinates
-                transformed_event = transform_mouse_event(event, scale, window_width, window_height)
-                context.mouse_pos = transformed_event.pos  # Update context for render-time access
-                engine.handle_event(transformed_event)
-            elif event.type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
-                # Transform mouse position to game coordinates
-                transformed_event = transform_mouse_event(event, scale, window_width, window_height)
-                context.mouse_pos = transformed_event.pos  # Update context for render-time access
-                engine.handle_event(transformed_event)
-            else:
-                engine.handle_event(event)
-
-        # Calculate delta time
-        dt = clock.tick(FPS) / 1000.0  # seconds
-
-        # Update current screen
-        engine.update(dt)
-
-        # Render current screen to game surface
-        engine.render(game_surface)
-
-        # Scale game surface to window
-        render_scaled(screen, game_surface, window_width, window_height, scale)
-
-        # Flip display
-        pg.display.flip()
+    # Main game loop (also releases screens, e.g. trace writers, on exit)
+    window = ScaledWindow(screen, game_surface, context, window_width, window_height)
+    if args.profile:
+        context.profiler.start()
+    engine.run(translate_event=window.translate, present=window.present, fps=args.fps)
+    return 0
 
-        # Check if engine wants to quit
-        if not engine.is_running():
-            running = False
 
-    # Cleanup
-    pg.quit()
-    return 0
+class ScaledWindow:
+    """The resizable window; the game renders at a fixed size scaled to fit it."""
+
+    def __init__(
+        self,
+        screen: pg.Surface,
+        game_surface: pg.Surface,
+        context: GameContext,
+        width: int,
+        height: int,
+    ) -> None:
+        self.screen = screen
+        self.game_surface = game_surface
+        self.context = context
+        self.width = width
+        self.height = height
+
+    def translate(self, event: pg.event.Event) -> pg.event.Event | None:
+        """Map mouse positions to game coordinates; resizes are handled here."""
+        if event.type == pg.VIDEORESIZE:
+            # Window was resized - update scale
+            self.width, self.height = event.w, event.h
+            self.context.scale = min(self.width / GAME_WIDTH, self.height / GAME_HEIGHT)
+            return None
+        if event.type in (pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+            # Transform mouse position to game coordinates
+            event = transform_mouse_event(event, self.context.scale, self.width, self.height)
+            self.context.mouse_pos = event.pos  # Update context for render-time access
+        return event
+
+    def present(self) -> None:
+        """Scale the game surface to the window and flip the display."""
+        render_scaled(self.screen, self.game_surface, self.width, self.height, self.context.scale)
+        pg.display.flip()
 
 
 def transform_mouse_event(event: pg.event.Event, scale: float, window_w: int, window_h: int) -> pg.event.Event:
@@ -0,0 +1,356 @@
+"""
+Headless level profiler.
+
+Plays a level from its first wave with a fixed seed and a scripted build
+plan, and profiles a range of its waves with cProfile or the sampling
+profiler. The waves before the range are played (not profiled), so the
+profiled waves start from the state a player would have reached.
+Prints the hottest functions and writes the raw profile: a pstats file
+for cProfile, collapsed stacks for the sampling profiler.
+
+With ``--render`` the level runs in a ``GameScreen`` on an offscreen
+display and every frame is drawn, so rendering costs are included.
+
+Build plan (JSON list, optional), built in the build phase before
+``wave`` (default 1):
+    [
+        {"build": "cannon", "at": [310, 420]},
+        {"build": "factory_wood", "at": [120, 80], "wave": 2},
+        {"build": "upgrade", "at": [310, 420], "wave": 3}
+    ]
+``build`` is a tower type, ``factory_metal``, ``factory_wood`` or
+``upgrade``. Without a plan, ``--towers`` towers of the level's types are
+placed beside the roads.
+
+Usage:
+    tower-defense-profile level3 --waves 2-4 --seed 7 --resources 100000
+    tower-defense-profile level1 --profiler sampling --render --output level1
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import random
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from .config.settings import (
+    FACTORY_COSTS,
+    FACTORY_PAYOUTS,
+    FPS,
+    GAME_HEIGHT,
+    GAME_WIDTH,
+    PROFILER_SAMPLE_INTERVAL_MS,
+    TOWER_COSTS,
+    TOWER_UPGRADE_COST,
+)
+
+if TYPE_CHECKING:
+    import pygame as pg
+
+    from .core import GameEngine
+    from .core.game_world import GameWorld
+    from .systems import BuildingBlueprint
+    from .ui.screens.game_screen import GameScreen
+
+BUILDING_SIZE: int = 40
+ROAD_CLEARANCE: tuple[float, float] = (75.0, 110.0)  # Auto-placed towers stay this far off roads
+BUILDINGS: frozenset[str] = frozenset(
+    [*TOWER_COSTS, "upgrade", *(f"factory_{resource}" for resource in FACTORY_COSTS)]
+)
+
+
+def parse_waves(text: str) -> tuple[int, int | None]:
+    """Parse a 1-based wave range: "3", "2-5" or "2-" (to the last wave)."""
+    first, sep, last = text.partition("-")
+    try:
+        start = int(first)
+        end = int(last) if last else (None if sep else start)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid wave range: {text!r}") from None
+    if start < 1 or (end is not None and end < start):
+        raise argparse.ArgumentTypeError(f"invalid wave range: {text!r}")
+    return start, end
+
+
+def load_build_plan(path: str) -> list[dict[str, Any]]:
+    """Read and check a build plan file."""
+    with open(path) as f:
+        plan = json.load(f)
+    if not isinstance(plan, list):
+        raise ValueError("a build plan is a list of steps")
+    for i, step in enumerate(plan):
+        if not isinstance(step, dict) or "build" not in step or "at" not in step:
+            raise ValueError(f"step {i}: needs 'build' and 'at'")
+        if step["build"] not in BUILDINGS:
+            raise ValueError(f"step {i}: unknown building {step['build']!r}")
+        x, y = step["at"]
+        step["at"] = (int(x), int(y))
+        step["wave"] = int(step.get("wave", 1))
+    return plan
+
+
+def auto_build_plan(world: GameWorld, towers: int, rng: random.Random) -> list[dict[str, Any]]:
+    """``towers`` towers of the level's types at free spots beside the roads."""
+    from .systems import BuildManager
+
+    available = world.level_config.get("available_towers", list(TOWER_COSTS))
+    types = [kind for kind in available if kind in TOWER_COSTS]
+    if not types:
+        return []
+
+    low, high = ROAD_CLEARANCE
+    spots = [
+        (x, y)
+        for x in range(20, GAME_WIDTH - 220, 45)
+        for y in range(20, GAME_HEIGHT - 20, 45)
+        if low
+        < min(
+            BuildManager._point_to_segment_distance(x, y, a[0], a[1], b[0], b[1])
+            for a, b in world.road_segments
+        )
+        < high
+    ]
+    rng.shuffle(spots)
+    return [
+        {"build": types[i % len(types)], "at": pos, "wave": 1}
+        for i, pos in enumerate(spots[:towers])
+    ]
+
+
+def make_blueprint(world: GameWorld, kind: str) -> BuildingBlueprint:
+    """A blueprint with the game's costs for a plan step (no icon)."""
+    import pygame as pg
+
+    from .systems import BuildingBlueprint
+
+    image = pg.Surface((BUILDING_SIZE, BUILDING_SIZE))
+    manager = world.build_manager
+    if kind == "upgrade":
+        return BuildingBlueprint(
+            "Tower Upgrade", image, TOWER_UPGRADE_COST, BUILDING_SIZE, BUILDING_SIZE,
+            manager.upgrade_tower,
+        )
+    if kind.startswith("factory_"):
+        resource = kind.removeprefix("factory_")
+        return BuildingBlueprint(
+            f"{resource.title()} Factory", image, FACTORY_COSTS[resource],
+            BUILDING_SIZE, BUILDING_SIZE, manager.build_factory,
+            resource=resource, payout_per_wave=FACTORY_PAYOUTS[resource],
+        )
+    return BuildingBlueprint(
+        f"Tower - {kind}", image, TOWER_COSTS[kind], BUILDING_SIZE, BUILDING_SIZE,
+        manager.build_tower, tower_type=kind,
+    )
+
+
+def open_render_screen(level_config: dict, levels_config: list[dict]) -> tuple[
+    GameEngine, GameScreen, pg.Surface
+]:
+    """A GameScreen for the level on an offscreen display, and the surface it draws to."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame as pg
+
+    from .core import GameContext, GameEngine
+    from .core.event_manager import GameEvent
+    from .ui.screens.game_screen import GameScreen
+
+    pg.init()
+    pg.display.set_mode((GAME_WIDTH, GAME_HEIGHT))
+    surface = pg.Surface((GAME_WIDTH, GAME_HEIGHT))
+    context = GameContext(screen=surface, levels_config=levels_config)
+    context.current_level_config = level_config
+    engine = GameEngine(context)
+    screen = GameScreen(context, engine)
+    engine.push_screen(screen)
+    # The run ends here, not on the ending screen (which would also save unlocks)
+    screen.events.unsubscribe(GameEvent.GAME_OVER, screen._on_game_over)
+    return engine, screen, surface
+
+
+def build_for_wave(world: GameWorld, plan: list[dict[str, Any]], wave: int) -> None:
+    """Build the plan's steps for ``wave`` (1-based)."""
+    for step in plan:
+        if step["wave"] == wave and not world.try_build(
+            step["at"], make_blueprint(world, step["build"])
+        ):
+            print(f"Warning: Could not build {step['build']} at {step['at']} before wave {wave}")
+
+
+def sampled_hot_functions(stacks: Counter[tuple[str, ...]]) -> tuple[Counter, Counter]:
+    """Samples per function: where it was running (self) and anywhere on the stack (total)."""
+    own: Counter[str] = Counter()
+    total: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        own[stack[-1]] += count
+        for label in set(stack):
+            total[label] += count
+    return own, total
+
+
+def print_sampled_report(stacks: Counter[tuple[str, ...]], sort: str, top: int) -> None:
+    """Print the functions with the most samples."""
+    own, total = sampled_hot_functions(stacks)
+    samples = sum(stacks.values()) or 1
+    ranked = sorted(
+        total,
+        key=lambda label: (own[label], total[label]) if sort == "tottime" else total[label],
+        reverse=True,
+    )
+    print(f"{'self':>7} {'total':>7}  function ({samples} samples)")
+    for label in ranked[:top]:
+        print(f"{own[label] / samples:7.1%} {total[label] / samples:7.1%}  {label}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Profile a scripted headless run of a level."""
+    parser = argparse.ArgumentParser(description="Profile a scripted run of a level.")
+    parser.add_argument("level", help="level id, e.g. level1")
+    parser.add_argument(
+        "--waves", type=parse_waves, default=(1, None), metavar="RANGE",
+        help='1-based waves to profile: "3", "2-5" or "2-" (default: all)',
+    )
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default 1)")
+    parser.add_argument("--build-plan", metavar="FILE", help="JSON build plan (see module docs)")
+    parser.add_argument(
+        "--towers", type=int, default=10, help="towers placed without a build plan (default 10)"
+    )
+    parser.add_argument(
+        "--resources", type=int, metavar="N",
+        help="start with N gold, wood and metal instead of the level's amounts",
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="game speed (default 1)")
+    parser.add_argument(
+        "--profiler", choices=("cprofile", "sampling"), default="cprofile",
+        help="cProfile (exact call counts, slower) or the sampling profiler",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=PROFILER_SAMPLE_INTERVAL_MS, metavar="MS",
+        help=f"sampling interval (default {PROFILER_SAMPLE_INTERVAL_MS:g} ms)",
+    )
+    parser.add_argument(
+        "--render", action="store_true",
+        help="run in a GameScreen and draw every frame offscreen",
+    )
+    parser.add_argument(
+        "--sort", choices=("tottime", "cumulative"), default="tottime",
+        help="rank functions by own time or by time including callees",
+    )
+    parser.add_argument("--top", type=int, default=30, help="functions to list (default 30)")
+    parser.add_argument(
+        "--output", default="profile", metavar="PREFIX",
+        help="writes PREFIX.pstats (cprofile) or PREFIX.collapsed (sampling)",
+    )
+    args = parser.parse_args(argv)
+
+    from .core.game_world import GamePhase, GameWorld, GameWorldConfig
+    from .utils.data_bundle import get_data_bundle
+
+    levels = {level["id"]: level for level in get_data_bundle().levels_config or []}
+    if args.level not in levels:
+        parser.error(f"unknown level {args.level!r} (levels: {', '.join(levels)})")
+    plan = None
+    if args.build_plan:
+        try:
+            plan = load_build_plan(args.build_plan)
+        except (OSError, ValueError, TypeError) as e:
+            parser.error(f"bad build plan {args.build_plan}: {e}")
+
+    random.seed(args.seed)
+    step: Callable[[float], object]
+    close: Callable[[], None]
+    if args.render:
+        engine, screen, surface = open_render_screen(levels[args.level], list(levels.values()))
+        world = screen.world
+
+        def render_step(dt: float) -> None:
+            screen.update(dt)
+            screen.render(surface)
+
+        step, close = render_step, engine.clear_screens
+    else:
+        world = GameWorld(GameWorldConfig(level_config=levels[args.level]))
+        step, close = world.update, world.close
+
+    first, last = args.waves
+    last = min(last or world.total_waves, world.total_waves)
+    if first > last:
+        parser.error(f"{args.level} has {world.total_waves} waves")
+    if args.resources is not None:
+        world.resources.resources.update(
+            gold=args.resources, wood=args.resources, metal=args.resources
+        )
+    if plan is None:
+        plan = auto_build_plan(world, args.towers, random.Random(args.seed))
+    world.set_game_speed(args.speed)
+
+    if args.profiler == "cprofile":
+        profiler: Any = cProfile.Profile()
+        start, stop = profiler.enable, profiler.disable
+    else:
+        from .core.sampling_profiler import SamplingProfiler
+
+        profiler = SamplingProfiler(args.interval, output_path=None)
+        start, stop = profiler.start, profiler.stop
+
+    dt = 1.0 / FPS
+    profiling = False
+    started_at = 0.0
+    first_tick = 0
+    try:
+        while not world.is_game_over and world.current_wave < last:
+            if world.phase == GamePhase.BUILD:
+                wave = world.current_wave + 1
+                build_for_wave(world, plan, wave)
+                if wave == first and not profiling:
+                    profiling = True
+                    first_tick = world.tick
+                    started_at = time.perf_counter()
+                    start()
+                world.start_wave()
+            step(dt)
+    finally:
+        if profiling:
+            stop()
+        elapsed = time.perf_counter() - started_at
+        close()
+
+    if not profiling:
+        print(f"Warning: the level ended before wave {first}, nothing was profiled")
+        return 1
+
+    ticks = world.tick - first_tick
+    print(
+        f"{args.level} waves {first}-{min(last, world.current_wave + 1)}"
+        f"{' (rendered)' if args.render else ''}: {ticks} ticks in {elapsed:.2f} s "
+        f"({elapsed / max(ticks, 1) * 1000:.3f} ms/tick), "
+        f"{len(world.towers)} towers, health {world.resources.health}"
+    )
+    if world.phase == GamePhase.DEFEAT:
+        print("Warning: the level was lost before the last profiled wave")
+    counters = world.instrumentation.report()
+    if counters:
+        print(counters)
+
+    if args.profiler == "cprofile":
+        path = f"{args.output}.pstats"
+        profiler.dump_stats(path)
+        stats = pstats.Stats(profiler, stream=sys.stdout)
+        stats.strip_dirs().sort_stats(args.sort).print_stats(args.top)
+    else:
+        path = f"{args.output}.collapsed"
+        profiler.write_collapsed(path)
+        print_sampled_report(profiler.stacks, args.sort, args.top)
+    print(f"Profile written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,15 @@
 """Game systems module - manages game logic like building, economy, and spawning."""
 
 from .build_manager import BuildingBlueprint, BuildManager
+from .damage_ledger import DamageLedger, DamageStats
 from .economy_system import ResourcesManager
+from .explosions import Explosions
+from .floating_text import FloatingTextLayer
+from .hitscan import HitscanSystem
+from .particle_system import ParticleKind, ParticleSystem
 from .player_abilities import ABILITY_COSTS, ABILITY_RADII, PlayerAbilities
 from .spawn_system import SpawnController, WaveLoader
+from .status_effects import StatusEffect, StatusEffects, StatusType
 
 __all__ = [
     "BuildManager",
@@ -12,6 +18,16 @@ __all__ = [
     "WaveLoader",
     "SpawnController",
     "PlayerAbilities",
+    "ParticleSystem",
+    "ParticleKind",
+    "FloatingTextLayer",
+    "Explosions",
+    "DamageLedger",
+    "DamageStats",
+    "HitscanSystem",
+    "StatusEffects",
+    "StatusEffect",
+    "StatusType",
     "ABILITY_COSTS",
     "ABILITY_RADII",
 ]
@@ -6,16 +6,21 @@ Handles building placement, validation, and management.
 
 from __future__ import annotations
 
+import math
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import pygame as pg
 
-from ..core.event_manager import EventManager, FactoryBuiltEvent, GameEvent, TowerBuiltEvent, TowerUpgradedEvent
+from ..config.settings import HITSCAN_SPEED_THRESHOLD, PATH_COVERAGE_MARGIN
 from ..entities import Factory, Tower, create_tower
 
 if TYPE_CHECKING:
+    from ..core.event_manager import EventManager
+    from ..entities import TargetOrder
+    from ..utils.path_utils import PathTrack
+    from .hitscan import HitscanSystem
     from .economy_system import ResourcesManager
 
 
@@ -93,6 +98,12 @@ class BuildManager:
         self.building_rects: list[pg.Rect] = []
         self.events = events
 
+        # Road center lines by name; towers get their path coverage from these
+        self.path_tracks: dict[str, PathTrack] = {}
+
+        # Resolves shots of fast presets without projectile entities
+        self.hitscan: HitscanSystem | None = None
+
     def reset(self) -> None:
         self.towers.clear()
         self.factories.clear()
@@ -123,6 +134,8 @@ class BuildManager:
 
         # Emit event
         if self.events:
+            from ..core.event_manager import FactoryBuiltEvent, GameEvent
+
             self.events.emit(
                 GameEvent.FACTORY_BUILT,
                 FactoryBuiltEvent(
@@ -154,6 +167,7 @@ class BuildManager:
         new_tower = create_tower(adjusted_pos, tower_type)
         if tower_type == "sniper":
             new_tower.can_see_invisible = True
+        self._equip(new_tower)
 
         self.towers.append(new_tower)
         self.building_rects.append(
@@ -162,6 +176,8 @@ class BuildManager:
 
         # Emit event
         if self.events:
+            from ..core.event_manager import GameEvent, TowerBuiltEvent
+
             self.events.emit(
                 GameEvent.TOWER_BUILT,
                 TowerBuiltEvent(
@@ -211,10 +227,16 @@ class BuildManager:
                 # Create upgraded tower
                 old_type = current_type
                 new_tower = create_tower((int(tower.pos.x), int(tower.pos.y)), next_type)
+                new_tower.priority = tower.priority
+                new_tower.can_see_invisible = tower.can_see_invisible
+                new_tower.damage_stats = tower.damage_stats
+                self._equip(new_tower)
                 self.towers[i] = new_tower
 
                 # Emit event
                 if self.events:
+                    from ..core.event_manager import GameEvent, TowerUpgradedEvent
+
                     self.events.emit(
                         GameEvent.TOWER_UPGRADED,
                         TowerUpgradedEvent(
@@ -295,11 +317,52 @@ class BuildManager:
         for factory in self.factories:
             factory.update(dt)
 
-    def update_towers(self, dt: float, enemies: list, projectiles: list) -> None:
-        """Update all towers."""
+    def _equip(self, tower: Tower) -> None:
+        """Give a new or upgraded tower its path coverage and shot resolution."""
+        self._cover_paths(tower)
+        if self.hitscan is not None and tower.stats.projectile_speed >= HITSCAN_SPEED_THRESHOLD:
+            tower.hitscan = self.hitscan
+
+    def _cover_paths(self, tower: Tower) -> None:
+        """Precompute the road intervals a tower can reach; roads never move."""
+        if not self.path_tracks:
+            return
+        reach = tower.stats.range + PATH_COVERAGE_MARGIN
+        tower.coverage = {}
+        for road, track in self.path_tracks.items():
+            intervals = track.coverage((tower.pos.x, tower.pos.y), reach)
+            if intervals:
+                tower.coverage[road] = intervals
+
+    def update_towers(
+        self, now: float, targets: TargetOrder, projectiles: list, step_ms: float = 0.0
+    ) -> None:
+        """
+        Let all towers attack during the ``step_ms`` ending at ``now`` (world clock, ms).
+
+        Towers with no enemy inside their path coverage sleep and skip
+        ``attack`` until one enters.
+        """
         for tower in self.towers:
-            tower.update(dt)
-            tower.attack(enemies, projectiles)
+            if tower.coverage is not None and not targets.any_within(tower.coverage):
+                if not tower.asleep:
+                    tower.asleep = True
+                    tower.locked_targets = []
+                targets.towers_asleep += 1
+                continue
+            tower.asleep = False
+            tower.attack(targets, projectiles, now, step_ms)
+
+    def get_tower_at(self, pos: tuple[int, int], radius: float = 20) -> Tower | None:
+        """The tower whose center is within ``radius`` of ``pos``, nearest first."""
+        point = pg.Vector2(pos)
+        best: Tower | None = None
+        best_distance = radius
+        for tower in self.towers:
+            distance = tower.pos.distance_to(point)
+            if distance <= best_distance:
+                best, best_distance = tower, distance
+        return best
 
     def give_factory_payouts(self, resources: ResourcesManager) -> None:
         """Give end-of-wave payouts from all factories."""
@@ -323,14 +386,12 @@ class BuildManager:
         px: float, py: float, x1: float, y1: float, x2: float, y2: float
     ) -> float:
         """Calculate distance from point to line segment."""
-        line_vec = pg.Vector2(x2 - x1, y2 - y1)
-        point_vec = pg.Vector2(px - x1, py - y1)
+        lx, ly = x2 - x1, y2 - y1
+        vx, vy = px - x1, py - y1
 
-        line_len_sq = line_vec.length_squared()
+        line_len_sq = lx * lx + ly * ly
         if line_len_sq == 0:
-            return point_vec.length()
-
-        t = max(0, min(1, line_vec.dot(point_vec) / line_len_sq))
-        closest = pg.Vector2(x1, y1) + t * line_vec
+            return math.hypot(vx, vy)
 
-        return closest.distance_to(pg.Vector2(px, py))
+        t = max(0.0, min(1.0, (lx * vx + ly * vy) / line_len_sq))
+        return math.hypot(vx - t * lx, vy - t * ly)
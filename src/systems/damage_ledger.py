@@ -0,0 +1,134 @@
+"""
+Damage ledger.
+
+Every source of damage (projectiles, hitscan shots, explosions, the
+fireball) records raw hits here instead of calling ``take_damage``. Once
+per tick ``flush`` applies them together:
+
+- Armor or magic resistance is worked out per hit.
+- Hits on the same enemy are credited in order, so the hit that empties
+  the health bar gets the kill and anything beyond it counts as overkill.
+- Each enemy then receives its summed damage once.
+
+Counters are kept per source (tower preset name, or e.g. "fireball") and
+per tower (``Tower.damage_stats``, created on first use).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..entities import Enemy, Tower
+
+
+@dataclass(slots=True)
+class DamageStats:
+    """Running damage counters for one tower or source."""
+
+    damage: int = 0  # Damage that removed health
+    overkill: int = 0  # Damage beyond what the target had left
+    kills: int = 0
+    shots: int = 0  # Projectiles and hitscan shots resolved
+    wasted_shots: int = 0  # Shots whose target was already dead or gone
+
+    def dps(self, combat_ms: float) -> float:
+        """Average damage per second over ``combat_ms`` of wave time."""
+        return self.damage * 1000 / combat_ms if combat_ms > 0 else 0.0
+
+
+class DamageLedger:
+    """Per-tick damage buffer with per-tower and per-source counters."""
+
+    def __init__(self) -> None:
+        # (target, raw amount, damage type, source name, tower)
+        self._hits: list[tuple[Enemy, int, str, str | None, Tower | None]] = []
+        self.by_source: dict[str, DamageStats] = {}
+        self.combat_ms = 0.0  # Wave time so far, for DPS
+
+    def __len__(self) -> int:
+        return len(self._hits)
+
+    def record(
+        self,
+        target: Enemy,
+        amount: int,
+        damage_type: str = "physical",
+        source: str | None = None,
+        tower: Tower | None = None,
+    ) -> None:
+        """Buffer a hit of ``amount`` raw damage; resistances apply on flush."""
+        self._hits.append((target, amount, damage_type, source, tower))
+
+    def shot(self, source: str | None, tower: Tower | None, wasted: bool = False) -> None:
+        """Count a resolved shot; ``wasted`` if its target was already dead."""
+        if source is not None:
+            stats = self.stats_for_source(source)
+            stats.shots += 1
+            stats.wasted_shots += wasted
+        if tower is not None:
+            stats = self.stats_for_tower(tower)
+            stats.shots += 1
+            stats.wasted_shots += wasted
+
+    def flush(self) -> int:
+        """Apply the tick's hits. Returns the number of enemies killed."""
+        hits = self._hits
+        if not hits:
+            return 0
+
+        kills = 0
+        # id(enemy) -> [enemy, health left, total damage, killing (else last) source]
+        targets: dict[int, list] = {}
+        for target, amount, damage_type, source, tower in hits:
+            state = targets.get(id(target))
+            if state is None:
+                state = targets[id(target)] = [target, target.health, 0, None]
+
+            dealt = target.mitigate(amount, damage_type)
+            if dealt <= 0:
+                continue
+
+            remaining = state[1]
+            effective = min(dealt, max(remaining, 0))
+            killed = 0 < remaining <= dealt
+            kills += killed
+            if source is not None:
+                stats = self.stats_for_source(source)
+                stats.damage += effective
+                stats.overkill += dealt - effective
+                stats.kills += killed
+            if tower is not None:
+                stats = self.stats_for_tower(tower)
+                stats.damage += effective
+                stats.overkill += dealt - effective
+                stats.kills += killed
+
+            state[1] = remaining - dealt
+            state[2] += dealt
+            if remaining > 0:
+                state[3] = source  # Hits after the kill do not take the credit
+
+        for target, _, total, source in targets.values():
+            if total:
+                target.apply_damage(total, source)
+
+        hits.clear()
+        return kills
+
+    def stats_for_source(self, source: str) -> DamageStats:
+        stats = self.by_source.get(source)
+        if stats is None:
+            stats = self.by_source[source] = DamageStats()
+        return stats
+
+    @staticmethod
+    def stats_for_tower(tower: Tower) -> DamageStats:
+        stats = tower.damage_stats
+        if stats is None:
+            stats = tower.damage_stats = DamageStats()
+        return stats
+
+    def clear(self) -> None:
+        self._hits.clear()
@@ -32,19 +32,24 @@ class ResourcesManager:
         self.events: "EventManager | None" = events
 
     def _emit_change(self, resource_type: str, old_value: int, new_value: int) -> None:
-        """Emit a resource change event if events are configured."""
-        if self.events:
-            from ..core.event_manager import GameEvent, ResourceChangedEvent
+        """Emit a resource change event if anyone is listening."""
+        if self.events is None:
+            return
 
-            self.events.emit(
-                GameEvent.RESOURCE_CHANGED,
-                ResourceChangedEvent(
-                    resource_type=resource_type,
-                    old_value=old_value,
-                    new_value=new_value,
-                    change=new_value - old_value,
-                ),
-            )
+        from ..core.event_manager import GameEvent, ResourceChangedEvent
+
+        if not self.events.has_subscribers(GameEvent.RESOURCE_CHANGED):
+            return
+
+        self.events.emit(
+            GameEvent.RESOURCE_CHANGED,
+            ResourceChangedEvent(
+                resource_type=resource_type,
+                old_value=old_value,
+                new_value=new_value,
+                change=new_value - old_value,
+            ),
+        )
 
     def get_resource(self, resource_type: str) -> int:
         return self.resources.get(resource_type, 0)
@@ -67,9 +72,9 @@ class ResourcesManager:
             return True
 
         # Emit insufficient event
-        if self.events:
-            from ..core.event_manager import GameEvent, ResourceInsufficientEvent
+        from ..core.event_manager import GameEvent, ResourceInsufficientEvent
 
+        if self.events and self.events.has_subscribers(GameEvent.RESOURCE_INSUFFICIENT):
             self.events.emit(
                 GameEvent.RESOURCE_INSUFFICIENT,
                 ResourceInsufficientEvent(
@@ -97,6 +102,10 @@ class ResourcesManager:
 
         return True
 
+    def spend_costs(self, costs: dict[str, int]) -> bool:
+        """Alias of spend_multiple."""
+        return self.spend_multiple(costs)
+
     @property
     def health(self) -> int:
         return self.resources.get("health", 0)
@@ -0,0 +1,103 @@
+"""
+Batched explosion damage.
+
+Explosions from one tick are collected and resolved together instead of
+each blast scanning every enemy:
+
+- The spatial grid is rebuilt once and supplies the enemies near each blast.
+- Falloff (``max(0.5, 1 - d / r * 0.5)``) is worked out per blast and enemy.
+- The hits go to the damage ledger, which applies armor or magic
+  resistance per hit and the summed damage once per enemy.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from ..entities.projectile import Projectile
+from .particle_system import ParticleKind
+
+if TYPE_CHECKING:
+    from ..entities import Enemy, Tower
+    from ..utils.spatial_grid import SpatialGrid
+    from .damage_ledger import DamageLedger
+    from .particle_system import ParticleSystem
+
+
+class Explosions:
+    """
+    Explosions waiting to be resolved this tick.
+
+    Args:
+        grid: Spatial grid for radius queries; rebuilt from the enemies on resolve
+            unless it was already built for the same tick.
+        ledger: Receives the damage of every enemy caught in a blast.
+        particles: Where explosion rings are drawn (optional).
+    """
+
+    def __init__(
+        self,
+        grid: SpatialGrid,
+        ledger: DamageLedger,
+        particles: ParticleSystem | None = None,
+    ) -> None:
+        self.grid = grid
+        self.ledger = ledger
+        self.particles = particles
+        # (x, y, radius, damage, damage_type, source, tower) per blast
+        self._blasts: list[tuple[float, float, float, int, str, str | None, Tower | None]] = []
+
+    def __len__(self) -> int:
+        return len(self._blasts)
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        damage: int,
+        damage_type: str,
+        source: str | None = None,
+        tower: Tower | None = None,
+    ) -> None:
+        """Queue a blast centered at (x, y)."""
+        self._blasts.append((x, y, radius, damage, damage_type, source, tower))
+
+    def clear(self) -> None:
+        self._blasts.clear()
+
+    def resolve(self, enemies: list[Enemy], tick: int | None = None) -> int:
+        """Record all queued blasts against ``enemies``. Returns the number of hits."""
+        blasts = self._blasts
+        if not blasts:
+            return 0
+
+        grid = self.grid
+        grid.rebuild(enemies, tick)
+        record = self.ledger.record
+
+        hits = 0
+        for x, y, radius, damage, damage_type, source, tower in blasts:
+            if radius <= 0:
+                continue
+            for enemy in grid.query_radius((x, y), radius):
+                pos = enemy.pos
+                distance = math.hypot(pos.x - x, pos.y - y)
+                factor = max(0.5, 1 - (distance / radius) * 0.5)
+                record(enemy, int(damage * factor), damage_type, source, tower)
+                hits += 1
+
+        if self.particles is not None:
+            for x, y, radius, *_ in blasts:
+                self.particles.emit(
+                    ParticleKind.RING,
+                    x,
+                    y,
+                    int(radius),
+                    Projectile.EXPLOSION_COLOR,
+                    Projectile.EXPLOSION_DURATION * 1000,
+                )
+
+        blasts.clear()
+        return hits
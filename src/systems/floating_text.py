@@ -0,0 +1,161 @@
+"""
+Floating combat text.
+
+World-level layer for short messages such as "+5", "Slowed" or "DASH!".
+Texts are independent of the entity that produced them, so they stay
+visible after an enemy dies, and their cost does not grow with the number
+of enemies.
+
+- Records come from a free list and go back to it when they expire.
+- Rendered glyphs are cached per (label, color).
+- A text that repeats close by while an earlier copy is still young
+  merges into it and shows a count ("+5 ×3") instead of stacking.
+- At most ``max_visible`` texts are shown; the oldest gives way.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+from ..config.settings import (
+    FLOATING_TEXT_MAX_VISIBLE,
+    FLOATING_TEXT_MERGE_RADIUS,
+    FLOATING_TEXT_MERGE_WINDOW_MS,
+    FLOATING_TEXT_RISE_SPEED,
+)
+
+if TYPE_CHECKING:
+    from ..core.timer_wheel import TimerWheel
+
+# Rendered labels kept before the glyph cache is reset
+GLYPH_CACHE_SIZE: int = 256
+
+
+class FloatingText:
+    """One visible text; instances are reused."""
+
+    __slots__ = ("text", "color", "x", "y", "born_at", "expires_at", "count")
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.color: tuple[int, int, int] = (255, 255, 255)
+        self.x = 0.0
+        self.y = 0.0
+        self.born_at = 0.0
+        self.expires_at = 0.0
+        self.count = 1
+
+    @property
+    def label(self) -> str:
+        return self.text if self.count == 1 else f"{self.text} ×{self.count}"
+
+
+class FloatingTextLayer:
+    """
+    Pooled floating texts on the game clock.
+
+    Args:
+        timers: Provides the game clock (ms), so texts freeze while paused.
+        max_visible: Most texts shown at once.
+    """
+
+    def __init__(self, timers: TimerWheel, max_visible: int = FLOATING_TEXT_MAX_VISIBLE) -> None:
+        self.timers = timers
+        self.max_visible = max_visible
+        self.merge_radius = FLOATING_TEXT_MERGE_RADIUS
+        self.merge_window_ms = FLOATING_TEXT_MERGE_WINDOW_MS
+
+        self.active: list[FloatingText] = []  # Oldest first
+        self._free: list[FloatingText] = []
+        self._glyphs: dict[tuple[str, tuple[int, int, int]], pg.Surface] = {}
+        self._font: pg.font.Font | None = None
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def push(
+        self,
+        text: str,
+        pos: pg.Vector2 | tuple[float, float],
+        color: tuple[int, int, int],
+        lifetime: float = 1.0,
+    ) -> FloatingText:
+        """Show ``text`` at ``pos`` for ``lifetime`` seconds (merging with a recent copy)."""
+        now = self.timers.time
+        x, y = pos[0], pos[1]
+        radius_sq = self.merge_radius * self.merge_radius
+
+        # Newest first: a recent identical text nearby absorbs this one
+        for record in reversed(self.active):
+            if now - record.born_at > self.merge_window_ms:
+                break
+            if record.text == text and record.color == color:
+                dx = record.x - x
+                dy = record.y - y
+                if dx * dx + dy * dy <= radius_sq:
+                    record.count += 1
+                    record.expires_at = max(record.expires_at, now + lifetime * 1000)
+                    return record
+
+        if len(self.active) >= self.max_visible:
+            record = self.active.pop(0)
+        else:
+            record = self._free.pop() if self._free else FloatingText()
+
+        record.text = text
+        record.color = color
+        record.x = x
+        record.y = y
+        record.born_at = now
+        record.expires_at = now + lifetime * 1000
+        record.count = 1
+        self.active.append(record)
+        return record
+
+    def update(self) -> None:
+        """Return expired texts to the pool."""
+        now = self.timers.time
+        active = self.active
+        if not any(record.expires_at <= now for record in active):
+            return
+        alive = []
+        for record in active:
+            if record.expires_at > now:
+                alive.append(record)
+            else:
+                self._free.append(record)
+        self.active = alive
+
+    def clear(self) -> None:
+        self._free.extend(self.active)
+        self.active = []
+
+    def draw(self, surface: pg.Surface) -> None:
+        """Draw texts rising above their position, fading out over their lifetime."""
+        now = self.timers.time
+        rise_per_ms = FLOATING_TEXT_RISE_SPEED / 1000
+        for record in self.active:
+            lifetime = record.expires_at - record.born_at
+            remaining = record.expires_at - now
+            if remaining <= 0 or lifetime <= 0:
+                continue
+            glyph = self._glyph(record.label, record.color)
+            glyph.set_alpha(int(255 * min(1.0, remaining / lifetime)))
+            y = record.y - 20 - (now - record.born_at) * rise_per_ms
+            surface.blit(glyph, (record.x - glyph.get_width() // 2, y))
+
+    def _glyph(self, label: str, color: tuple[int, int, int]) -> pg.Surface:
+        key = (label, color)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            if self._font is None:
+                if not pg.font.get_init():
+                    pg.font.init()
+                self._font = pg.font.Font(None, 24)
+            if len(self._glyphs) >= GLYPH_CACHE_SIZE:
+                self._glyphs.clear()
+            glyph = self._font.render(label, True, color)
+            self._glyphs[key] = glyph
+        return glyph
@@ -0,0 +1,144 @@
+"""
+Analytic resolution of fast shots.
+
+Towers whose projectiles fly at or above ``HITSCAN_SPEED_THRESHOLD``
+(snipers) do not create projectile entities. When such a tower fires, the
+time to impact is solved against the target's walk along its waypoints
+and a damage event is scheduled on the timer wheel; only a short tracer
+line is drawn.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+from ..config.settings import HITSCAN_TRACER_MS
+from .particle_system import ParticleKind
+
+if TYPE_CHECKING:
+    from ..core.timer_wheel import TimerWheel
+    from ..entities import Enemy, Tower, TowerStats
+    from .damage_ledger import DamageLedger
+    from .explosions import Explosions
+    from .particle_system import ParticleSystem
+
+# Refinements of the impact estimate; the target is much slower than the shot
+INTERCEPT_ITERATIONS: int = 3
+
+
+def intercept(
+    origin: pg.Vector2, speed: float, target: Enemy
+) -> tuple[float, tuple[float, float]]:
+    """
+    Flight time (ms) and impact point for a shot at ``speed`` px/ms.
+
+    The target is assumed to keep walking its waypoints at its current speed.
+    """
+    ox, oy = origin.x, origin.y
+    target_speed = target.move_speed()
+    x, y = target.pos.x, target.pos.y
+    flight = math.hypot(x - ox, y - oy) / speed
+    for _ in range(INTERCEPT_ITERATIONS):
+        x, y = target.position_ahead(target_speed * flight)
+        flight = math.hypot(x - ox, y - oy) / speed
+    return flight, (x, y)
+
+
+@dataclass(slots=True)
+class ScheduledHit:
+    """Damage waiting for its impact time."""
+
+    target: Enemy
+    damage: int
+    damage_type: str
+    source: str | None
+    tower: Tower | None
+    explosion_radius: int | None
+
+
+class HitscanSystem:
+    """
+    Schedules fast shots as timed damage instead of projectile entities.
+
+    Args:
+        timers: The world's timer wheel; impacts fire from it.
+        ledger: Records the damage of each impact.
+        explosions: Where explosive shots queue their blasts (optional).
+        particles: Where tracers are drawn (optional).
+    """
+
+    def __init__(
+        self,
+        timers: TimerWheel,
+        ledger: DamageLedger,
+        explosions: Explosions | None = None,
+        particles: ParticleSystem | None = None,
+    ) -> None:
+        self.timers = timers
+        self.ledger = ledger
+        self.explosions = explosions
+        self.particles = particles
+        self.pending = 0
+
+    def fire(
+        self,
+        origin: pg.Vector2,
+        target: Enemy,
+        stats: TowerStats,
+        fire_at: float,
+        tower: Tower | None = None,
+    ) -> float:
+        """Schedule a shot fired at ``fire_at`` (ms); returns its impact time."""
+        flight, (x, y) = intercept(origin, stats.projectile_speed, target)
+        impact_at = max(fire_at + flight, self.timers.time)
+
+        hit = ScheduledHit(
+            target=target,
+            damage=stats.damage,
+            damage_type=stats.damage_type,
+            source=stats.preset_name,
+            tower=tower,
+            explosion_radius=stats.explosion_radius if stats.explosive else None,
+        )
+        self.timers.schedule_at(impact_at, self._impact, hit)
+        self.pending += 1
+
+        if self.particles is not None:
+            self.particles.emit(
+                ParticleKind.TRACER,
+                origin.x,
+                origin.y,
+                max(1, stats.projectile_size // 2),
+                stats.projectile_color1 or (255, 255, 0),
+                HITSCAN_TRACER_MS,
+                x,
+                y,
+            )
+        return impact_at
+
+    def _impact(self, hit: ScheduledHit) -> None:
+        self.pending -= 1
+        target = hit.target
+        target.remove_incoming_damage(hit.damage)
+        if target.is_dead() or target.has_finished():
+            self.ledger.shot(hit.source, hit.tower, wasted=True)
+            return
+
+        self.ledger.shot(hit.source, hit.tower)
+        if hit.explosion_radius is not None and self.explosions is not None:
+            pos = target.pos
+            self.explosions.add(
+                pos.x,
+                pos.y,
+                hit.explosion_radius,
+                hit.damage,
+                hit.damage_type,
+                hit.source,
+                hit.tower,
+            )
+        else:
+            self.ledger.record(target, hit.damage, hit.damage_type, hit.source, hit.tower)
@@ -0,0 +1,169 @@
+"""
+Particle system for short-lived visual effects.
+
+Particles (boss glitch squares, explosion rings, shot tracers) live in a
+fixed-capacity ring buffer of typed arrays instead of one dict per
+particle. Age is not stored: each particle keeps its expiry time on the
+game clock, so nothing has to be updated per particle each tick. Expired
+particles are dropped in batches from the oldest end of the ring.
+
+A per-tick emission budget caps how many particles can be created in one
+tick; emissions over the budget (or over capacity) are counted in
+``dropped`` and skipped.
+"""
+
+from __future__ import annotations
+
+from array import array
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+from ..config.settings import PARTICLE_CAPACITY, PARTICLE_FRAME_BUDGET
+
+if TYPE_CHECKING:
+    from ..core.timer_wheel import TimerWheel
+
+
+class ParticleKind(IntEnum):
+    """How a particle is drawn."""
+
+    SQUARE = 0  # Filled square, size = side length
+    RING = 1  # Circle outline, size = radius
+    TRACER = 2  # Line from (x, y) to (x2, y2), size = width
+
+
+class ParticleSystem:
+    """
+    Fixed-capacity pool of particles stored column-wise in arrays.
+
+    Args:
+        timers: Provides the game clock (ms), so particles freeze while paused.
+        capacity: Maximum live particles; the oldest are dropped when full.
+        frame_budget: Maximum particles emitted per tick.
+    """
+
+    def __init__(
+        self,
+        timers: TimerWheel,
+        capacity: int = PARTICLE_CAPACITY,
+        frame_budget: int = PARTICLE_FRAME_BUDGET,
+    ) -> None:
+        self.timers = timers
+        self.capacity = capacity
+        self.frame_budget = frame_budget
+
+        self._x = array("d", bytes(8 * capacity))
+        self._y = array("d", bytes(8 * capacity))
+        self._x2 = array("d", bytes(8 * capacity))  # Line end (tracers only)
+        self._y2 = array("d", bytes(8 * capacity))
+        self._expires = array("d", bytes(8 * capacity))
+        self._size = array("H", bytes(2 * capacity))
+        self._kind = array("B", bytes(capacity))
+        self._color = array("H", bytes(2 * capacity))  # Index into _palette
+
+        self._palette: list[tuple[int, int, int]] = []
+        self._palette_index: dict[tuple[int, int, int], int] = {}
+
+        self._head = 0  # Oldest live particle
+        self._count = 0
+        self._emitted_this_tick = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def emit(
+        self,
+        kind: ParticleKind,
+        x: float,
+        y: float,
+        size: int,
+        color: tuple[int, int, int],
+        lifetime_ms: float,
+        x2: float = 0.0,
+        y2: float = 0.0,
+    ) -> bool:
+        """Add a particle. Returns False if the tick's budget is used up."""
+        if self._emitted_this_tick >= self.frame_budget:
+            self.dropped += 1
+            return False
+        self._emitted_this_tick += 1
+
+        if self._count == self.capacity:
+            # Full: overwrite the oldest particle
+            self._head = (self._head + 1) % self.capacity
+            self._count -= 1
+            self.dropped += 1
+
+        color_index = self._palette_index.get(color)
+        if color_index is None:
+            color_index = len(self._palette)
+            self._palette.append(color)
+            self._palette_index[color] = color_index
+
+        now = self.timers.time
+        i = (self._head + self._count) % self.capacity
+        self._x[i] = x
+        self._y[i] = y
+        self._x2[i] = x2
+        self._y2[i] = y2
+        self._expires[i] = now + lifetime_ms
+        self._size[i] = max(0, min(65535, int(size)))
+        self._kind[i] = kind
+        self._color[i] = color_index
+        self._count += 1
+        return True
+
+    def update(self) -> None:
+        """Drop expired particles from the old end and reset the emission budget."""
+        self._emitted_this_tick = 0
+
+        now = self.timers.time
+        expires = self._expires
+        head, count, capacity = self._head, self._count, self.capacity
+        while count and expires[head] <= now:
+            head = head + 1 if head + 1 < capacity else 0
+            count -= 1
+        self._head, self._count = head, count
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def draw(self, surface: pg.Surface) -> None:
+        """Draw live particles, oldest first."""
+        now = self.timers.time
+        palette = self._palette
+        xs, ys, sizes, kinds, colors, expires = (
+            self._x,
+            self._y,
+            self._size,
+            self._kind,
+            self._color,
+            self._expires,
+        )
+        capacity = self.capacity
+        i = self._head
+        for _ in range(self._count):
+            # Shorter-lived particles behind an older one may already be expired
+            if expires[i] > now:
+                size = sizes[i]
+                kind = kinds[i]
+                if kind == ParticleKind.RING:
+                    pg.draw.circle(surface, palette[colors[i]], (int(xs[i]), int(ys[i])), size, 2)
+                elif kind == ParticleKind.TRACER:
+                    pg.draw.line(
+                        surface,
+                        palette[colors[i]],
+                        (xs[i], ys[i]),
+                        (self._x2[i], self._y2[i]),
+                        max(1, size),
+                    )
+                else:
+                    half = size // 2
+                    surface.fill(
+                        palette[colors[i]], (int(xs[i]) - half, int(ys[i]) - half, size, size)
+                    )
+            i = i + 1 if i + 1 < capacity else 0
@@ -11,22 +11,27 @@ from typing import TYPE_CHECKING
 
 import pygame as pg
 
+from .status_effects import StatusType
+
 if TYPE_CHECKING:
+    from ..core.timer_wheel import TimerHandle, TimerWheel
     from ..entities import Enemy
+    from .damage_ledger import DamageLedger
     from .economy_system import ResourcesManager
+    from .status_effects import StatusEffects
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityEffect:
     """Tracks an active ability effect."""
 
     active: bool = False
-    timer: float = 0.0
     duration: float = 5.0
     pos: pg.Vector2 | None = None
+    expiry: TimerHandle | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityCost:
     """Cost for using an ability."""
 
@@ -67,6 +72,14 @@ ABILITY_DURATIONS: dict[str, float] = {
     "glue": 5.0,
 }
 
+# How long area statuses last after an enemy leaves the area (seconds)
+ABILITY_STATUS_DURATIONS: dict[str, float] = {
+    "scanner": 1.0,
+    "glue": 2.0,
+}
+
+GLUE_SLOW_FACTOR: float = 0.70
+
 
 class PlayerAbilities:
     """
@@ -76,10 +89,18 @@ class PlayerAbilities:
     - Fireball: Instant AOE damage
     - Scanner: Reveals invisible enemies in radius for duration
     - Disruptor: Silences enemy abilities for duration
-    - Glue: Slows enemies that enter radius
+    - Glue: Slows enemies in radius for duration
+
+    Enemies are affected through status effects and the damage ledger;
+    the area visuals expire on the world's timer wheel.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, timers: TimerWheel, status_effects: StatusEffects, damage: DamageLedger
+    ) -> None:
+        self.timers = timers
+        self.status_effects = status_effects
+        self.damage = damage
         self.selected_ability: str | None = None
 
         # Active effects
@@ -91,8 +112,8 @@ class PlayerAbilities:
 
         # Fireball visual effect
         self.fireball_pos: pg.Vector2 | None = None
-        self.fireball_timer: float = 0.0
         self.fireball_visual_duration: float = 0.5
+        self._fireball_expiry: TimerHandle | None = None
 
     def can_use(self, name: str, resources: ResourcesManager) -> bool:
         """Check if player can afford an ability."""
@@ -145,18 +166,46 @@ class PlayerAbilities:
 
         for enemy in enemies:
             if enemy.pos.distance_to(pos) <= radius:
-                enemy.take_damage(damage)
+                self.damage.record(enemy, damage, source="fireball")
 
         # Visual effect
         self.fireball_pos = pos
-        self.fireball_timer = self.fireball_visual_duration
+        if self._fireball_expiry is not None:
+            self._fireball_expiry.cancel()
+        self._fireball_expiry = self.timers.schedule(
+            self.fireball_visual_duration * 1000, self._clear_fireball
+        )
+
+    def _clear_fireball(self) -> None:
+        self.fireball_pos = None
+        self._fireball_expiry = None
+
+    def _activate(self, name: str, pos: pg.Vector2) -> None:
+        """Start (or restart) an area effect and schedule its expiry."""
+        effect = self.effects[name]
+        if effect.expiry is not None:
+            effect.expiry.cancel()
+        effect.active = True
+        effect.pos = pos
+        effect.expiry = self.timers.schedule(effect.duration * 1000, self._expire, name)
+
+    def _expire(self, name: str) -> None:
+        effect = self.effects[name]
+        effect.active = False
+        effect.pos = None
+        effect.expiry = None
 
     def _use_scanner(self, pos: pg.Vector2) -> None:
         """Scanner: Reveal invisible enemies."""
-        effect = self.effects["scanner"]
-        effect.active = True
-        effect.timer = 0.0
-        effect.pos = pos
+        self._activate("scanner", pos)
+        self.status_effects.add_area(
+            StatusType.REVEAL,
+            pos,
+            ABILITY_RADII["scanner"],
+            ABILITY_DURATIONS["scanner"] * 1000,
+            ABILITY_STATUS_DURATIONS["scanner"] * 1000,
+            source="scanner",
+        )
 
     def _use_disruptor(self, pos: pg.Vector2, enemies: list[Enemy]) -> None:
         """Disruptor: Silence enemy abilities."""
@@ -165,98 +214,29 @@ class PlayerAbilities:
 
         for enemy in enemies:
             if enemy.pos.distance_to(pos) <= radius:
-                # Disable abilities
-                enemy.disabled_abilities = {"active": True, "expires_in": duration}
-                # Visual feedback
-                if hasattr(enemy, "special_texts"):
-                    enemy.special_texts.append(
-                        {
-                            "text": "Silenced!",
-                            "pos": enemy.pos.copy(),
-                            "lifetime": 1.0,
-                            "color": (255, 255, 0),
-                        }
-                    )
-
-        effect = self.effects["disruptor"]
-        effect.active = True
-        effect.timer = 0.0
-        effect.pos = pos
+                self.status_effects.apply(
+                    enemy, StatusType.SILENCE, duration * 1000, source="disruptor"
+                )
+
+        self._activate("disruptor", pos)
 
     def _use_glue(self, pos: pg.Vector2) -> None:
         """Glue: Slow enemies in area."""
-        effect = self.effects["glue"]
-        effect.active = True
-        effect.timer = 0.0
-        effect.pos = pos
-
-    def update(self, dt_ms: float, enemies: list[Enemy]) -> None:
-        """Update active ability effects. dt_ms in milliseconds."""
-        # Fireball visual timer
-        if self.fireball_timer > 0:
-            self.fireball_timer -= dt_ms / 1000.0
-            if self.fireball_timer <= 0:
-                self.fireball_timer = 0
-                self.fireball_pos = None
-
-        # Scanner effect
-        scanner = self.effects["scanner"]
-        if scanner.active and scanner.pos:
-            scanner.timer += dt_ms / 1000.0
-            if scanner.timer >= scanner.duration:
-                scanner.active = False
-                scanner.pos = None
-                scanner.timer = 0.0
-            else:
-                radius = ABILITY_RADII["scanner"]
-                for enemy in enemies:
-                    if getattr(enemy, "is_invisible", False):
-                        if enemy.pos.distance_to(scanner.pos) <= radius:
-                            # Reveal enemy
-                            if hasattr(enemy, "abilities") and hasattr(
-                                enemy.abilities, "remove_ability"
-                            ):
-                                enemy.abilities.remove_ability("invisible")
-                            enemy.is_invisible = False
-
-        # Glue effect
-        glue = self.effects["glue"]
-        if glue.active and glue.pos:
-            glue.timer += dt_ms / 1000.0
-            if glue.timer >= glue.duration:
-                glue.active = False
-                glue.pos = None
-                glue.timer = 0.0
-            else:
-                radius = ABILITY_RADII["glue"]
-                for enemy in enemies:
-                    if enemy.pos.distance_to(glue.pos) <= radius:
-                        if not getattr(enemy, "was_glued", False):
-                            enemy.speed *= 0.70
-                            enemy.was_glued = True
-                            if hasattr(enemy, "special_texts"):
-                                enemy.special_texts.append(
-                                    {
-                                        "text": "Slowed",
-                                        "pos": enemy.pos.copy(),
-                                        "lifetime": 1.0,
-                                        "color": (100, 150, 255),
-                                    }
-                                )
-
-        # Disruptor effect timer
-        disruptor = self.effects["disruptor"]
-        if disruptor.active:
-            disruptor.timer += dt_ms / 1000.0
-            if disruptor.timer >= disruptor.duration:
-                disruptor.active = False
-                disruptor.pos = None
-                disruptor.timer = 0.0
+        self._activate("glue", pos)
+        self.status_effects.add_area(
+            StatusType.SLOW,
+            pos,
+            ABILITY_RADII["glue"],
+            ABILITY_DURATIONS["glue"] * 1000,
+            ABILITY_STATUS_DURATIONS["glue"] * 1000,
+            magnitude=GLUE_SLOW_FACTOR,
+            source="glue",
+        )
 
     def draw(self, surface: pg.Surface) -> None:
         """Draw active ability effects."""
         # Fireball strike indicator
-        if self.fireball_pos and self.fireball_timer > 0:
+        if self.fireball_pos is not None:
             radius = ABILITY_RADII["fireball"]
             pg.draw.circle(
                 surface,
@@ -6,16 +6,19 @@ Handles loading wave data and spawning enemies.
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
 from random import choice, uniform
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from ..core.event_manager import EnemySpawnedEvent, EventManager, GameEvent, WaveStartedEvent
+from ..config.settings import ENEMY_PATH_SPREAD
 from ..entities import Enemy
+from ..entities.enemy_prototype import EnemyPrototype, compile_enemy_prototypes
 from ..utils.path_utils import generate_offset_path
 
 if TYPE_CHECKING:
-    pass
+    from ..core.event_manager import EnemySpawnedEvent, EventManager, GameEvent
 
 
 DEFAULT_INTER_ENEMY_SPAWN_DELAY_MS: int = 500
@@ -42,10 +45,17 @@ class WaveLoader:
     ) -> list[dict]:
         """Load and process all waves for a level."""
         templates = cls.load_enemy_templates(template_path)
-        waves_data = cls.load_waves_file(waves_path)
+        wave_defs = cls.parse_waves(cls.load_waves_file(waves_path), templates)
+        return cls.build_waves(wave_defs, compile_enemy_prototypes(templates), waypoints)
 
-        processed_waves = []
+    @classmethod
+    def parse_waves(cls, waves_data: Any, templates: dict) -> list[dict]:
+        """
+        Validate raw wave JSON into wave definitions.
 
+        Definitions only describe the unit groups (template id, count and
+        delays); enemies are created from them by ``build_waves``.
+        """
         # Sort wave IDs numerically
         if isinstance(waves_data, dict):
             try:
@@ -57,54 +67,61 @@ class WaveLoader:
             print(f"Warning: Expected dict of waves, got {type(waves_data)}")
             return []
 
-        for wave_id in sorted_ids:
-            wave_content = waves_data[wave_id]
-            processed_wave = cls._process_wave(wave_id, wave_content, templates, waypoints)
-            processed_waves.append(processed_wave)
-
-        return processed_waves
+        return [cls._parse_wave(wave_id, waves_data[wave_id], templates) for wave_id in sorted_ids]
 
     @classmethod
-    def _process_wave(
+    def build_waves(
         cls,
-        wave_id: str,
-        wave_content: dict,
-        templates: dict,
+        wave_defs: list[dict],
+        prototypes: dict[str, EnemyPrototype],
         waypoints: dict[str, list[tuple[int, int]]],
-    ) -> dict:
-        """Process a single wave definition."""
-        p_time = wave_content.get("P_time", 10)
-        mode = wave_content.get("mode", 0)
-        passive_gold = wave_content.get("passive_gold", 0)
-        passive_wood = wave_content.get("passive_wood", 0)
-        passive_metal = wave_content.get("passive_metal", 0)
-        unit_definitions = wave_content.get("units", [])
-
-        enemy_groups = []
-
-        for unit_entry in unit_definitions:
-            group = cls._process_unit_entry(unit_entry, wave_id, templates, waypoints)
-            if group:
-                enemy_groups.append(group)
+    ) -> list[dict]:
+        """Create the enemies for parsed wave definitions from compiled prototypes."""
+        processed_waves = []
+
+        for wave_def in wave_defs:
+            enemy_groups = []
+            for group_def in wave_def["groups"]:
+                group = cls._build_group(group_def, prototypes, waypoints)
+                if group:
+                    enemy_groups.append(group)
+
+            processed_waves.append(
+                {
+                    "P_time": wave_def["P_time"],
+                    "mode": wave_def["mode"],
+                    "parallel": wave_def["parallel"],
+                    "enemy_groups": enemy_groups,
+                    "passive_gold": wave_def["passive_gold"],
+                    "passive_wood": wave_def["passive_wood"],
+                    "passive_metal": wave_def["passive_metal"],
+                }
+            )
+
+        return processed_waves
+
+    @classmethod
+    def _parse_wave(cls, wave_id: str, wave_content: dict, templates: dict) -> dict:
+        """Parse a single wave definition."""
+        groups = []
+        for unit_entry in wave_content.get("units", []):
+            group_def = cls._parse_unit_entry(unit_entry, wave_id, templates)
+            if group_def:
+                groups.append(group_def)
 
         return {
-            "P_time": p_time,
-            "mode": mode,
-            "enemy_groups": enemy_groups,
-            "passive_gold": passive_gold,
-            "passive_wood": passive_wood,
-            "passive_metal": passive_metal,
+            "P_time": wave_content.get("P_time", 10),
+            "mode": wave_content.get("mode", 0),
+            "parallel": wave_content.get("parallel", False),  # Groups start together
+            "groups": groups,
+            "passive_gold": wave_content.get("passive_gold", 0),
+            "passive_wood": wave_content.get("passive_wood", 0),
+            "passive_metal": wave_content.get("passive_metal", 0),
         }
 
     @classmethod
-    def _process_unit_entry(
-        cls,
-        unit_entry: list,
-        wave_id: str,
-        templates: dict,
-        waypoints: dict[str, list[tuple[int, int]]],
-    ) -> dict | None:
-        """Process a single unit entry in a wave."""
+    def _parse_unit_entry(cls, unit_entry: list, wave_id: str, templates: dict) -> dict | None:
+        """Parse a single unit entry in a wave."""
         # Parse unit entry format: [enemy_id, count, delay, spawn_delay]
         enemy_id, count, delay_after = -1, 0, 0.0
         inter_spawn_delay = DEFAULT_INTER_ENEMY_SPAWN_DELAY_MS
@@ -123,25 +140,43 @@ class WaveLoader:
             print(f"Warning: Malformed unit entry in wave {wave_id}: {unit_entry}")
             return None
 
-        # Get template
-        str_id = str(enemy_id)
-        if str_id not in templates:
+        if str(enemy_id) not in templates:
             print(f"Warning: Enemy template ID '{enemy_id}' not found")
             return None
 
-        template = dict(templates[str_id])
-        template["id"] = enemy_id
+        if count <= 0:
+            return None
+
+        return {
+            "enemy_id": enemy_id,
+            "count": count,
+            "delay_after_group": delay_after,
+            "inter_enemy_spawn_delay_ms": inter_spawn_delay,
+        }
+
+    @staticmethod
+    def _build_group(
+        group_def: dict,
+        prototypes: dict[str, EnemyPrototype],
+        waypoints: dict[str, list[tuple[int, int]]],
+    ) -> dict | None:
+        """Create the enemies for one unit group."""
+        prototype = prototypes.get(str(group_def["enemy_id"]))
+        if prototype is None:
+            print(f"Warning: Enemy template ID '{group_def['enemy_id']}' not found")
+            return None
 
         # Create enemies
         enemies = []
-        for _ in range(count):
+        for _ in range(group_def["count"]):
             # Random path and offset
             chosen_path = choice(list(waypoints.keys()))
             original_path = waypoints[chosen_path]
-            offset = uniform(-25.0, 25.0)
+            offset = uniform(-ENEMY_PATH_SPREAD, ENEMY_PATH_SPREAD)
             offset_path = generate_offset_path(original_path, offset)
 
-            enemy = Enemy(offset_path, template)
+            enemy = Enemy(offset_path, prototype)
+            enemy.road = chosen_path
             enemies.append(enemy)
 
         if not enemies:
@@ -149,38 +184,48 @@ class WaveLoader:
 
         return {
             "enemies_to_spawn": enemies,
-            "delay_after_group": delay_after,
-            "inter_enemy_spawn_delay_ms": inter_spawn_delay,
+            "delay_after_group": group_def["delay_after_group"],
+            "inter_enemy_spawn_delay_ms": group_def["inter_enemy_spawn_delay_ms"],
         }
 
 
 class SpawnController:
     """
     Controls enemy spawning during waves.
+
+    A wave's groups are compiled into a min-heap of (due time, sequence,
+    enemy) when it starts. Every update pops all spawns due within the
+    step, however many there are. An enemy that was due partway through
+    the step starts as far along its path as it would have walked since.
+
+    Groups follow one another (each after the previous group's
+    ``delay_after_group``), or all start together when the wave sets
+    ``"parallel": true``.
     """
 
     def __init__(self, events: EventManager | None = None) -> None:
+        # Imported here rather than at module level to avoid a cycle through core
+        from ..core.event_manager import EnemySpawnedEvent, GameEvent
+
         self.current_wave_data: dict | None = None
-        self.current_group_idx: int = 0
-        self.spawn_idx_in_group: int = 0
-        self.inter_group_delay_timer: float = 0.0
-        self.time_since_last_spawn: float = 0.0
-        self.wave_prep_timer: float = 0.0
+        self.time: float = 0.0  # Ms since the wave started, preparation included
         self.events = events
+        self._schedule: list[tuple[float, int, Enemy]] = []
         self._current_wave_index: int = 0
+        self._spawned_kind: GameEvent = GameEvent.ENEMY_SPAWNED
+        self._spawned_event: type[EnemySpawnedEvent] = EnemySpawnedEvent
 
     def start_wave(self, wave_data: dict, wave_index: int = 0) -> None:
         """Start spawning a new wave."""
         self.current_wave_data = wave_data
-        self.wave_prep_timer = wave_data.get("P_time", 0) * 1000
-        self.current_group_idx = 0
-        self.spawn_idx_in_group = 0
-        self.inter_group_delay_timer = 0.0
-        self.time_since_last_spawn = 0.0
+        self.time = 0.0
+        self._schedule = self.compile_schedule(wave_data)
         self._current_wave_index = wave_index
 
         # Emit wave started event
         if self.events:
+            from ..core.event_manager import GameEvent, WaveStartedEvent
+
             self.events.emit(
                 GameEvent.WAVE_STARTED,
                 WaveStartedEvent(
@@ -189,78 +234,62 @@ class SpawnController:
                 ),
             )
 
+    @staticmethod
+    def compile_schedule(wave_data: dict) -> list[tuple[float, int, Enemy]]:
+        """Spawn times (ms from wave start) of all enemies in a wave, as a heap."""
+        schedule: list[tuple[float, int, Enemy]] = []
+        sequence = itertools.count()
+        prep_time = wave_data.get("P_time", 0) * 1000
+        parallel = wave_data.get("parallel", False)
+
+        group_start = prep_time
+        for group in wave_data.get("enemy_groups", []):
+            spawn_delay = group.get(
+                "inter_enemy_spawn_delay_ms", DEFAULT_INTER_ENEMY_SPAWN_DELAY_MS
+            )
+            due = group_start
+            for enemy in group["enemies_to_spawn"]:
+                due += spawn_delay
+                schedule.append((due, next(sequence), enemy))
+            if not parallel:
+                group_start = due + group.get("delay_after_group", 0) * 1000.0
+
+        heapq.heapify(schedule)
+        return schedule
+
     def reset(self) -> None:
         """Reset spawn state."""
         self.current_wave_data = None
-        self.current_group_idx = 0
-        self.spawn_idx_in_group = 0
-        self.inter_group_delay_timer = 0.0
-        self.time_since_last_spawn = 0.0
-        self.wave_prep_timer = 0.0
+        self.time = 0.0
+        self._schedule = []
 
     def update(self, dt: float, enemies_list: list[Enemy]) -> bool:
-        """Update spawning. Returns True if wave complete (all spawned and defeated)."""
+        """Spawn every enemy due within ``dt`` ms. Returns True if the wave is complete."""
         if self.current_wave_data is None:
             return True
 
-        # Handle preparation time
-        if self.wave_prep_timer > 0:
-            self.wave_prep_timer -= dt
-            return False
+        self.time += dt
+        schedule = self._schedule
+        events = self.events
+        kind = self._spawned_kind
+        announce = events is not None and events.has_subscribers(kind)
+        while schedule and schedule[0][0] <= self.time:
+            due, _, enemy = heapq.heappop(schedule)
+            enemy.all_enemies = enemies_list
+            enemies_list.append(enemy)
 
-        # Handle inter-group delay
-        if self.inter_group_delay_timer > 0:
-            self.inter_group_delay_timer -= dt
-            if self.inter_group_delay_timer < 0:
-                self.inter_group_delay_timer = 0
-            return False
+            # Catch up on the part of the step since it was due
+            late = self.time - due
+            if late > 0:
+                enemy.advance(enemy.move_speed() * late)
 
-        # Spawn enemies
-        enemy_groups = self.current_wave_data.get("enemy_groups", [])
+            if announce and events is not None:
+                events.emit(kind, self._spawned_event(enemy=enemy))
 
-        if self.current_group_idx < len(enemy_groups):
-            group = enemy_groups[self.current_group_idx]
-            enemies_to_spawn = group["enemies_to_spawn"]
-            spawn_delay = group.get(
-                "inter_enemy_spawn_delay_ms", DEFAULT_INTER_ENEMY_SPAWN_DELAY_MS
-            )
-
-            if self.spawn_idx_in_group < len(enemies_to_spawn):
-                self.time_since_last_spawn += dt
-
-                if self.time_since_last_spawn >= spawn_delay:
-                    # Spawn next enemy
-                    enemy = enemies_to_spawn[self.spawn_idx_in_group]
-                    enemy.all_enemies = enemies_list
-                    enemy.enemies_ref = enemies_list
-                    enemies_list.append(enemy)
-
-                    # Emit enemy spawned event
-                    if self.events:
-                        self.events.emit(
-                            GameEvent.ENEMY_SPAWNED,
-                            EnemySpawnedEvent(enemy=enemy),
-                        )
-
-                    self.spawn_idx_in_group += 1
-                    self.time_since_last_spawn = 0
-            else:
-                # Group complete, move to next
-                self.current_group_idx += 1
-                self.spawn_idx_in_group = 0
-                self.inter_group_delay_timer = group["delay_after_group"] * 1000.0
-
-        # Check if wave is complete
-        all_spawned = self.current_group_idx >= len(enemy_groups)
-        all_dead = len(enemies_list) == 0
-
-        return all_spawned and all_dead
+        # Check if wave is complete (all spawned and defeated)
+        return not schedule and not enemies_list
 
     @property
     def is_spawning(self) -> bool:
         """Check if still spawning enemies."""
-        if self.current_wave_data is None:
-            return False
-
-        enemy_groups = self.current_wave_data.get("enemy_groups", [])
-        return self.current_group_idx < len(enemy_groups)
+        return bool(self._schedule)
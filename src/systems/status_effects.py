@@ -0,0 +1,260 @@
+"""
+Status effects on enemies.
+
+Typed, timed effects (slow, silence, reveal) with per-type stacking rules.
+Every active effect has one entry in a min-heap keyed by expiry, so
+expiring effects costs nothing until one is due. Area effects (glue,
+scanner) find the enemies inside their circle through the tick's shared
+spatial grid. An enemy gets the status when it enters and holds it while
+it stays inside; the held effect is only re-keyed when its expiry comes
+due, and lasts for the area's status duration once the enemy leaves.
+
+Enemies only carry the combined result of their effects:
+
+    - ``slow_factor``: movement speed multiplier (1.0 when not slowed)
+    - ``silenced_until``: game time (ms) until which abilities are disabled
+    - ``revealed``: visible to all towers despite being invisible
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+from ..utils.spatial_grid import SpatialGrid
+
+if TYPE_CHECKING:
+    from ..core.timer_wheel import TimerWheel
+    from ..entities import Enemy
+
+
+class StatusType(Enum):
+    """Kinds of status effects."""
+
+    SLOW = auto()  # magnitude = speed multiplier
+    SILENCE = auto()  # abilities are disabled
+    REVEAL = auto()  # invisible enemy can be targeted by every tower
+
+
+class Stacking(Enum):
+    """How a new effect combines with an active effect of the same type."""
+
+    REFRESH = auto()  # Keep one effect; expiry becomes the later of the two
+    STRONGEST = auto()  # Like REFRESH, but the lower magnitude (stronger slow) wins
+    EXTEND = auto()  # Add the new duration to the remaining one
+
+
+STACKING_RULES: dict[StatusType, Stacking] = {
+    StatusType.SLOW: Stacking.STRONGEST,
+    StatusType.SILENCE: Stacking.REFRESH,
+    StatusType.REVEAL: Stacking.REFRESH,
+}
+
+# Floating text shown when an effect starts
+APPLY_TEXTS: dict[StatusType, tuple[str, tuple[int, int, int]]] = {
+    StatusType.SLOW: ("Slowed", (100, 150, 255)),
+    StatusType.SILENCE: ("Silenced!", (255, 255, 0)),
+}
+
+
+@dataclass(slots=True)
+class StatusEffect:
+    """One active effect on one enemy."""
+
+    kind: StatusType
+    expires_at: float  # Game time in ms
+    magnitude: float = 1.0
+    source: str | None = None
+    held: int = 0  # Areas the enemy stands in; a held effect does not expire
+    hold_ms: float = 0.0  # Expiry is kept this far ahead while held
+
+
+@dataclass(slots=True)
+class AreaEffect:
+    """A circle that keeps applying a status to enemies inside it."""
+
+    kind: StatusType
+    center: pg.Vector2
+    radius: float
+    expires_at: float
+    status_duration_ms: float  # How long the status lasts after leaving the area
+    magnitude: float = 1.0
+    source: str | None = None
+    inside: set[Enemy] = field(default_factory=set)
+
+
+class StatusEffects:
+    """
+    Active status effects for all enemies.
+
+    Uses the timer wheel's clock; expiries are tracked in a heap rather
+    than scheduled as timers because they are refreshed and re-keyed often.
+    """
+
+    def __init__(self, timers: TimerWheel, grid: SpatialGrid | None = None) -> None:
+        self.timers = timers
+        self.grid = grid or SpatialGrid()
+        self.areas: list[AreaEffect] = []
+
+        self._effects: dict[Enemy, dict[StatusType, StatusEffect]] = {}
+        # (expiry, sequence, enemy, effect); the expiry may be stale after a refresh
+        self._heap: list[tuple[float, int, Enemy, StatusEffect]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Number of active (enemy, status) effects."""
+        return sum(len(effects) for effects in self._effects.values())
+
+    def get(self, enemy: Enemy, kind: StatusType) -> StatusEffect | None:
+        effects = self._effects.get(enemy)
+        return effects.get(kind) if effects else None
+
+    def apply(
+        self,
+        enemy: Enemy,
+        kind: StatusType,
+        duration_ms: float,
+        magnitude: float = 1.0,
+        source: str | None = None,
+    ) -> bool:
+        """Apply or stack an effect. Returns True if the enemy did not have it yet."""
+        now = self.timers.time
+        expires_at = now + duration_ms
+        effects = self._effects.setdefault(enemy, {})
+        current = effects.get(kind)
+
+        if current is None:
+            effect = StatusEffect(kind, expires_at, magnitude, source)
+            effects[kind] = effect
+            heapq.heappush(self._heap, (expires_at, next(self._sequence), enemy, effect))
+            self._sync(enemy, effects)
+            text = APPLY_TEXTS.get(kind)
+            if text is not None:
+                enemy.show_text(*text)
+            return True
+
+        rule = STACKING_RULES[kind]
+        if rule is Stacking.EXTEND:
+            current.expires_at += duration_ms
+        else:
+            current.expires_at = max(current.expires_at, expires_at)
+            if rule is Stacking.STRONGEST and magnitude < current.magnitude:
+                current.magnitude = magnitude
+                current.source = source
+        # The heap entry is re-keyed lazily when it comes due
+        self._sync(enemy, effects)
+        return False
+
+    def remove(self, enemy: Enemy, kind: StatusType) -> None:
+        effects = self._effects.get(enemy)
+        if effects and effects.pop(kind, None) is not None:
+            self._sync(enemy, effects)
+
+    def clear(self, enemy: Enemy) -> None:
+        """Forget all effects of an enemy that left the world."""
+        self._effects.pop(enemy, None)
+
+    def add_area(
+        self,
+        kind: StatusType,
+        center: pg.Vector2,
+        radius: float,
+        duration_ms: float,
+        status_duration_ms: float,
+        magnitude: float = 1.0,
+        source: str | None = None,
+    ) -> AreaEffect:
+        """Start an area that applies ``kind`` to enemies inside it for ``duration_ms``."""
+        area = AreaEffect(
+            kind=kind,
+            center=pg.Vector2(center),
+            radius=radius,
+            expires_at=self.timers.time + duration_ms,
+            status_duration_ms=status_duration_ms,
+            magnitude=magnitude,
+            source=source,
+        )
+        self.areas.append(area)
+        return area
+
+    def update(self, enemies: list[Enemy], tick: int | None = None) -> None:
+        """
+        Apply area effects to entering enemies and expire due effects.
+
+        ``tick`` lets the grid be shared with other systems (see ``SpatialGrid.rebuild``).
+        """
+        now = self.timers.time
+
+        areas = self.areas
+        if areas:
+            if any(area.expires_at <= now for area in areas):
+                for area in areas:
+                    if area.expires_at <= now:
+                        for enemy in area.inside:
+                            self._release(enemy, area, area.expires_at)
+                areas = self.areas = [area for area in areas if area.expires_at > now]
+            if areas:
+                self.grid.rebuild(enemies, tick)
+            for area in areas:
+                self._track(area, now)
+
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, enemy, effect = heapq.heappop(heap)
+            effects = self._effects.get(enemy)
+            if not effects or effects.get(effect.kind) is not effect:
+                continue  # Replaced, removed or enemy gone
+            if effect.held and effect.expires_at <= now:
+                # Still inside an area
+                effect.expires_at = now + effect.hold_ms
+                self._sync(enemy, effects)
+            if effect.expires_at > now:
+                # Refreshed since it was pushed
+                heapq.heappush(heap, (effect.expires_at, next(self._sequence), enemy, effect))
+                continue
+            del effects[effect.kind]
+            self._sync(enemy, effects)
+
+    def _track(self, area: AreaEffect, now: float) -> None:
+        """Hold the area's status on enemies that entered and release those that left."""
+        inside = area.inside
+        current: set[Enemy] = set()
+        for enemy in self.grid.query_radius(area.center, area.radius):
+            if enemy.is_dead():
+                continue
+            current.add(enemy)
+            if enemy not in inside:
+                self.apply(enemy, area.kind, area.status_duration_ms, area.magnitude, area.source)
+                effect = self._effects[enemy][area.kind]
+                effect.held += 1
+                effect.hold_ms = max(effect.hold_ms, area.status_duration_ms)
+        for enemy in inside - current:
+            self._release(enemy, area, now)
+        area.inside = current
+
+    def _release(self, enemy: Enemy, area: AreaEffect, released_at: float) -> None:
+        """Let an effect held by ``area`` run out ``status_duration_ms`` after ``released_at``."""
+        effect = self.get(enemy, area.kind)
+        if effect is None or not effect.held:
+            return  # Removed, or the enemy left the world
+        effect.held -= 1
+        expires_at = released_at + area.status_duration_ms
+        if effect.held == 0 and expires_at > effect.expires_at:
+            # The heap entry is re-keyed lazily when it comes due
+            effect.expires_at = expires_at
+            self._sync(enemy, self._effects[enemy])
+
+    def _sync(self, enemy: Enemy, effects: dict[StatusType, StatusEffect]) -> None:
+        """Write the combined effect of ``effects`` onto the enemy."""
+        slow = effects.get(StatusType.SLOW)
+        silence = effects.get(StatusType.SILENCE)
+        enemy.slow_factor = slow.magnitude if slow else 1.0
+        enemy.silenced_until = silence.expires_at if silence else 0.0
+        enemy.revealed = StatusType.REVEAL in effects
+        if not effects:
+            self._effects.pop(enemy, None)
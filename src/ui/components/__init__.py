@@ -1,6 +1,8 @@
 """UI components module."""
 
 from .button import Button
+from .damage_overlay import DamageOverlay
 from .hud import IconHUD
+from .profiler_overlay import ProfilerOverlay
 
-__all__ = ["Button", "IconHUD"]
+__all__ = ["Button", "DamageOverlay", "IconHUD", "ProfilerOverlay"]
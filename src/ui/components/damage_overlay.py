@@ -0,0 +1,78 @@
+"""
+Damage statistics overlay.
+
+Shown between waves: a table of damage, DPS, kills, overkill and wasted
+shots per source, plus a short damage / kills label under each tower.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+if TYPE_CHECKING:
+    from ...entities import Tower
+    from ...systems.damage_ledger import DamageLedger
+
+
+class DamageOverlay:
+    """Draws the damage ledger's counters."""
+
+    COLUMNS: tuple[str, ...] = ("Source", "Damage", "DPS", "Kills", "Overkill", "Wasted")
+    COLUMN_WIDTHS: tuple[int, ...] = (110, 80, 60, 55, 75, 65)
+
+    def __init__(self, x: int = 10, y: int = 80) -> None:
+        self.x = x
+        self.y = y
+        self.font = pg.font.Font(None, 22)
+        self.small_font = pg.font.Font(None, 18)
+        self.row_height = 20
+        self.padding = 8
+
+        self.bg_color = (10, 10, 10, 190)
+        self.header_color = (255, 220, 120)
+        self.text_color = (255, 255, 255)
+
+    def draw(self, surface: pg.Surface, ledger: DamageLedger, towers: list[Tower]) -> None:
+        """Draw the per-source table and per-tower labels."""
+        for tower in towers:
+            stats = tower.damage_stats
+            if stats is None:
+                continue
+            label = self.small_font.render(
+                f"{stats.damage} dmg / {stats.kills} kills", True, self.text_color
+            )
+            surface.blit(label, (tower.pos.x - label.get_width() // 2, tower.pos.y + 14))
+
+        if not ledger.by_source:
+            return
+
+        rows = sorted(ledger.by_source.items(), key=lambda item: -item[1].damage)
+        width = sum(self.COLUMN_WIDTHS) + 2 * self.padding
+        height = (len(rows) + 1) * self.row_height + 2 * self.padding
+
+        panel = pg.Surface((width, height), pg.SRCALPHA)
+        panel.fill(self.bg_color)
+        self._draw_row(panel, 0, self.COLUMNS, self.header_color)
+        for i, (source, stats) in enumerate(rows, start=1):
+            overkill = stats.overkill * 100 // (stats.damage + stats.overkill or 1)
+            values = (
+                source,
+                str(stats.damage),
+                f"{stats.dps(ledger.combat_ms):.1f}",
+                str(stats.kills),
+                f"{overkill}%",
+                f"{stats.wasted_shots}/{stats.shots}",
+            )
+            self._draw_row(panel, i, values, self.text_color)
+        surface.blit(panel, (self.x, self.y))
+
+    def _draw_row(
+        self, panel: pg.Surface, row: int, values: tuple[str, ...], color: tuple[int, int, int]
+    ) -> None:
+        x = self.padding
+        y = self.padding + row * self.row_height
+        for value, column_width in zip(values, self.COLUMN_WIDTHS, strict=True):
+            panel.blit(self.font.render(value, True, color), (x, y))
+            x += column_width
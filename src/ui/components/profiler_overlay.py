@@ -0,0 +1,85 @@
+"""
+Profiler overlay.
+
+A small readout in the bottom-left corner: frame rate, simulation rate
+and speed, garbage collector activity (collections per generation,
+pause times, frozen objects) and frame hitches.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+from ...config.settings import SIM_RATE_HZ
+
+if TYPE_CHECKING:
+    from ...core.game_world import GameWorld
+    from ...core.gc_manager import GCManager
+    from ...core.hitch_detector import HitchDetector
+
+
+class ProfilerOverlay:
+    """Draws frame, simulation and GC statistics."""
+
+    def __init__(self, x: int = 10, bottom: int = 10) -> None:
+        self.x = x
+        self.bottom = bottom
+        self.font = pg.font.Font(None, 24)
+        self.line_height = 20
+        self.padding = 6
+
+        self.bg_color = (10, 10, 10, 170)
+        self.text_color = (255, 255, 255)
+
+    def lines(
+        self,
+        fps: float,
+        world: GameWorld,
+        gc_manager: GCManager | None,
+        hitches: HitchDetector | None = None,
+    ) -> list[str]:
+        """The overlay's text, one entry per line."""
+        lines = [
+            f"FPS: {fps:.1f}",
+            f"Sim: {SIM_RATE_HZ} Hz x{world.game_speed:g}, tick {world.tick}",
+        ]
+        if gc_manager is not None:
+            gen0, gen1, gen2 = gc_manager.collections
+            lines.append(f"GC gen0/1/2: {gen0}/{gen1}/{gen2}, frozen {gc_manager.frozen:,}")
+            lines.append(
+                f"GC pause last {gc_manager.last_pause_ms:.2f} ms, "
+                f"max {gc_manager.max_pause_ms:.2f} ms, wave {gc_manager.wave_pause_ms:.1f} ms"
+            )
+        if hitches is not None:
+            line = f"Hitches >{hitches.budget_ms:g} ms: {hitches.hitch_count}"
+            if hitches.hitches:
+                last = hitches.hitches[-1]
+                sections = last["sections"]
+                slowest = max(sections, key=sections.get) if sections else "?"
+                line += f", last {last['total_ms']:.0f} ms ({slowest})"
+            lines.append(line)
+        return lines
+
+    def draw(
+        self,
+        surface: pg.Surface,
+        fps: float,
+        world: GameWorld,
+        gc_manager: GCManager | None = None,
+        hitches: HitchDetector | None = None,
+    ) -> None:
+        """Draw the readout anchored to the bottom-left corner."""
+        rendered = [
+            self.font.render(line, True, self.text_color)
+            for line in self.lines(fps, world, gc_manager, hitches)
+        ]
+        width = max(text.get_width() for text in rendered) + 2 * self.padding
+        height = len(rendered) * self.line_height + 2 * self.padding
+
+        panel = pg.Surface((width, height), pg.SRCALPHA)
+        panel.fill(self.bg_color)
+        for i, text in enumerate(rendered):
+            panel.blit(text, (self.padding, self.padding + i * self.line_height))
+        surface.blit(panel, (self.x, surface.get_height() - height - self.bottom))
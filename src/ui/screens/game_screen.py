@@ -8,22 +8,36 @@ This is now a thin UI layer that delegates game logic to GameWorld.
 from __future__ import annotations
 
 import json
+import time
 from typing import TYPE_CHECKING
 
 import pygame as pg
 
 from ...config import GAME_HEIGHT, GAME_WIDTH
 from ...config.paths import ASSETS_DIR, DATA_DIR
+from ...config.settings import (
+    FACTORY_COSTS,
+    FACTORY_PAYOUTS,
+    MAX_SIM_STEPS_PER_FRAME,
+    MAX_UI_GAME_SPEED,
+    TOWER_COSTS,
+    TOWER_UPGRADE_COST,
+)
 from ...core.event_manager import (
     EventManager,
     GameEvent,
     TowerBuiltEvent,
     FactoryBuiltEvent,
+    WaveCompletedEvent,
     WaveStartedEvent,
 )
 from ...core.game_world import GamePhase, GameWorld, GameWorldConfig
+from ...core.gc_manager import GCManager
+from ...core.hitch_detector import HitchDetector
 from ...systems import BuildingBlueprint, BuildManager
 from ..components.button import Button
+from ..components.damage_overlay import DamageOverlay
+from ..components.profiler_overlay import ProfilerOverlay
 from ..ui_manager import UIManager
 from .base_screen import BaseScreen
 
@@ -55,8 +69,11 @@ class GameScreen(BaseScreen):
             GameWorldConfig(
                 level_config=self.level_config,
                 events=None,  # GameWorld creates its own EventManager
+                trace_dir=context.trace_dir,
+                max_game_speed=MAX_UI_GAME_SPEED,
             )
         )
+        self.normal_speed = 1.0  # Speed to return to when fast-forward is toggled off
 
         # Keep reference to events for UI subscriptions
         self.events = self.world.events
@@ -72,11 +89,16 @@ class GameScreen(BaseScreen):
         self.ui = UIManager()
         self._setup_ui()
 
-        # Debug toggles
+        # Debug toggles (F shows the profiler overlay, P starts and stops stack sampling)
         self.show_fps = False
+        self.profiler_overlay = ProfilerOverlay()
         self.show_roads = False
         self.show_tower_ranges = False
 
+        # Damage statistics, shown between waves
+        self.show_damage_stats = True
+        self.damage_overlay = DamageOverlay()
+
         # Pause menu
         self._setup_pause_menu()
         self._setup_speed_controls()
@@ -84,11 +106,20 @@ class GameScreen(BaseScreen):
         # Subscribe to events for UI updates
         self._setup_event_subscriptions()
 
+        # Collector policy: freezes the loaded level on entry and defers
+        # full collections during waves
+        self.gc_manager = GCManager(self.world.instrumentation)
+
+        # Slow-frame reports with a per-subsystem breakdown
+        self.hitches = HitchDetector(context.hitch_budget_ms, report_path=context.hitch_report)
+        self.world.hitches = self.hitches
+
     def _setup_event_subscriptions(self) -> None:
         """Set up event subscriptions for UI updates."""
         self.events.subscribe(GameEvent.TOWER_BUILT, self._on_tower_built)
         self.events.subscribe(GameEvent.FACTORY_BUILT, self._on_factory_built)
         self.events.subscribe(GameEvent.WAVE_STARTED, self._on_wave_started)
+        self.events.subscribe(GameEvent.WAVE_COMPLETED, self._on_wave_completed)
         self.events.subscribe(GameEvent.GAME_OVER, self._on_game_over)
 
     def _on_tower_built(self, data: TowerBuiltEvent) -> None:
@@ -104,7 +135,11 @@ class GameScreen(BaseScreen):
     def _on_wave_started(self, data: WaveStartedEvent) -> None:
         """Handle wave started - update UI."""
         # Future: Play sound, show wave announcement
-        pass
+        self.gc_manager.wave_started()
+
+    def _on_wave_completed(self, data: WaveCompletedEvent) -> None:
+        """Handle wave completed - run the collection deferred during the wave."""
+        self.gc_manager.wave_ended()
 
     def _on_game_over(self, data) -> None:
         """Handle game over - transition to ending screen."""
@@ -125,8 +160,15 @@ class GameScreen(BaseScreen):
             )
         )
 
+    def on_enter(self) -> None:
+        """Freeze the loaded level (after the previous screen has released its objects)."""
+        self.gc_manager.level_loaded()
+
     def on_exit(self) -> None:
         """Clean up when leaving this screen."""
+        self.gc_manager.close()
+        self.hitches.close()
+        self.world.close()
         self.events.clear()
 
     def _load_ui_assets(self) -> None:
@@ -160,32 +202,32 @@ class GameScreen(BaseScreen):
             BuildingBlueprint(
                 "Metal Factory",
                 factory_metal_img,
-                {"gold": 50},
+                FACTORY_COSTS["metal"],
                 40,
                 40,
                 self.world.build_manager.build_factory,
                 resource="metal",
-                payout_per_wave=10,
+                payout_per_wave=FACTORY_PAYOUTS["metal"],
             ),
             BuildingBlueprint(
                 "Wood Factory",
                 factory_wood_img,
-                {"gold": 35},
+                FACTORY_COSTS["wood"],
                 40,
                 40,
                 self.world.build_manager.build_factory,
                 resource="wood",
-                payout_per_wave=15,
+                payout_per_wave=FACTORY_PAYOUTS["wood"],
             ),
         ]
 
         # All tower blueprints
         all_towers = [
-            {"name": "Tower - basic", "image": tower_basic_img, "cost": {"gold": 50}, "type": "basic"},
-            {"name": "Tower - cannon", "image": tower_cannon_img, "cost": {"gold": 150, "wood": 70, "metal": 20}, "type": "cannon"},
-            {"name": "Tower - flame", "image": tower_flame_img, "cost": {"gold": 200, "wood": 90}, "type": "flame"},
-            {"name": "Tower - rapid", "image": tower_rapid_img, "cost": {"gold": 150, "wood": 10}, "type": "rapid"},
-            {"name": "Tower - sniper", "image": tower_sniper_img, "cost": {"gold": 200, "metal": 15}, "type": "sniper"},
+            {"name": "Tower - basic", "image": tower_basic_img, "cost": TOWER_COSTS["basic"], "type": "basic"},
+            {"name": "Tower - cannon", "image": tower_cannon_img, "cost": TOWER_COSTS["cannon"], "type": "cannon"},
+            {"name": "Tower - flame", "image": tower_flame_img, "cost": TOWER_COSTS["flame"], "type": "flame"},
+            {"name": "Tower - rapid", "image": tower_rapid_img, "cost": TOWER_COSTS["rapid"], "type": "rapid"},
+            {"name": "Tower - sniper", "image": tower_sniper_img, "cost": TOWER_COSTS["sniper"], "type": "sniper"},
         ]
 
         # Filter by level config
@@ -213,7 +255,7 @@ class GameScreen(BaseScreen):
             self.upgrade_blueprint = BuildingBlueprint(
                 "Tower Upgrade",
                 tower_basic_img,
-                {"gold": 150, "wood": 50},
+                TOWER_UPGRADE_COST,
                 40,
                 40,
                 self.world.build_manager.upgrade_tower,
@@ -386,6 +428,23 @@ class GameScreen(BaseScreen):
                 self.show_roads = not self.show_roads
             elif event.key == pg.K_v:
                 self.show_tower_ranges = not self.show_tower_ranges
+            elif event.key == pg.K_d:
+                self.show_damage_stats = not self.show_damage_stats
+            elif event.key == pg.K_t:
+                self.world.cycle_tower_priority(self.context.mouse_pos)
+            elif event.key == pg.K_TAB:
+                self._toggle_fast_forward()
+            elif event.key == pg.K_p:
+                if self.context.profiler.toggle():
+                    print(f"Profiling every {self.context.profiler.interval_ms:g} ms (P to stop)")
+
+    def _toggle_fast_forward(self) -> None:
+        """Switch between the top UI speed and the speed used before it."""
+        if self.world.game_speed < MAX_UI_GAME_SPEED:
+            self.normal_speed = self.world.game_speed
+            self.world.set_game_speed(MAX_UI_GAME_SPEED)
+        else:
+            self.world.set_game_speed(self.normal_speed)
 
     # -------------------------------------------------------------------------
     # Update
@@ -394,10 +453,14 @@ class GameScreen(BaseScreen):
     def update(self, dt: float) -> None:
         """Update game state."""
         if self.is_paused:
+            # Still deliver queued UI events (e.g. GAME_PAUSED) while the world is frozen
+            self.events.flush()
             return
 
-        # Delegate all game logic to GameWorld
-        self.world.update(dt)
+        # Delegate all game logic to GameWorld (several ticks per frame when sped up);
+        # the world adds its per-subsystem times to the frame record
+        self.hitches.begin_frame()
+        self.world.update(dt, max_steps=MAX_SIM_STEPS_PER_FRAME)
 
     # -------------------------------------------------------------------------
     # Rendering
@@ -405,6 +468,8 @@ class GameScreen(BaseScreen):
 
     def render(self, surface: pg.Surface) -> None:
         """Render the game."""
+        started = time.perf_counter()
+
         # Background
         surface.fill("black")
         surface.blit(self.map_img, (0, 0))
@@ -431,18 +496,29 @@ class GameScreen(BaseScreen):
         # Towers
         self.world.build_manager.draw_towers(surface, self.show_tower_ranges)
 
-        # Enemies
+        # Enemies and projectiles, drawn between the last two simulation ticks
+        alpha = self.world.interpolation
         for enemy in self.world.enemies:
-            enemy.draw(surface)
+            enemy.draw(surface, alpha)
 
         # Projectiles
         for proj in self.world.projectiles:
-            proj.draw(surface)
+            proj.draw(surface, alpha)
+
+        # Explosion rings, glitches
+        self.world.particles.draw(surface)
+
+        # Floating combat text
+        self.world.floating_texts.draw(surface)
 
         # Player ability effects
         if self.world.abilities_enabled:
             self.world.player_abilities.draw(surface)
 
+        # Damage statistics (build phase)
+        if self.show_damage_stats and self.world.phase == GamePhase.BUILD:
+            self.damage_overlay.draw(surface, self.world.damage, self.world.towers)
+
         # Ghost preview
         if self.selected_blueprint:
             self.selected_blueprint.draw_ghost(
@@ -459,11 +535,11 @@ class GameScreen(BaseScreen):
             self.start_wave_button.text = f"Start Wave {self.world.current_wave + 1}"
             self.start_wave_button.draw(surface)
 
-        # FPS
+        # Profiler overlay (FPS, simulation, GC pauses)
         if self.show_fps:
-            fps_font = pg.font.Font(None, 30)
-            fps_text = fps_font.render(f"FPS: {self.context.clock.get_fps():.2f}", True, (255, 255, 255))
-            surface.blit(fps_text, (10, surface.get_height() - 30))
+            self.profiler_overlay.draw(
+                surface, self.context.clock.get_fps(), self.world, self.gc_manager, self.hitches
+            )
 
         # Pause button
         self.ui.draw_pause_button(surface, mouse_pos=self.context.mouse_pos)
@@ -479,9 +555,18 @@ class GameScreen(BaseScreen):
         # Speed controls
         self.slow_button.draw(surface)
         self.fast_button.draw(surface)
-        speed_text = self.speed_font.render(f"{self.world.game_speed:.2f}x", True, (255, 255, 255))
+        speed_text = self.speed_font.render(f"{self.world.game_speed:g}x", True, (255, 255, 255))
         surface.blit(speed_text, (GAME_WIDTH - 130, GAME_HEIGHT - 52))
 
+        self.hitches.add_time("render", time.perf_counter() - started)
+        self.hitches.end_frame({
+            "enemies": len(self.world.enemies),
+            "projectiles": len(self.world.projectiles),
+            "towers": len(self.world.towers),
+            "particles": len(self.world.particles),
+            "timers": len(self.world.timers),
+        })
+
     # -------------------------------------------------------------------------
     # Level Management
     # -------------------------------------------------------------------------
@@ -511,6 +596,7 @@ class GameScreen(BaseScreen):
     def _save_levels_config(self) -> None:
         """Save levels config to file."""
         config_path = DATA_DIR / "levels_config.json"
+        self.hitches.note("level_config_saves")
         try:
             with open(config_path, "w") as f:
                 json.dump(self.context.levels_config, f, indent=4)
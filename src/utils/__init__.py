@@ -3,11 +3,17 @@ Utilities package.
 """
 
 from .asset_loader import AssetLoader
-from .path_utils import generate_offset_path
+from .data_bundle import DataBundle, get_data_bundle
+from .path_utils import PathTrack, generate_offset_path
+from .spatial_grid import SpatialGrid
 from .waypoint_loader import load_waypoints
 
 __all__ = [
+    "DataBundle",
+    "get_data_bundle",
+    "PathTrack",
     "generate_offset_path",
+    "SpatialGrid",
     "load_waypoints",
     "AssetLoader",
 ]
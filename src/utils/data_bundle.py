@@ -0,0 +1,323 @@
+"""
+Compiled data bundle.
+
+Validates every ``data/*.json`` file once and stores the parsed result
+(enemy templates, tower presets, level config, waypoints, road segments,
+path tracks and wave definitions) in a single pickle file keyed by a hash
+of the JSON contents. Later runs load the bundle with one read; when any
+JSON file changes the bundle is stale and gets rebuilt from the JSON files.
+
+Build step (optional, the game also rebuilds automatically):
+    python tools/build_data_bundle.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..config.paths import (
+    DATA_DIR,
+    ENEMY_TEMPLATES_FILENAME,
+    LEVELS_CONFIG_FILENAME,
+    TOWER_PRESETS_FILENAME,
+)
+from .path_utils import PathTrack
+
+if TYPE_CHECKING:
+    from ..entities.enemy_prototype import EnemyPrototype
+    from ..entities.tower import TowerStats
+
+# Bump when the bundle layout or any parser changes
+BUNDLE_VERSION: int = 4
+BUNDLE_FILENAME: str = "data_bundle.pickle"
+
+# Template fields that must be numbers when present
+_TEMPLATE_NUMBER_FIELDS: tuple[str, ...] = (
+    "health",
+    "speed",
+    "armor",
+    "magic_resistance",
+    "damage",
+    "attack_range",
+    "attack_speed",
+    "radius",
+    "gold_reward",
+)
+
+Waypoints = dict[str, list[tuple[int, int]]]
+RoadSegments = list[tuple[tuple[int, int], tuple[int, int]]]
+
+
+@dataclass
+class DataBundle:
+    """Parsed game data, keyed by data file name where a level refers to a file."""
+
+    content_hash: str
+    # File name -> (size, mtime_ns) of the JSON files the bundle was built from
+    sources: dict[str, tuple[int, int]] = field(default_factory=dict)
+    enemy_templates: dict[str, dict[str, Any]] = field(default_factory=dict)
+    enemy_prototypes: dict[str, EnemyPrototype] = field(default_factory=dict)
+    tower_presets: dict[str, TowerStats] = field(default_factory=dict)
+    levels_config: list[dict] | None = None
+    waypoints: dict[str, Waypoints] = field(default_factory=dict)
+    road_segments: dict[str, RoadSegments] = field(default_factory=dict)
+    path_tracks: dict[str, dict[str, PathTrack]] = field(default_factory=dict)
+    waves: dict[str, list[dict]] = field(default_factory=dict)
+
+
+# -----------------------------------------------------------------------------
+# Hashing
+# -----------------------------------------------------------------------------
+
+
+def _data_files(data_dir: Path) -> list[Path]:
+    return sorted(data_dir.glob("*.json"))
+
+
+def _stat_signature(files: list[Path]) -> dict[str, tuple[int, int]]:
+    signature = {}
+    for path in files:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        signature[path.name] = (st.st_size, st.st_mtime_ns)
+    return signature
+
+
+def compute_content_hash(files: list[Path]) -> str:
+    """Hash the bundle version and the names and contents of the given files."""
+    digest = hashlib.sha256(f"v{BUNDLE_VERSION}".encode())
+    for path in files:
+        digest.update(path.name.encode())
+        digest.update(b"\0")
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            pass
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# Building
+# -----------------------------------------------------------------------------
+
+
+def _read_json(data_dir: Path, filename: str) -> Any:
+    path = data_dir / filename
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: Data file not found: {path}")
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: Could not load {path}: {e}")
+    return None
+
+
+def validate_enemy_templates(raw: Any) -> dict[str, dict[str, Any]]:
+    """Check enemy templates, dropping entries that the Enemy class cannot use."""
+    if not isinstance(raw, dict):
+        print("Warning: Enemy templates must be a JSON object")
+        return {}
+
+    templates: dict[str, dict[str, Any]] = {}
+    for key, template in raw.items():
+        if not isinstance(template, dict):
+            print(f"Warning: Skipping enemy template '{key}': not an object")
+            continue
+
+        bad = [
+            name
+            for name in _TEMPLATE_NUMBER_FIELDS
+            if name in template
+            and (isinstance(template[name], bool) or not isinstance(template[name], (int, float)))
+        ]
+        if bad:
+            print(f"Warning: Skipping enemy template '{key}': invalid {', '.join(bad)}")
+            continue
+
+        abilities = template.get("abilities", [])
+        if not isinstance(abilities, list) or not all(isinstance(a, str) for a in abilities):
+            print(f"Warning: Skipping enemy template '{key}': abilities must be a list of names")
+            continue
+
+        templates[str(key)] = template
+
+    return templates
+
+
+def _parse_waypoints(raw: Any, filename: str) -> Waypoints | None:
+    if not isinstance(raw, dict):
+        print(f"Warning: Waypoints file {filename} must be a JSON object")
+        return None
+    try:
+        return {name: [(int(p[0]), int(p[1])) for p in points] for name, points in raw.items()}
+    except (TypeError, ValueError, IndexError) as e:
+        print(f"Warning: Invalid waypoints in {filename}: {e}")
+        return None
+
+
+def build_data_bundle(data_dir: Path = DATA_DIR) -> DataBundle:
+    """Read and validate all data files into a new bundle."""
+    from ..config import DEFAULT_LEVELS_CONFIG
+    from ..entities.enemy_prototype import compile_enemy_prototypes
+    from ..entities.tower import parse_tower_presets
+    from ..systems.build_manager import BuildManager
+    from ..systems.spawn_system import WaveLoader
+
+    files = _data_files(data_dir)
+    bundle = DataBundle(
+        content_hash=compute_content_hash(files),
+        sources=_stat_signature(files),
+    )
+
+    bundle.enemy_templates = validate_enemy_templates(
+        _read_json(data_dir, ENEMY_TEMPLATES_FILENAME) or {}
+    )
+    bundle.enemy_prototypes = compile_enemy_prototypes(bundle.enemy_templates)
+
+    raw_presets = _read_json(data_dir, TOWER_PRESETS_FILENAME)
+    if isinstance(raw_presets, dict):
+        bundle.tower_presets = parse_tower_presets(raw_presets)
+
+    levels = _read_json(data_dir, LEVELS_CONFIG_FILENAME)
+    if isinstance(levels, list) and all(isinstance(level, dict) for level in levels):
+        bundle.levels_config = levels
+    elif levels is not None:
+        print(f"Warning: {LEVELS_CONFIG_FILENAME} must be a list of level objects")
+
+    # Level files referenced by the config (or the defaults if it is missing)
+    for level in bundle.levels_config or DEFAULT_LEVELS_CONFIG:
+        waypoints_file = level.get("waypoints_path")
+        if waypoints_file and waypoints_file not in bundle.waypoints:
+            waypoints = _parse_waypoints(_read_json(data_dir, waypoints_file), waypoints_file)
+            if waypoints is not None:
+                bundle.waypoints[waypoints_file] = waypoints
+                bundle.road_segments[waypoints_file] = BuildManager.generate_road_segments(
+                    waypoints
+                )
+                bundle.path_tracks[waypoints_file] = {
+                    name: PathTrack(points) for name, points in waypoints.items()
+                }
+
+        waves_file = level.get("waves_path")
+        if waves_file and waves_file not in bundle.waves:
+            raw_waves = _read_json(data_dir, waves_file)
+            if raw_waves is not None:
+                bundle.waves[waves_file] = WaveLoader.parse_waves(
+                    raw_waves, bundle.enemy_templates
+                )
+
+    return bundle
+
+
+# -----------------------------------------------------------------------------
+# Bundle file
+# -----------------------------------------------------------------------------
+
+
+def default_bundle_path(data_dir: Path = DATA_DIR) -> Path:
+    return data_dir / ".cache" / BUNDLE_FILENAME
+
+
+def save_data_bundle(bundle: DataBundle, path: Path) -> None:
+    """Write the bundle atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump((BUNDLE_VERSION, bundle), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_data_bundle(path: Path, data_dir: Path = DATA_DIR) -> DataBundle | None:
+    """
+    Load a bundle file if it still matches the JSON files.
+
+    File stats are compared first; only if they differ are the files hashed,
+    so touching a file without changing it does not force a rebuild.
+    Returns None when the bundle is missing, unreadable or stale.
+    """
+    try:
+        with open(path, "rb") as f:
+            version, bundle = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable data bundle {path}: {e}")
+        return None
+
+    if version != BUNDLE_VERSION or not isinstance(bundle, DataBundle):
+        return None
+
+    files = _data_files(data_dir)
+    signature = _stat_signature(files)
+    if signature == bundle.sources:
+        return bundle
+    if compute_content_hash(files) == bundle.content_hash:
+        bundle.sources = signature
+        return bundle
+    return None
+
+
+# In-process cache
+_bundle: DataBundle | None = None
+_bundle_dir: Path | None = None
+
+
+def get_data_bundle(data_dir: Path = DATA_DIR) -> DataBundle:
+    """
+    Get the current data bundle.
+
+    Reuses the in-memory bundle while the data files are unchanged, then
+    tries the bundle file and finally rebuilds from JSON (saving the result).
+    """
+    global _bundle, _bundle_dir
+
+    if (
+        _bundle is not None
+        and _bundle_dir == data_dir
+        and _stat_signature(_data_files(data_dir)) == _bundle.sources
+    ):
+        return _bundle
+
+    path = default_bundle_path(data_dir)
+    bundle = load_data_bundle(path, data_dir)
+    if bundle is None:
+        bundle = build_data_bundle(data_dir)
+        try:
+            save_data_bundle(bundle, path)
+        except OSError as e:
+            print(f"Warning: Could not write data bundle {path}: {e}")
+
+    _bundle = bundle
+    _bundle_dir = data_dir
+    return bundle
+
+
+def clear_data_bundle_cache() -> None:
+    """Forget the in-memory bundle."""
+    global _bundle, _bundle_dir
+    _bundle = None
+    _bundle_dir = None
+
+
+def main() -> int:
+    """Rebuild the bundle file from the JSON data files."""
+    bundle = build_data_bundle()
+    path = default_bundle_path()
+    save_data_bundle(bundle, path)
+    print(
+        f"Wrote {path} ({path.stat().st_size} bytes, hash {bundle.content_hash[:12]}): "
+        f"{len(bundle.enemy_templates)} enemy templates, "
+        f"{len(bundle.tower_presets)} tower presets, "
+        f"{len(bundle.waypoints)} waypoint files, {len(bundle.waves)} wave files"
+    )
+    return 0
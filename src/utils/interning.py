@@ -0,0 +1,33 @@
+"""
+Interning of small immutable values shared by many entities.
+
+Thousands of live enemies and projectiles carry the same colors and names;
+interning makes them all reference one object instead of a copy each.
+"""
+
+import sys
+from collections.abc import Sequence
+
+# Upper bound for the color table (projectile colors can be randomized)
+MAX_INTERNED_COLORS: int = 4096
+
+Color = tuple[int, int, int]
+
+_colors: dict[Color, Color] = {}
+
+
+def intern_color(color: Sequence[int]) -> Color:
+    """Return the shared tuple for an RGB color."""
+    r, g, b = color
+    key = (r, g, b)
+    shared = _colors.get(key)
+    if shared is None:
+        if len(_colors) >= MAX_INTERNED_COLORS:
+            return key
+        shared = _colors[key] = key
+    return shared
+
+
+def intern_str(value: str) -> str:
+    """Return the interned copy of a name (shape, preset, ability, ...)."""
+    return sys.intern(value)
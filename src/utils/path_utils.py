@@ -2,6 +2,7 @@
 Path generation utilities.
 """
 
+import bisect
 import math
 from collections.abc import Sequence
 
@@ -118,3 +119,114 @@ def point_on_path(path: Sequence[tuple[int, int]], distance: float) -> tuple[flo
 
     # Past end of path
     return float(path[-1][0]), float(path[-1][1])
+
+
+class PathTrack:
+    """
+    A polyline with precomputed cumulative arc lengths.
+
+    Lets callers convert between distance travelled along the path and
+    position without re-walking the segments every time.
+    """
+
+    __slots__ = ("points", "cumulative", "length")
+
+    def __init__(self, points: Sequence[tuple[float, float]]) -> None:
+        self.points: tuple[tuple[float, float], ...] = tuple(
+            (float(p[0]), float(p[1])) for p in points
+        )
+        cumulative = [0.0]
+        for i in range(len(self.points) - 1):
+            x1, y1 = self.points[i]
+            x2, y2 = self.points[i + 1]
+            cumulative.append(cumulative[-1] + math.hypot(x2 - x1, y2 - y1))
+        self.cumulative: tuple[float, ...] = tuple(cumulative)
+        self.length: float = cumulative[-1]
+
+    def __getstate__(self) -> tuple:
+        return self.points, self.cumulative, self.length
+
+    def __setstate__(self, state: tuple) -> None:
+        self.points, self.cumulative, self.length = state
+
+    def segment_index(self, distance: float) -> int:
+        """Index of the segment containing the given arc length."""
+        if distance <= 0 or len(self.points) < 2:
+            return 0
+        index = bisect.bisect_right(self.cumulative, distance) - 1
+        return min(index, len(self.points) - 2)
+
+    def position_at(self, distance: float) -> tuple[float, float]:
+        """Interpolated (x, y) position at an arc length along the path."""
+        if len(self.points) < 2 or distance <= 0:
+            return self.points[0] if self.points else (0.0, 0.0)
+        if distance >= self.length:
+            return self.points[-1]
+
+        i = self.segment_index(distance)
+        x1, y1 = self.points[i]
+        x2, y2 = self.points[i + 1]
+        seg_len = self.cumulative[i + 1] - self.cumulative[i]
+        t = (distance - self.cumulative[i]) / seg_len if seg_len > 0 else 0.0
+        return x1 + t * (x2 - x1), y1 + t * (y2 - y1)
+
+    def project(self, segment: int, x: float, y: float) -> float:
+        """Arc length of the point (x, y) projected onto the given segment."""
+        if len(self.points) < 2:
+            return 0.0
+        i = min(max(segment, 0), len(self.points) - 2)
+        x1, y1 = self.points[i]
+        x2, y2 = self.points[i + 1]
+        dx = x2 - x1
+        dy = y2 - y1
+        seg_sq = dx * dx + dy * dy
+        if seg_sq == 0:
+            return self.cumulative[i]
+        t = ((x - x1) * dx + (y - y1) * dy) / seg_sq
+        t = 0.0 if t < 0 else 1.0 if t > 1 else t
+        return self.cumulative[i] + t * (self.cumulative[i + 1] - self.cumulative[i])
+
+    def coverage(
+        self, center: Sequence[float], radius: float
+    ) -> tuple[tuple[float, float], ...]:
+        """
+        Arc-length intervals of the path that lie within ``radius`` of ``center``.
+
+        Intervals are sorted and touching ones are merged.
+        """
+        cx, cy = center[0], center[1]
+        radius_sq = radius * radius
+        intervals: list[list[float]] = []
+
+        for i in range(len(self.points) - 1):
+            x1, y1 = self.points[i]
+            x2, y2 = self.points[i + 1]
+            dx = x2 - x1
+            dy = y2 - y1
+            fx = x1 - cx
+            fy = y1 - cy
+
+            # Solve |start + t * d - center|^2 <= radius^2 for t in [0, 1]
+            a = dx * dx + dy * dy
+            if a == 0:
+                continue
+            b = fx * dx + fy * dy
+            c = fx * fx + fy * fy - radius_sq
+            disc = b * b - a * c
+            if disc < 0:
+                continue
+            root = math.sqrt(disc)
+            t0 = max(0.0, (-b - root) / a)
+            t1 = min(1.0, (-b + root) / a)
+            if t0 > t1:
+                continue
+
+            seg_len = self.cumulative[i + 1] - self.cumulative[i]
+            start = self.cumulative[i] + t0 * seg_len
+            end = self.cumulative[i] + t1 * seg_len
+            if intervals and start <= intervals[-1][1]:
+                intervals[-1][1] = max(intervals[-1][1], end)
+            else:
+                intervals.append([start, end])
+
+        return tuple((start, end) for start, end in intervals)
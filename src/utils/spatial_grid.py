@@ -0,0 +1,94 @@
+"""
+Uniform spatial hash grid.
+
+Buckets entities by position into square cells so radius queries only
+look at the cells the circle overlaps instead of every entity.
+
+Usage:
+    grid = SpatialGrid(cell_size=64)
+    grid.rebuild(enemies)
+    for enemy in grid.query_radius(center, 100):
+        ...
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from typing import Any
+
+import pygame as pg
+
+
+class SpatialGrid:
+    """Hash grid of objects with a ``pos`` Vector2, keyed by integer cell coordinates."""
+
+    __slots__ = ("cell_size", "stamp", "_inv_cell", "_cells", "_count")
+
+    def __init__(self, cell_size: float = 64.0) -> None:
+        self.cell_size = cell_size
+        self.stamp: int | None = None  # Tick the contents were last built for
+        self._inv_cell = 1.0 / cell_size
+        self._cells: dict[tuple[int, int], list[Any]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._count = 0
+        self.stamp = None
+
+    def insert(self, item: Any) -> None:
+        pos = item.pos
+        key = (math.floor(pos.x * self._inv_cell), math.floor(pos.y * self._inv_cell))
+        bucket = self._cells.get(key)
+        if bucket is None:
+            self._cells[key] = [item]
+        else:
+            bucket.append(item)
+        self._count += 1
+
+    def rebuild(self, items: Iterable[Any], stamp: int | None = None) -> None:
+        """
+        Replace the grid contents with ``items`` at their current positions.
+
+        Cell lists are emptied and refilled rather than dropped, so once the
+        occupied cells exist a rebuild allocates nothing. Systems sharing a
+        grid within one tick pass the tick as ``stamp``: a grid already built
+        for that stamp is kept as it is.
+        """
+        if stamp is not None and stamp == self.stamp:
+            return
+        self.stamp = stamp
+        for bucket in self._cells.values():
+            bucket.clear()
+        self._count = 0
+        for item in items:
+            self.insert(item)
+
+    def query_radius(self, center: pg.Vector2 | tuple[float, float], radius: float) -> list[Any]:
+        """Return the items whose position lies within ``radius`` of ``center``."""
+        cx, cy = center[0], center[1]
+        inv = self._inv_cell
+        min_x = math.floor((cx - radius) * inv)
+        max_x = math.floor((cx + radius) * inv)
+        min_y = math.floor((cy - radius) * inv)
+        max_y = math.floor((cy + radius) * inv)
+        radius_sq = radius * radius
+
+        found = []
+        cells = self._cells
+        for gx in range(min_x, max_x + 1):
+            for gy in range(min_y, max_y + 1):
+                bucket = cells.get((gx, gy))
+                if bucket is None:
+                    continue
+                for item in bucket:
+                    pos = item.pos
+                    dx = pos.x - cx
+                    dy = pos.y - cy
+                    if dx * dx + dy * dy <= radius_sq:
+                        found.append(item)
+        return found
@@ -0,0 +1,45 @@
+"""
+Tests for the damage ledger.
+"""
+
+from src.entities import Enemy
+from src.entities.tower import Tower, TowerStats
+from src.systems.damage_ledger import DamageLedger
+
+PATH = [(0, 0), (100, 0)]
+
+
+class TestDamageLedger:
+    """Tests for buffered damage and its counters."""
+
+    def test_kill_and_overkill_credited_in_order(self):
+        """Test that the killing hit gets the kill and the rest counts as overkill."""
+        enemy = Enemy(PATH, {"health": 50, "armor": 5, "magic_resistance": 0})
+        first, second = Tower((0, 0), TowerStats()), Tower((0, 0), TowerStats())
+        ledger = DamageLedger()
+
+        ledger.record(enemy, 35, "physical", "basic", first)
+        ledger.record(enemy, 35, "physical", "cannon", second)
+        ledger.record(enemy, 35, "magic", "fireball")
+        assert enemy.health == 50
+
+        assert ledger.flush() == 1
+        assert enemy.health == 0
+        assert enemy.last_hit_by == "cannon"
+
+        assert (first.damage_stats.damage, first.damage_stats.kills) == (30, 0)
+        assert (second.damage_stats.damage, second.damage_stats.overkill) == (20, 10)
+        assert second.damage_stats.kills == 1
+        assert ledger.by_source["fireball"].overkill == 35
+        assert len(ledger) == 0
+
+    def test_wasted_shots_counted(self):
+        """Test that shots at dead targets are counted per tower and source."""
+        tower = Tower((0, 0), TowerStats())
+        ledger = DamageLedger()
+
+        ledger.shot("basic", tower)
+        ledger.shot("basic", tower, wasted=True)
+
+        assert (tower.damage_stats.shots, tower.damage_stats.wasted_shots) == (2, 1)
+        assert ledger.by_source["basic"].wasted_shots == 1
@@ -0,0 +1,103 @@
+"""
+Tests for the compiled data bundle.
+"""
+
+import json
+
+import pytest
+
+from src.utils.data_bundle import (
+    build_data_bundle,
+    default_bundle_path,
+    load_data_bundle,
+    save_data_bundle,
+)
+from src.utils.path_utils import PathTrack
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    files = {
+        "enemyTemplates.json": {
+            "1": {"health": 20, "speed": 1.0, "abilities": []},
+            "2": {"health": "lots"},
+        },
+        "tower_presets.json": {"basic": {"range": 150, "damage": 7}},
+        "levels_config.json": [
+            {"id": "level1", "waypoints_path": "map.json", "waves_path": "waves.json"}
+        ],
+        "map.json": {"road1": [[0, 0], [30, 0], [30, 40]]},
+        "waves.json": {"2": {"units": [[1, 3]]}, "1": {"units": [[1, 2, 1.5], [99, 1]]}},
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(json.dumps(content))
+    return tmp_path
+
+
+class TestBuild:
+    """Tests for building a bundle from JSON."""
+
+    def test_contents_parsed(self, data_dir):
+        """Test that every data file ends up parsed in the bundle."""
+        bundle = build_data_bundle(data_dir)
+
+        assert list(bundle.enemy_templates) == ["1"]
+        assert bundle.tower_presets["basic"].damage == 7
+        assert bundle.waypoints["map.json"]["road1"][1] == (30, 0)
+        assert bundle.path_tracks["map.json"]["road1"].length == 70
+
+        first, second = bundle.waves["waves.json"]
+        assert first["groups"] == [
+            {
+                "enemy_id": 1,
+                "count": 2,
+                "delay_after_group": 1.5,
+                "inter_enemy_spawn_delay_ms": 500,
+            }
+        ]
+        assert second["groups"][0]["count"] == 3
+
+
+class TestBundleFile:
+    """Tests for saving, loading and staleness."""
+
+    def test_round_trip(self, data_dir):
+        """Test that an unchanged bundle loads back."""
+        path = default_bundle_path(data_dir)
+        save_data_bundle(build_data_bundle(data_dir), path)
+
+        bundle = load_data_bundle(path, data_dir)
+
+        assert bundle is not None
+        assert bundle.tower_presets["basic"].range == 150
+
+    def test_edited_file_makes_bundle_stale(self, data_dir):
+        """Test that changing a JSON file invalidates the bundle."""
+        path = default_bundle_path(data_dir)
+        save_data_bundle(build_data_bundle(data_dir), path)
+
+        (data_dir / "tower_presets.json").write_text(json.dumps({"basic": {"range": 999}}))
+
+        assert load_data_bundle(path, data_dir) is None
+
+    def test_touched_file_still_valid(self, data_dir):
+        """Test that a changed mtime with identical content keeps the bundle."""
+        path = default_bundle_path(data_dir)
+        bundle = build_data_bundle(data_dir)
+        bundle.sources = {}
+        save_data_bundle(bundle, path)
+
+        assert load_data_bundle(path, data_dir) is not None
+
+
+class TestPathTrack:
+    """Tests for arc-length lookups."""
+
+    def test_position_at(self):
+        """Test interpolation along the polyline and clamping at the ends."""
+        track = PathTrack([(0, 0), (30, 0), (30, 40)])
+
+        assert track.position_at(15) == (15.0, 0.0)
+        assert track.position_at(50) == (30.0, 20.0)
+        assert track.position_at(-5) == (0.0, 0.0)
+        assert track.position_at(500) == (30.0, 40.0)
@@ -0,0 +1,52 @@
+"""
+Tests for compiled enemy prototypes.
+"""
+
+from src.entities import Enemy, EnemyPrototype
+
+PATH = [(0, 0), (100, 0)]
+
+
+class TestEnemyPrototype:
+    """Tests for prototype compilation and cloning."""
+
+    def test_static_abilities_pre_applied(self):
+        """Test that stat modifiers are folded into the prototype."""
+        template = {"health": 50, "speed": 1.0, "armor": 1, "abilities": ["tank", "fast", "nope"]}
+
+        prototype = EnemyPrototype.from_template(template)
+
+        assert prototype.health == 100
+        assert prototype.armor == 5
+        assert prototype.speed == 1.5
+        assert prototype.ability_names == ("tank", "fast")
+
+    def test_enemy_matches_template_construction(self):
+        """Test that prototype and dict construction give the same enemy."""
+        template = {"id": 3, "health": 40, "abilities": ["tank", "invisible"], "color": [1, 2, 3]}
+
+        from_dict = Enemy(PATH, template)
+        from_prototype = Enemy(PATH, EnemyPrototype.from_template(template))
+
+        for attr in ("id", "health", "max_health", "armor", "speed", "is_invisible", "color"):
+            assert getattr(from_dict, attr) == getattr(from_prototype, attr)
+        assert from_dict.has_ability_type("tank")
+        assert from_dict._pre_rendered_shape is from_prototype._pre_rendered_shape
+
+    def test_stateful_abilities_not_shared(self):
+        """Test that each enemy gets its own stateful ability instances."""
+        prototype = EnemyPrototype.from_template({"abilities": ["dash", "tank"]})
+
+        first, second = Enemy(PATH, prototype), Enemy(PATH, prototype)
+
+        assert first.get_ability("tank") is second.get_ability("tank")
+        assert first.abilities.abilities[0] is not second.abilities.abilities[0]
+
+    def test_enemy_has_no_instance_dict(self):
+        """Test that enemies are fully slotted and read constants from the prototype."""
+        prototype = EnemyPrototype.from_template({"color": [9, 9, 9], "gold_reward": 7})
+        enemy = Enemy(PATH, prototype)
+
+        assert not hasattr(enemy, "__dict__")
+        assert enemy.color is prototype.color
+        assert enemy.gold_reward == 7
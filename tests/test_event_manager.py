@@ -0,0 +1,174 @@
+"""
+Tests for the event manager.
+"""
+
+import pytest
+
+from src.core.event_manager import (
+    EnemySpawnedEvent,
+    EventManager,
+    GameEvent,
+    ResourceChangedEvent,
+)
+from src.systems.economy_system import ResourcesManager
+
+
+class TestImmediateDispatch:
+    """Tests for the default synchronous mode."""
+
+    def test_emit_calls_subscriber(self):
+        """Test that subscribers receive emitted data immediately."""
+        events = EventManager()
+        received = []
+        events.subscribe(GameEvent.ENEMY_SPAWNED, received.append)
+
+        data = EnemySpawnedEvent(enemy=None)
+        events.emit(GameEvent.ENEMY_SPAWNED, data)
+
+        assert received == [data]
+
+    def test_has_subscribers(self):
+        """Test subscriber check does not register empty listener lists."""
+        events = EventManager()
+
+        assert events.has_subscribers(GameEvent.ENEMY_KILLED) is False
+        assert events.subscriber_count(GameEvent.ENEMY_KILLED) == 0
+
+        events.subscribe(GameEvent.ENEMY_KILLED, lambda data: None)
+        assert events.has_subscribers(GameEvent.ENEMY_KILLED) is True
+
+    def test_handler_error_isolated(self):
+        """Test that a failing handler does not stop other handlers."""
+        events = EventManager()
+        received = []
+
+        def broken(data):
+            raise RuntimeError("boom")
+
+        events.subscribe(GameEvent.GAME_PAUSED, broken)
+        events.subscribe(GameEvent.GAME_PAUSED, received.append)
+        events.emit(GameEvent.GAME_PAUSED, None)
+
+        assert received == [None]
+
+
+class TestDeferredDispatch:
+    """Tests for queued, once-per-tick dispatch."""
+
+    def test_events_wait_for_flush(self):
+        """Test that deferred events are only delivered on flush."""
+        events = EventManager(deferred=True)
+        received = []
+        events.subscribe(GameEvent.ENEMY_SPAWNED, received.append)
+
+        events.emit(GameEvent.ENEMY_SPAWNED, EnemySpawnedEvent(enemy="a"))
+        events.emit(GameEvent.ENEMY_SPAWNED, EnemySpawnedEvent(enemy="b"))
+        assert received == []
+        assert events.pending_count == 2
+
+        assert events.flush() == 2
+        assert [e.enemy for e in received] == ["a", "b"]
+        assert events.pending_count == 0
+
+    def test_unsubscribed_events_not_queued(self):
+        """Test that events with no subscribers are dropped."""
+        events = EventManager(deferred=True)
+
+        events.emit(GameEvent.ENEMY_SPAWNED, EnemySpawnedEvent(enemy="a"))
+
+        assert events.pending_count == 0
+
+    def test_resource_changes_coalesced(self):
+        """Test that repeated same-sign changes to one resource merge into one event."""
+        events = EventManager(deferred=True)
+        received = []
+        events.subscribe(GameEvent.RESOURCE_CHANGED, received.append)
+
+        manager = ResourcesManager(initial_gold=100, initial_wood=50, events=events)
+        manager.add_resource("gold", 5)
+        manager.add_resource("gold", 5)
+        manager.add_resource("wood", 10)
+        events.flush()
+
+        assert len(received) == 2
+        gold, wood = received
+        assert (gold.resource_type, gold.old_value, gold.new_value, gold.change) == (
+            "gold",
+            100,
+            110,
+            10,
+        )
+        assert (wood.old_value, wood.new_value, wood.change) == (50, 60, 10)
+
+    def test_income_and_spending_not_merged(self):
+        """Test that a spend after income starts a new coalesced event."""
+        events = EventManager(deferred=True)
+        received = []
+        events.subscribe(GameEvent.RESOURCE_CHANGED, received.append)
+
+        manager = ResourcesManager(initial_gold=100, events=events)
+        manager.add_resource("gold", 5)
+        manager.spend_resource("gold", 20)
+        manager.spend_resource("gold", 10)
+        events.flush()
+
+        assert [e.change for e in received] == [5, -30]
+        assert received[1].old_value == 105
+        assert received[1].new_value == 75
+
+    def test_coalescing_does_not_mutate_emitted_data(self):
+        """Test that merging works on a private copy of the first event."""
+        events = EventManager(deferred=True)
+        events.subscribe(GameEvent.RESOURCE_CHANGED, lambda data: None)
+
+        first = ResourceChangedEvent("gold", 0, 5, 5)
+        events.emit(GameEvent.RESOURCE_CHANGED, first)
+        events.emit(GameEvent.RESOURCE_CHANGED, ResourceChangedEvent("gold", 5, 10, 5))
+
+        assert first.new_value == 5
+        assert first.change == 5
+
+    def test_clear_drops_queue(self):
+        """Test that clear removes pending events."""
+        events = EventManager(deferred=True)
+        events.subscribe(GameEvent.GAME_PAUSED, lambda data: None)
+        events.emit(GameEvent.GAME_PAUSED, None)
+
+        events.clear()
+
+        assert events.pending_count == 0
+        assert events.flush() == 0
+
+
+class TestSubscriberTiming:
+    """Tests for per-subscriber profiling."""
+
+    def test_timing_disabled_by_default(self):
+        """Test that no timings are collected unless enabled."""
+        events = EventManager()
+        events.subscribe(GameEvent.GAME_PAUSED, lambda data: None)
+        events.emit(GameEvent.GAME_PAUSED, None)
+
+        assert events.get_timings() == []
+
+    def test_timing_accumulates_per_subscriber(self):
+        """Test that calls and time accumulate for each subscriber."""
+        events = EventManager()
+        events.enable_timing()
+
+        def on_paused(data):
+            pass
+
+        events.subscribe(GameEvent.GAME_PAUSED, on_paused)
+        for _ in range(3):
+            events.emit(GameEvent.GAME_PAUSED, None)
+
+        (timing,) = events.get_timings()
+        assert timing.event is GameEvent.GAME_PAUSED
+        assert timing.subscriber.endswith("on_paused")
+        assert timing.calls == 3
+        assert timing.total_seconds >= timing.max_seconds >= 0
+        assert timing.mean_seconds == pytest.approx(timing.total_seconds / 3)
+
+        events.reset_timings()
+        assert events.get_timings() == []
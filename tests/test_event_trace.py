@@ -0,0 +1,93 @@
+"""
+Tests for the streaming event trace recorder.
+"""
+
+import json
+
+from src.core.event_manager import (
+    EnemyKilledEvent,
+    EventManager,
+    GameEvent,
+    WaveStartedEvent,
+)
+from src.core.event_trace import EventTraceRecorder, encode_payload, trace_schema
+
+
+class FakeEntity:
+    """Stands in for an entity; only the handle is recorded."""
+
+    def __init__(self, handle):
+        self.handle = handle
+
+
+def read_segment(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestEncoding:
+    """Tests for record encoding."""
+
+    def test_entities_become_handles(self):
+        """Test that entity fields are replaced by their handle."""
+        payload = encode_payload(EnemyKilledEvent(enemy=FakeEntity(42), gold_reward=5))
+
+        assert payload == {"enemy": 42, "gold_reward": 5, "source": None}
+
+    def test_nested_entities_dropped_from_dicts(self):
+        """Test that non-scalar dictionary entries are not serialized."""
+        wave_data = {"P_time": 3, "enemy_groups": [{"enemies_to_spawn": [FakeEntity(1)]}]}
+        payload = encode_payload(WaveStartedEvent(wave_index=0, wave_data=wave_data))
+
+        assert payload == {"wave_index": 0, "wave_data": {"P_time": 3}}
+
+    def test_schema_matches_dataclasses(self):
+        """Test that the schema lists the event data class fields."""
+        schema = trace_schema()
+
+        assert schema["ENEMY_KILLED"][:2] == ["enemy", "gold_reward"]
+        assert schema["GAME_PAUSED"] == []
+
+
+class TestRecorder:
+    """Tests for the background writer."""
+
+    def test_records_written_with_tick_and_wave(self, tmp_path):
+        """Test that events are streamed with tick and wave stamps."""
+        events = EventManager()
+        tick = [0]
+        recorder = EventTraceRecorder(events, tmp_path, tick_source=lambda: tick[0])
+        recorder.start()
+
+        tick[0] = 3
+        events.emit(GameEvent.WAVE_STARTED, WaveStartedEvent(wave_index=1, wave_data={}))
+        tick[0] = 7
+        events.emit(GameEvent.ENEMY_KILLED, EnemyKilledEvent(enemy=FakeEntity(9), gold_reward=8))
+        recorder.stop()
+
+        (segment,) = recorder.segments
+        header, *records = read_segment(segment)
+        assert header[0] == "#"
+        assert records[0][:3] == [3, 1, "WAVE_STARTED"]
+        assert records[1][:3] == [7, 1, "ENEMY_KILLED"]
+        assert records[1][3]["enemy"] == 9
+        assert recorder.records_written == 2
+        assert recorder.dropped == 0
+
+        # Stopping unsubscribes the recorder
+        assert not events.has_subscribers(GameEvent.ENEMY_KILLED)
+
+    def test_segments_rotate(self, tmp_path):
+        """Test that a new segment starts once the size limit is reached."""
+        events = EventManager()
+        recorder = EventTraceRecorder(events, tmp_path, max_segment_bytes=1, queue_size=1)
+        recorder.block_on_full = True
+        recorder.start()
+
+        for _ in range(3):
+            events.emit(GameEvent.GAME_PAUSED, None)
+        recorder.stop()
+
+        assert len(recorder.segments) >= 2
+        total = sum(len(read_segment(p)) - 1 for p in recorder.segments)
+        assert total == 3
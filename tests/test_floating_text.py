@@ -0,0 +1,49 @@
+"""
+Tests for the floating text layer.
+"""
+
+import pygame as pg
+
+from src.core.timer_wheel import TimerWheel
+from src.systems.floating_text import FloatingTextLayer
+
+
+class TestFloatingTextLayer:
+    """Tests for merging, limits and pooling."""
+
+    def test_repeats_nearby_merge(self):
+        """Test that a repeated text close by merges into a counted label."""
+        timers = TimerWheel()
+        texts = FloatingTextLayer(timers)
+
+        texts.push("+5", (100, 100), (0, 255, 0))
+        texts.push("+5", (110, 100), (0, 255, 0))
+        texts.push("+5", (105, 95), (0, 255, 0))
+        texts.push("+5", (400, 400), (0, 255, 0))
+
+        assert [t.label for t in texts.active] == ["+5 ×3", "+5"]
+
+        timers.advance(1000)
+        texts.push("+5", (100, 100), (0, 255, 0))
+        assert texts.active[-1].label == "+5"
+
+    def test_max_visible_drops_oldest(self):
+        """Test that the oldest text gives way once the limit is reached."""
+        texts = FloatingTextLayer(TimerWheel(), max_visible=3)
+        for i in range(5):
+            texts.push(f"t{i}", (i * 100, 0), (255, 255, 255))
+
+        assert [t.text for t in texts.active] == ["t2", "t3", "t4"]
+
+    def test_expired_records_reused(self):
+        """Test that expired records return to the pool and are reused."""
+        timers = TimerWheel()
+        texts = FloatingTextLayer(timers)
+        first = texts.push("DASH!", (0, 0), (255, 200, 50), lifetime=0.7)
+
+        timers.advance(700)
+        texts.update()
+        assert len(texts) == 0
+
+        assert texts.push("Summon!", (0, 0), (150, 150, 255)) is first
+        texts.draw(pg.Surface((200, 200)))
@@ -0,0 +1,70 @@
+"""
+Tests for game speed and sub-stepped world updates.
+"""
+
+import json
+
+from src.config.paths import DATA_DIR
+from src.config.settings import MAX_UI_GAME_SPEED, SIM_STEP_MS
+from src.core.game import RenderPacer
+from src.core.game_world import GameWorld, GameWorldConfig
+
+
+def make_world(**kwargs) -> GameWorld:
+    with open(DATA_DIR / "levels_config.json") as f:
+        level = json.load(f)[0]
+    return GameWorld(GameWorldConfig(level_config=level, **kwargs))
+
+
+class TestGameSpeed:
+    """Tests for fast-forward sub-stepping."""
+
+    def test_fast_forward_runs_fixed_ticks(self):
+        """Test that a sped-up frame runs several ticks of at most SIM_STEP_MS."""
+        world = make_world(max_game_speed=MAX_UI_GAME_SPEED)
+        world.set_game_speed(1000)
+        assert world.game_speed == MAX_UI_GAME_SPEED
+
+        assert world.update(SIM_STEP_MS / 1000) == 64
+        assert world.tick == 64
+        assert abs(world.timers.time - 64 * SIM_STEP_MS) < 1e-6
+
+        # Capped frames drop the time they could not simulate
+        assert world.update(SIM_STEP_MS / 1000, max_steps=8) == 8
+        assert abs(world.timers.time - 72 * SIM_STEP_MS) < 1e-6
+        world.close()
+
+    def test_partial_ticks_carry_over(self):
+        """Test that time short of a tick carries over and sets the interpolation."""
+        world = make_world()
+
+        assert world.update(SIM_STEP_MS * 0.75 / 1000) == 0
+        assert abs(world.interpolation - 0.75) < 1e-6
+        assert world.update(SIM_STEP_MS * 0.5 / 1000) == 1
+        assert abs(world.interpolation - 0.25) < 1e-6
+        assert world.tick == 1
+        world.close()
+
+    def test_headless_speed_uncapped(self):
+        """Test that a world without max_game_speed accepts any speed."""
+        world = make_world()
+        world.set_game_speed(500)
+        assert world.game_speed == 500
+        world.set_game_speed(0)
+        assert world.game_speed == 0.25
+        world.close()
+
+
+class TestRenderPacer:
+    """Tests for adaptive render skipping."""
+
+    def test_skips_only_heavy_updates(self):
+        """Test that frames are skipped only when the update overruns the budget."""
+        pacer = RenderPacer(fps=60, max_skip=2)
+        pacer.rendered(0.004)
+
+        assert pacer.should_render(0.001)
+        assert not pacer.should_render(0.020)
+        assert not pacer.should_render(0.020)
+        assert pacer.should_render(0.020)  # max_skip reached
+        assert pacer.total_skipped == 2
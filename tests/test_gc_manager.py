@@ -0,0 +1,45 @@
+"""
+Tests for the garbage collector policy and pause timing.
+"""
+
+import gc
+
+from src.config.settings import GC_WAVE_GEN2_THRESHOLD
+from src.core.gc_manager import GCManager
+from src.core.instrumentation import Instrumentation
+
+
+class TestGCManager:
+    """Tests for freezing, deferred collections and pause timing."""
+
+    def test_wave_defers_full_collections(self):
+        """Test that waves raise the gen-2 threshold and the wave end restores it."""
+        thresholds = gc.get_threshold()
+        manager = GCManager()
+        try:
+            manager.wave_started()
+            assert gc.get_threshold() == (*thresholds[:2], GC_WAVE_GEN2_THRESHOLD)
+            manager.wave_ended()
+            assert gc.get_threshold() == thresholds
+        finally:
+            manager.close()
+        assert gc.get_threshold() == thresholds
+        assert manager._on_gc not in gc.callbacks
+
+    def test_pauses_timed_during_waves(self):
+        """Test that collections in a wave are timed and counted per wave."""
+        instrumentation = Instrumentation()
+        manager = GCManager(instrumentation)
+        try:
+            manager.level_loaded()
+            assert manager.frozen == gc.get_freeze_count() > 0
+
+            manager.wave_started()
+            gc.collect(1)
+            assert manager.collections[1] >= 1
+            assert manager.max_pause_ms >= manager.last_pause_ms > 0
+            assert instrumentation.counters["gc_collections"] >= 1
+            manager.wave_ended()
+        finally:
+            manager.close()
+        assert gc.get_freeze_count() == 0
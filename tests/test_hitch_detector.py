@@ -0,0 +1,42 @@
+"""
+Tests for the frame hitch detector.
+"""
+
+import json
+
+from src.core.hitch_detector import HitchDetector
+
+
+class TestHitchDetector:
+    """Tests for the frame ring buffer and hitch reports."""
+
+    def test_ring_buffer_keeps_recent_frames(self):
+        """Test that only the last ``history`` frames are kept, oldest first."""
+        detector = HitchDetector(budget_ms=1000, history=3)
+        for i in range(5):
+            detector.begin_frame()
+            detector.note("spawns", i)
+            detector.end_frame()
+
+        assert [record.frame for record in detector.recent()] == [2, 3, 4]
+        assert detector.recent()[-1].events == {"spawns": 4}
+        assert detector.hitch_count == 0
+
+    def test_frame_over_budget_is_reported(self, tmp_path):
+        """Test that a slow frame is reported with its breakdown and written to the file."""
+        path = tmp_path / "hitches.jsonl"
+        detector = HitchDetector(budget_ms=-1, report_path=path)
+        detector.begin_frame()
+        detector.tick()
+        detector.add_time("enemies", 0.004)
+        detector.note("summons:boss")
+        detector.end_frame({"enemies": 12})
+        detector.close()
+
+        assert detector.hitch_count == 1
+        report = json.loads(path.read_text().splitlines()[0])
+        assert report == detector.hitches[-1]
+        assert report["ticks"] == 1
+        assert report["sections"] == {"enemies": 4.0}
+        assert report["events"] == {"summons:boss": 1}
+        assert report["counts"] == {"enemies": 12}
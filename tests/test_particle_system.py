@@ -0,0 +1,54 @@
+"""
+Tests for the pooled particle system.
+"""
+
+import pygame as pg
+
+from src.core.timer_wheel import TimerWheel
+from src.systems.particle_system import ParticleKind, ParticleSystem
+
+
+class TestParticleSystem:
+    """Tests for ParticleSystem emission and expiry."""
+
+    def test_expired_particles_removed(self):
+        """Test that particles are dropped once their lifetime has passed."""
+        timers = TimerWheel()
+        particles = ParticleSystem(timers, capacity=16, frame_budget=16)
+        particles.emit(ParticleKind.RING, 10, 10, 30, (255, 100, 0), 300)
+        particles.emit(ParticleKind.SQUARE, 20, 20, 8, (0, 255, 255), 600)
+
+        timers.advance(300)
+        particles.update()
+        assert len(particles) == 1
+
+        timers.advance(300)
+        particles.update()
+        assert len(particles) == 0
+
+    def test_frame_budget(self):
+        """Test that emissions over the per-tick budget are dropped."""
+        particles = ParticleSystem(TimerWheel(), capacity=64, frame_budget=5)
+
+        accepted = [
+            particles.emit(ParticleKind.SQUARE, 0, 0, 4, (255, 0, 255), 100) for _ in range(8)
+        ]
+        assert accepted.count(True) == 5
+        assert particles.dropped == 3
+
+        particles.update()
+        assert particles.emit(ParticleKind.SQUARE, 0, 0, 4, (255, 0, 255), 100)
+
+    def test_capacity_replaces_oldest(self):
+        """Test that a full pool overwrites its oldest particles and still draws."""
+        particles = ParticleSystem(TimerWheel(), capacity=4, frame_budget=100)
+        for i in range(6):
+            particles.emit(ParticleKind.SQUARE, i * 10, 0, 4, (255, 255, 255), 1000)
+
+        assert len(particles) == 4
+        assert particles.dropped == 2
+
+        surface = pg.Surface((100, 20))
+        particles.draw(surface)
+        assert surface.get_at((0, 0)) == pg.Color(0, 0, 0)
+        assert surface.get_at((50, 0)) == pg.Color(255, 255, 255)
@@ -0,0 +1,33 @@
+"""
+Tests for the headless level profiler.
+"""
+
+import argparse
+import pstats
+
+import pytest
+
+from src.profile_level import main, parse_waves
+
+
+class TestProfileLevel:
+    """Tests for wave ranges and profiled runs."""
+
+    def test_parse_waves(self):
+        """Test that single waves, closed and open ranges parse and bad ranges fail."""
+        assert parse_waves("3") == (3, 3)
+        assert parse_waves("2-5") == (2, 5)
+        assert parse_waves("2-") == (2, None)
+        for text in ("0", "5-2", "a-b"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                parse_waves(text)
+
+    def test_profiles_wave_to_pstats(self, tmp_path, capsys):
+        """Test that a profiled wave writes a readable pstats file and a report."""
+        prefix = tmp_path / "level1"
+        argv = ["level1", "--waves", "1", "--resources", "100000", "--output", str(prefix)]
+        assert main(argv) == 0
+
+        stats = pstats.Stats(f"{prefix}.pstats")
+        assert any(name == "step" for _, _, name in stats.stats)
+        assert "level1 waves 1-1" in capsys.readouterr().out
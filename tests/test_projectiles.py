@@ -0,0 +1,101 @@
+"""
+Tests for swept projectile collision, hitscan shots and batched explosions.
+"""
+
+import pygame as pg
+
+from src.core.timer_wheel import TimerWheel
+from src.entities import Enemy
+from src.entities.projectile import Projectile, contact_time
+from src.entities.tower import TowerStats
+from src.systems.damage_ledger import DamageLedger
+from src.systems.explosions import Explosions
+from src.systems.hitscan import HitscanSystem, intercept
+from src.utils.spatial_grid import SpatialGrid
+
+PATH = [(0, 0), (400, 0)]
+
+
+class TestContactTime:
+    """Tests for the swept intercept test."""
+
+    def test_target_crossing_shot_is_caught(self):
+        """Test that a target passing the shot within one step is detected."""
+        # Target 100 px ahead, closing at 1 px/ms; the shot moves 0.5 px/ms
+        assert abs(contact_time(100, 0, -1.0, 0, 0.5, 100) - 200 / 3) < 1e-9
+
+    def test_out_of_reach(self):
+        """Test that no contact is reported when the target stays out of reach."""
+        assert contact_time(100, 0, 0, 0, 0.5, 100) is None
+        assert contact_time(100, 0, 1.0, 0, 0.5, 10_000) is None
+
+
+class TestProjectile:
+    """Tests for projectile flight."""
+
+    def test_finished_target_not_hit(self):
+        """Test that a shot at an enemy that reached the end is dropped without damage."""
+        enemy = Enemy(PATH, {"health": 100, "armor": 0})
+        enemy.pos = (20, 0)
+        projectile = Projectile((0, 0), enemy, 30, "physical", speed=1.0)
+
+        enemy.curr_waypoint = len(enemy.waypoints) - 1
+        projectile.update(50)
+
+        assert not projectile.active
+        assert not projectile.hit
+        assert enemy.health == 100
+
+
+class TestHitscan:
+    """Tests for analytically resolved shots."""
+
+    def test_damage_applied_at_impact_time(self):
+        """Test that a hitscan shot deals its damage once the flight time has passed."""
+        timers = TimerWheel()
+        enemy = Enemy(PATH, {"health": 100, "speed": 1.0, "armor": 0})
+        ledger = DamageLedger()
+        hitscan = HitscanSystem(timers, ledger)
+        stats = TowerStats(damage=30, projectile_speed=2.0)
+        origin = pg.Vector2(200, 0)
+
+        flight, (x, _) = intercept(origin, stats.projectile_speed, enemy)
+        assert abs(flight * 2.0 + x - 200) < 1e-6
+
+        enemy.add_incoming_damage(stats.damage)
+        impact_at = hitscan.fire(origin, enemy, stats, 0.0)
+        assert impact_at == flight
+
+        timers.advance(impact_at - 10)
+        assert enemy.health == 100
+
+        timers.advance(20)
+        assert len(ledger) == 1
+        ledger.flush()
+        assert enemy.health == 70
+        assert enemy.incoming_damage == 0
+        assert hitscan.pending == 0
+
+
+class TestExplosions:
+    """Tests for batched explosion damage."""
+
+    def test_blasts_summed_per_enemy(self):
+        """Test that overlapping blasts add up, with falloff and armor per blast."""
+        center, edge, outside = (
+            Enemy(PATH, {"health": 100, "armor": 2}) for _ in range(3)
+        )
+        center.pos, edge.pos, outside.pos = (100, 0), (130, 0), (200, 0)
+        ledger = DamageLedger()
+        explosions = Explosions(SpatialGrid(cell_size=32), ledger)
+
+        explosions.add(100, 0, 30, 20, "physical", "cannon")
+        explosions.add(100, 0, 30, 20, "physical", "cannon 2")
+        assert explosions.resolve([center, edge, outside]) == 4
+        ledger.flush()
+
+        assert center.health == 100 - 2 * (20 - 2)
+        assert edge.health == 100 - 2 * (10 - 2)
+        assert outside.health == 100
+        assert center.last_hit_by == "cannon 2"
+        assert len(explosions) == 0
@@ -0,0 +1,32 @@
+"""
+Tests for the sampling profiler.
+"""
+
+import time
+
+from src.core.sampling_profiler import SamplingProfiler
+
+
+def _busy_wait(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSamplingProfiler:
+    """Tests for stack sampling and collapsed-stack output."""
+
+    def test_samples_written_as_collapsed_stacks(self, tmp_path):
+        """Test that the profiled function shows up in the collapsed output file."""
+        path = tmp_path / "profile.collapsed"
+        profiler = SamplingProfiler(interval_ms=1, output_path=path)
+        profiler.start()
+        assert profiler.running
+        _busy_wait(0.2)
+        samples = profiler.stop()
+
+        assert not profiler.running
+        assert samples > 0
+        lines = path.read_text().splitlines()
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == samples
+        assert any("_busy_wait (test_sampling_profiler.py:" in line for line in lines)
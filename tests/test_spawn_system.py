@@ -0,0 +1,45 @@
+"""
+Tests for the compiled spawn schedule.
+"""
+
+from src.entities import Enemy
+from src.systems.spawn_system import SpawnController
+
+PATH = [(0, 0), (1000, 0)]
+
+
+def make_group(count: int, spawn_delay: float, delay_after: float = 0.0) -> dict:
+    return {
+        "enemies_to_spawn": [Enemy(PATH, {"health": 10, "speed": 2}) for _ in range(count)],
+        "delay_after_group": delay_after,
+        "inter_enemy_spawn_delay_ms": spawn_delay,
+    }
+
+
+class TestSpawnController:
+    """Tests for spawn timing."""
+
+    def test_burst_spawns_within_one_step(self):
+        """Test that every spawn due in a step appears, offset by how late it is."""
+        controller = SpawnController()
+        controller.start_wave({"P_time": 0, "enemy_groups": [make_group(10, 5)]})
+        enemies: list[Enemy] = []
+
+        assert not controller.update(100, enemies)
+
+        assert len(enemies) == 10
+        # Due at 5, 10, ... 50 ms and walking 0.1 px/ms since then
+        assert [round(enemy.pos.x, 6) for enemy in enemies] == [
+            round((100 - 5 * i) * 0.1, 6) for i in range(1, 11)
+        ]
+        assert not controller.is_spawning
+
+    def test_sequential_and_parallel_groups(self):
+        """Test that groups wait for each other unless the wave is parallel."""
+        groups = [make_group(2, 100, delay_after=1.0), make_group(1, 100)]
+        schedule = SpawnController.compile_schedule({"P_time": 1, "enemy_groups": groups})
+        assert sorted(due for due, _, _ in schedule) == [1100, 1200, 2300]
+
+        parallel = {"P_time": 1, "parallel": True, "enemy_groups": groups}
+        schedule = SpawnController.compile_schedule(parallel)
+        assert sorted(due for due, _, _ in schedule) == [1100, 1100, 1200]
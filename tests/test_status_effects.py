@@ -0,0 +1,139 @@
+"""
+Tests for status effects and the spatial grid.
+"""
+
+import pygame as pg
+
+from src.core.timer_wheel import TimerWheel
+from src.systems.status_effects import StatusEffects, StatusType
+from src.utils.spatial_grid import SpatialGrid
+
+
+class FakeEnemy:
+    """Minimal enemy with the fields status effects touch."""
+
+    def __init__(self, x=0.0, y=0.0):
+        self.pos = pg.Vector2(x, y)
+        self.shown_texts = []
+        self.slow_factor = 1.0
+        self.silenced_until = 0.0
+        self.revealed = False
+
+    def is_dead(self):
+        return False
+
+    def show_text(self, text, color, lifetime=1.0):
+        self.shown_texts.append(text)
+
+
+class TestStatusEffects:
+    """Tests for StatusEffects stacking and expiry."""
+
+    def test_effect_expires(self):
+        """Test that an effect is applied and removed at its expiry."""
+        timers = TimerWheel()
+        effects = StatusEffects(timers)
+        enemy = FakeEnemy()
+
+        assert effects.apply(enemy, StatusType.SILENCE, 1000)
+        assert enemy.silenced_until == 1000
+        assert enemy.shown_texts == ["Silenced!"]
+
+        timers.advance(999)
+        effects.update([])
+        assert enemy.silenced_until == 1000
+
+        timers.advance(1)
+        effects.update([])
+        assert enemy.silenced_until == 0.0
+        assert len(effects) == 0
+
+    def test_strongest_slow_wins_and_refresh_extends(self):
+        """Test that the stronger slow is kept and a refresh delays expiry."""
+        timers = TimerWheel()
+        effects = StatusEffects(timers)
+        enemy = FakeEnemy()
+
+        effects.apply(enemy, StatusType.SLOW, 1000, magnitude=0.8)
+        assert not effects.apply(enemy, StatusType.SLOW, 500, magnitude=0.5)
+        effects.apply(enemy, StatusType.SLOW, 500, magnitude=0.9)
+        assert enemy.slow_factor == 0.5
+        assert enemy.shown_texts == ["Slowed"]
+
+        timers.advance(800)
+        effects.apply(enemy, StatusType.SLOW, 1000, magnitude=0.9)
+        timers.advance(700)
+        effects.update([])
+        assert enemy.slow_factor == 0.5
+
+        timers.advance(300)
+        effects.update([])
+        assert enemy.slow_factor == 1.0
+
+    def test_area_applies_only_inside(self):
+        """Test that an area effect reaches enemies inside its radius only."""
+        timers = TimerWheel()
+        effects = StatusEffects(timers)
+        inside, outside = FakeEnemy(10, 10), FakeEnemy(300, 0)
+
+        effects.add_area(StatusType.REVEAL, pg.Vector2(0, 0), 50, 1000, 200)
+        effects.update([inside, outside])
+
+        assert inside.revealed
+        assert not outside.revealed
+
+        timers.advance(1300)
+        effects.update([inside, outside])
+        assert not effects.areas
+        assert not inside.revealed
+
+    def test_area_holds_status_until_enemy_leaves(self):
+        """Test that an area status lasts while inside and its duration after leaving."""
+        timers = TimerWheel()
+        effects = StatusEffects(timers)
+        enemy = FakeEnemy(10, 10)
+
+        effects.add_area(StatusType.SILENCE, pg.Vector2(0, 0), 50, 5000, 200)
+        for tick in range(1, 31):
+            effects.update([enemy], tick)
+            timers.advance(33)
+        assert enemy.shown_texts == ["Silenced!"]
+        assert enemy.silenced_until > timers.time
+
+        enemy.pos.update(300, 0)
+        effects.update([enemy], 31)
+        left_at = timers.time
+        assert enemy.silenced_until == left_at + 200
+
+        timers.advance(200)
+        effects.update([enemy], 32)
+        assert enemy.silenced_until == 0.0
+        assert len(effects) == 0
+
+
+class TestSpatialGrid:
+    """Tests for SpatialGrid radius queries."""
+
+    def test_query_radius(self):
+        """Test that queries return exactly the items within the radius."""
+        grid = SpatialGrid(cell_size=32)
+        items = [FakeEnemy(x, y) for x in range(-100, 101, 25) for y in range(-100, 101, 25)]
+        grid.rebuild(items)
+
+        found = grid.query_radius((10, -5), 60)
+
+        expected = [i for i in items if i.pos.distance_to((10, -5)) <= 60]
+        assert len(grid) == len(items)
+        assert sorted(map(id, found)) == sorted(map(id, expected))
+
+    def test_rebuild_once_per_stamp(self):
+        """Test that a grid already built for a tick is not rebuilt for it again."""
+        grid = SpatialGrid(cell_size=32)
+        near, far = FakeEnemy(0, 0), FakeEnemy(500, 500)
+        grid.rebuild([near], stamp=7)
+
+        grid.rebuild([near, far], stamp=7)
+        assert len(grid) == 1
+
+        grid.rebuild([near, far], stamp=8)
+        assert len(grid) == 2
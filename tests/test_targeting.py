@@ -0,0 +1,158 @@
+"""
+Tests for shared target orderings and tower priorities.
+"""
+
+from src.entities import Enemy, TargetOrder, TargetPriority
+from src.entities.tower import Tower, TowerStats
+from src.utils.path_utils import PathTrack
+
+PATH = [(0, 0), (400, 0)]
+
+
+def make_enemy(x, health):
+    enemy = Enemy(PATH, {"health": health})
+    enemy.pos = (x, 0)
+    enemy.road = "main"
+    return enemy
+
+
+class TestTargetOrder:
+    """Tests for TargetOrder and Tower.select_targets."""
+
+    def test_progress_order_and_priorities(self):
+        """Test that each priority picks its preferred enemy from the shared order."""
+        behind, middle, ahead = make_enemy(100, 50), make_enemy(200, 10), make_enemy(300, 30)
+        order = TargetOrder()
+        order.rebuild([behind, middle, ahead])
+
+        assert order.progress == [ahead, middle, behind]
+
+        tower = Tower((120, 20), TowerStats(range=500))
+        expected = {
+            TargetPriority.FIRST: ahead,
+            TargetPriority.LAST: behind,
+            TargetPriority.STRONGEST: behind,
+            TargetPriority.WEAKEST: middle,
+            TargetPriority.CLOSEST: behind,
+        }
+        for priority, enemy in expected.items():
+            tower.priority = priority
+            assert tower.select_targets(order)[0] is enemy
+
+    def test_out_of_range_filtered(self):
+        """Test that targets outside the tower's range are skipped in order."""
+        near, far = make_enemy(50, 20), make_enemy(350, 20)
+        order = TargetOrder()
+        order.rebuild([near, far])
+
+        tower = Tower((50, 0), TowerStats(range=100))
+        assert tower.select_targets(order) == [near]
+
+    def test_priority_cycles(self):
+        """Test that cycling priorities visits all of them and wraps around."""
+        priority = TargetPriority.FIRST
+        seen = []
+        for _ in TargetPriority:
+            seen.append(priority)
+            priority = priority.next()
+
+        assert priority is TargetPriority.FIRST
+        assert set(seen) == set(TargetPriority)
+
+    def test_lock_kept_until_target_leaves_range(self):
+        """Test that a tower keeps its target until it leaves range or the lock expires."""
+        first, second = make_enemy(60, 20), make_enemy(40, 20)
+        order = TargetOrder()
+        order.rebuild([first, second])
+        tower = Tower((50, 0), TowerStats(range=100))
+
+        assert tower.current_targets(order, 0) == [first]
+
+        # A new leader does not take over while the lock holds
+        leader = make_enemy(80, 20)
+        order.rebuild([first, second, leader])
+        assert tower.current_targets(order, 100) == [first]
+        assert order.scans_avoided == 1
+
+        first.pos = (300, 0)
+        order.rebuild([first, second, leader])
+        assert tower.current_targets(order, 150) == [leader]
+        assert order.full_scans == 1
+
+    def test_lock_dropped_when_target_leaves_world(self):
+        """Test that a locked target that reached the end or was removed is not kept."""
+        finished, follower = make_enemy(60, 20), make_enemy(40, 20)
+        order = TargetOrder()
+        order.rebuild([finished, follower])
+        tower = Tower((50, 0), TowerStats(range=100))
+        assert tower.current_targets(order, 0) == [finished]
+
+        # Reached the end, still listed this tick
+        finished.curr_waypoint = len(finished.waypoints) - 1
+        order.rebuild([finished, follower])
+        assert finished not in tower.current_targets(order, 10)
+
+        # Removed from the world while still valid by range and health
+        removed = make_enemy(70, 20)
+        order.rebuild([removed, follower])
+        assert tower.current_targets(order, 1000) == [removed]
+        order.rebuild([follower])
+        assert tower.current_targets(order, 1010) == [follower]
+
+
+class TestPathCoverage:
+    """Tests for path coverage intervals and coverage-limited targeting."""
+
+    def test_coverage_intervals(self):
+        """Test that coverage returns the merged arc lengths within the radius."""
+        track = PathTrack([(0, 0), (100, 0), (100, 100), (0, 100)])
+
+        assert track.coverage((50, 0), 10) == ((40.0, 60.0),)
+        assert track.coverage((100, 50), 10) == ((140.0, 160.0),)
+        assert track.coverage((0, 50), 10) == ()
+
+        # Both segments meeting at the corner merge into one interval
+        assert track.coverage((100, 0), 10) == ((90.0, 110.0),)
+
+    def test_only_covered_enemies_considered(self):
+        """Test that a tower sees only enemies inside its coverage."""
+        track = PathTrack(PATH)
+        near, far = make_enemy(50, 20), make_enemy(350, 20)
+        order = TargetOrder({"main": track})
+        order.rebuild([near, far])
+
+        tower = Tower((50, 0), TowerStats(range=500))
+        tower.coverage = {"main": track.coverage(tower.pos, 100)}
+        assert order.any_within(tower.coverage)
+        assert tower.select_targets(order) == [near]
+
+        order.rebuild([far])
+        assert not order.any_within(tower.coverage)
+
+
+class TestSubTickFiring:
+    """Tests for firing several volleys within one long step."""
+
+    @staticmethod
+    def shots_fired(step_ms, total_ms):
+        enemy = make_enemy(60, 10**6)
+        order = TargetOrder()
+        order.rebuild([enemy])
+        stats = TowerStats(
+            range=100, reload_time=0.1, magazine_size=3, magazine_reload_time=0.5
+        )
+        tower = Tower((50, 0), stats)
+        projectiles = []
+        now = 0.0
+        while now < total_ms:
+            now += step_ms
+            tower.attack(order, projectiles, now, step_ms)
+        return projectiles
+
+    def test_long_steps_keep_fire_rate(self):
+        """Test that one long step fires as many shots as many short steps."""
+        short = self.shots_fired(10, 1900)
+        long = self.shots_fired(950, 1900)
+
+        assert len(long) == len(short) == 12
+        assert [p.spawn_delay for p in long[:4]] == [0, 100, 200, 500]
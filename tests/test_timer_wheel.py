@@ -0,0 +1,80 @@
+"""
+Tests for the hierarchical timer wheel.
+"""
+
+from src.core.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    """Tests for TimerWheel scheduling."""
+
+    def test_fires_at_deadline_in_order(self):
+        """Test that timers fire once due, in deadline order."""
+        wheel = TimerWheel(resolution_ms=5.0)
+        fired = []
+        wheel.schedule(30, fired.append, "b")
+        wheel.schedule(10, fired.append, "a")
+
+        wheel.advance(9)
+        assert fired == []
+
+        wheel.advance(25)
+        assert fired == ["a", "b"]
+        assert len(wheel) == 0
+
+    def test_cancel(self):
+        """Test that a cancelled timer never fires."""
+        wheel = TimerWheel()
+        fired = []
+        handle = wheel.schedule(10, fired.append, "x")
+
+        handle.cancel()
+        handle.cancel()
+        wheel.advance(100)
+
+        assert fired == []
+        assert len(wheel) == 0
+        assert not handle.pending
+
+    def test_long_delays_cascade(self):
+        """Test that timers beyond the first level fire close to their deadline."""
+        wheel = TimerWheel(resolution_ms=5.0, slot_bits=2, levels=2)
+        fired_at = []
+        for delay in (7, 90, 333, 1000):
+            wheel.schedule(delay, lambda d=delay: fired_at.append((d, wheel.time)))
+
+        for _ in range(200):
+            wheel.advance(7)
+
+        assert [d for d, _ in fired_at] == [7, 90, 333, 1000]
+        for deadline, time in fired_at:
+            assert deadline <= time < deadline + 7 + 5
+
+    def test_reschedule_from_callback(self):
+        """Test that a callback can schedule its own next run."""
+        wheel = TimerWheel()
+        runs = []
+
+        def tick():
+            runs.append(wheel.time)
+            if len(runs) < 3:
+                wheel.schedule(100, tick)
+
+        wheel.schedule(100, tick)
+        for _ in range(40):
+            wheel.advance(10)
+
+        assert len(runs) == 3
+        assert wheel.fired == 3
+
+    def test_idle_advance_skips_ahead(self):
+        """Test that advancing with nothing pending only moves the clock."""
+        wheel = TimerWheel(resolution_ms=5.0)
+
+        assert wheel.advance(10_000) == 0
+        assert wheel.time == 10_000
+
+        fired = []
+        wheel.schedule(5, fired.append, 1)
+        wheel.advance(5)
+        assert fired == [1]
@@ -0,0 +1,92 @@
+"""
+Tests for the event trace analyzer tool.
+"""
+
+import csv
+import json
+
+from tools.event_trace_analyzer import aggregate, analyze, parse_records, write_csv
+
+
+def write_segment(path, records):
+    with open(path, "w") as f:
+        f.write(json.dumps(["#", 1, {}]) + "\n")
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+class TestPipeline:
+    """Tests for the streaming stages."""
+
+    def test_parse_skips_header_and_garbage(self):
+        """Test that headers and malformed lines are ignored."""
+        lines = ['["#",1,{}]', "not json", "", '[5,0,"GAME_PAUSED",{}]']
+
+        assert list(parse_records(lines)) == [(5, 0, "GAME_PAUSED", {})]
+
+    def test_aggregate_per_wave(self):
+        """Test kills, leaks, summons and gold flow per wave."""
+        records = [
+            (1, -1, "RESOURCE_CHANGED", {"resource_type": "gold", "change": -50}),
+            (10, 0, "ENEMY_SPAWNED", {"enemy": 1}),
+            (12, 0, "ENEMY_KILLED", {"enemy": 1, "source": "basic"}),
+            (13, 0, "RESOURCE_CHANGED", {"resource_type": "gold", "change": 8}),
+            (14, 0, "RESOURCE_CHANGED", {"resource_type": "wood", "change": 20}),
+            (30, 1, "ENEMY_SUMMONED", {"ability": "summoner1"}),
+            (31, 1, "ENEMY_REACHED_END", {"road": "road2", "damage": 5}),
+            (32, 1, "ENEMY_KILLED", {"source": None}),
+        ]
+
+        waves = aggregate(records)
+
+        assert waves[-1].gold_spent == 50
+        assert waves[0].spawned == 1
+        assert waves[0].kills == {"basic": 1}
+        assert waves[0].gold_income == 8
+        assert (waves[0].first_tick, waves[0].last_tick) == (10, 14)
+        assert waves[1].summons == {"summoner1": 1}
+        assert waves[1].leaks == {"road2": 1}
+        assert waves[1].leak_damage == 5
+        assert waves[1].kills == {"unknown": 1}
+
+
+class TestAnalyze:
+    """Tests for multi-segment analysis and output."""
+
+    def test_segments_merged(self, tmp_path):
+        """Test that a wave split across segments is merged."""
+        write_segment(
+            tmp_path / "run.0000.jsonl", [[5, 0, "ENEMY_KILLED", {"source": "cannon"}]]
+        )
+        write_segment(
+            tmp_path / "run.0001.jsonl",
+            [
+                [9, 0, "ENEMY_KILLED", {"source": "cannon"}],
+                [20, 1, "ENEMY_KILLED", {"source": "sniper"}],
+            ],
+        )
+
+        stats = analyze([tmp_path])
+
+        assert [s.wave for s in stats] == [0, 1]
+        assert stats[0].kills == {"cannon": 2}
+        assert (stats[0].first_tick, stats[0].last_tick) == (5, 9)
+
+    def test_csv_breakdown_columns(self, tmp_path):
+        """Test that breakdowns become prefixed CSV columns."""
+        write_segment(
+            tmp_path / "run.0000.jsonl",
+            [
+                [5, 0, "ENEMY_KILLED", {"source": "cannon"}],
+                [6, 1, "ENEMY_REACHED_END", {"road": "road1", "damage": 10}],
+            ],
+        )
+        out = tmp_path / "waves.csv"
+
+        write_csv(analyze([tmp_path]), out)
+
+        with open(out) as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["kills:cannon"] == "1"
+        assert rows[0]["leaks:road1"] == "0"
+        assert rows[1]["leaks:road1"] == "1"
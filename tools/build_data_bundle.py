@@ -0,0 +1,22 @@
+"""
+Data Bundle Builder.
+
+Validates all data/*.json files and writes the compiled data bundle
+(data/.cache/data_bundle.pickle). The game rebuilds a stale bundle on its
+own; run this after editing data files to catch errors early.
+
+Usage:
+    python tools/build_data_bundle.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.data_bundle import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""
+Event Trace Analyzer.
+
+Streams event traces written by the game's trace recorder
+(``python run_game.py --trace DIR``) and produces per-wave aggregates:
+
+    - kills per tower preset (or player ability)
+    - leaks and leak damage per road
+    - gold income versus gold spent
+    - summons per summoning ability
+
+Records flow through generator stages (files -> lines -> records -> aggregates),
+so memory use does not grow with trace size. Every record carries its wave,
+so each segment file can be processed independently; ``--jobs`` spreads the
+segments over worker processes and merges the results.
+
+Usage:
+    python tools/event_trace_analyzer.py traces/ --csv waves.csv --json waves.json
+    python tools/event_trace_analyzer.py traces/level1-*.jsonl --jobs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import json
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Trace record: (tick, wave, event name, payload)
+Record = tuple[int, int, str, dict[str, Any]]
+
+TRACE_PATTERNS: tuple[str, ...] = ("*.jsonl", "*.jsonl.gz")
+
+# Events the aggregation stage looks at
+RELEVANT_EVENTS: frozenset[str] = frozenset(
+    {
+        "ENEMY_SPAWNED",
+        "ENEMY_KILLED",
+        "ENEMY_REACHED_END",
+        "ENEMY_SUMMONED",
+        "RESOURCE_CHANGED",
+    }
+)
+
+
+@dataclass
+class WaveStats:
+    """Aggregates for one wave (wave -1 covers everything before the first wave)."""
+
+    wave: int
+    first_tick: int | None = None
+    last_tick: int | None = None
+    spawned: int = 0
+    leak_damage: int = 0
+    gold_income: int = 0
+    gold_spent: int = 0
+    kills: Counter[str] = field(default_factory=Counter)
+    leaks: Counter[str] = field(default_factory=Counter)
+    summons: Counter[str] = field(default_factory=Counter)
+
+    def merge(self, other: WaveStats) -> None:
+        """Fold another partial aggregate for the same wave into this one."""
+        if other.first_tick is not None:
+            if self.first_tick is None or other.first_tick < self.first_tick:
+                self.first_tick = other.first_tick
+        if other.last_tick is not None:
+            if self.last_tick is None or other.last_tick > self.last_tick:
+                self.last_tick = other.last_tick
+        self.spawned += other.spawned
+        self.leak_damage += other.leak_damage
+        self.gold_income += other.gold_income
+        self.gold_spent += other.gold_spent
+        self.kills.update(other.kills)
+        self.leaks.update(other.leaks)
+        self.summons.update(other.summons)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "wave": self.wave,
+            "first_tick": self.first_tick,
+            "last_tick": self.last_tick,
+            "spawned": self.spawned,
+            "summoned": sum(self.summons.values()),
+            "kills": sum(self.kills.values()),
+            "leaks": sum(self.leaks.values()),
+            "leak_damage": self.leak_damage,
+            "gold_income": self.gold_income,
+            "gold_spent": self.gold_spent,
+            "gold_net": self.gold_income - self.gold_spent,
+            "kills_by_source": dict(sorted(self.kills.items())),
+            "leaks_by_road": dict(sorted(self.leaks.items())),
+            "summons_by_ability": dict(sorted(self.summons.items())),
+        }
+
+
+# -----------------------------------------------------------------------------
+# Pipeline stages
+# -----------------------------------------------------------------------------
+
+
+def iter_trace_files(paths: Iterable[str | Path]) -> Iterator[Path]:
+    """Expand files and directories into trace segment paths, in name order."""
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            found: set[Path] = set()
+            for pattern in TRACE_PATTERNS:
+                found.update(path.glob(pattern))
+            yield from sorted(found)
+        elif path.exists():
+            yield path
+        else:
+            print(f"Warning: Trace file not found: {path}")
+
+
+def read_lines(path: Path) -> Iterator[str]:
+    """Yield the lines of a (optionally gzipped) segment file."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:  # type: ignore[operator]
+        yield from f
+
+
+def parse_records(lines: Iterable[str]) -> Iterator[Record]:
+    """Decode JSON lines into records, skipping segment headers and bad lines."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(item, list) or len(item) != 4 or item[0] == "#":
+            continue
+        tick, wave, event, payload = item
+        yield tick, wave, event, payload or {}
+
+
+def select_events(records: Iterable[Record], names: frozenset[str]) -> Iterator[Record]:
+    """Keep only records of the given event types."""
+    for record in records:
+        if record[2] in names:
+            yield record
+
+
+def aggregate(records: Iterable[Record]) -> dict[int, WaveStats]:
+    """Fold records into per-wave statistics."""
+    waves: dict[int, WaveStats] = {}
+
+    for tick, wave, event, payload in records:
+        stats = waves.get(wave)
+        if stats is None:
+            stats = waves[wave] = WaveStats(wave=wave)
+        if stats.first_tick is None:
+            stats.first_tick = tick
+        stats.last_tick = tick
+
+        if event == "ENEMY_KILLED":
+            stats.kills[payload.get("source") or "unknown"] += 1
+        elif event == "ENEMY_REACHED_END":
+            stats.leaks[payload.get("road") or "unknown"] += 1
+            stats.leak_damage += payload.get("damage") or 0
+        elif event == "ENEMY_SUMMONED":
+            stats.summons[payload.get("ability") or "unknown"] += 1
+        elif event == "ENEMY_SPAWNED":
+            stats.spawned += 1
+        elif event == "RESOURCE_CHANGED" and payload.get("resource_type") == "gold":
+            change = payload.get("change") or 0
+            if change > 0:
+                stats.gold_income += change
+            else:
+                stats.gold_spent -= change
+
+    return waves
+
+
+def analyze_file(path: Path) -> dict[int, WaveStats]:
+    """Run the full pipeline over one segment file."""
+    return aggregate(select_events(parse_records(read_lines(path)), RELEVANT_EVENTS))
+
+
+def merge_into(total: dict[int, WaveStats], partial: dict[int, WaveStats]) -> None:
+    for wave, stats in partial.items():
+        if wave in total:
+            total[wave].merge(stats)
+        else:
+            total[wave] = stats
+
+
+def analyze(paths: Iterable[str | Path], jobs: int = 1) -> list[WaveStats]:
+    """Analyze trace segments, optionally in parallel, and return stats sorted by wave."""
+    files = list(iter_trace_files(paths))
+    total: dict[int, WaveStats] = {}
+
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for partial in pool.map(analyze_file, files):
+                merge_into(total, partial)
+    else:
+        for path in files:
+            merge_into(total, analyze_file(path))
+
+    return [total[wave] for wave in sorted(total)]
+
+
+# -----------------------------------------------------------------------------
+# Output
+# -----------------------------------------------------------------------------
+
+
+def write_json(stats: list[WaveStats], path: str | Path) -> None:
+    totals = WaveStats(wave=-1)
+    for wave_stats in stats:
+        totals.merge(wave_stats)
+    summary = totals.to_dict()
+    del summary["wave"]
+
+    with open(path, "w") as f:
+        json.dump({"waves": [s.to_dict() for s in stats], "totals": summary}, f, indent=2)
+
+
+def write_csv(stats: list[WaveStats], path: str | Path) -> None:
+    """One row per wave; breakdown columns are named like ``kills:cannon``."""
+    rows = []
+    for wave_stats in stats:
+        data = wave_stats.to_dict()
+        row = {k: v for k, v in data.items() if not isinstance(v, dict)}
+        for prefix, key in (
+            ("kills", "kills_by_source"),
+            ("leaks", "leaks_by_road"),
+            ("summons", "summons_by_ability"),
+        ):
+            for name, count in data[key].items():
+                row[f"{prefix}:{name}"] = count
+        rows.append(row)
+
+    base_columns = [k for k, v in WaveStats(wave=0).to_dict().items() if not isinstance(v, dict)]
+    extra_columns = sorted({k for row in rows for k in row} - set(base_columns))
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=base_columns + extra_columns, restval=0)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def print_summary(stats: list[WaveStats]) -> None:
+    print(f"{'wave':>5} {'spawned':>8} {'summoned':>9} {'kills':>6} {'leaks':>6} {'gold +':>8} {'gold -':>8}")
+    for s in stats:
+        d = s.to_dict()
+        print(
+            f"{d['wave']:>5} {d['spawned']:>8} {d['summoned']:>9} {d['kills']:>6} "
+            f"{d['leaks']:>6} {d['gold_income']:>8} {d['gold_spent']:>8}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Aggregate game event traces per wave.")
+    parser.add_argument("paths", nargs="+", help="trace segment files or directories")
+    parser.add_argument("--csv", metavar="FILE", help="write per-wave rows to a CSV file")
+    parser.add_argument("--json", metavar="FILE", help="write per-wave stats and totals as JSON")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for segment files")
+    args = parser.parse_args(argv)
+
+    stats = analyze(args.paths, jobs=args.jobs)
+    if not stats:
+        print("No trace records found.")
+        return 1
+
+    if args.csv:
+        write_csv(stats, args.csv)
+    if args.json:
+        write_json(stats, args.json)
+    if not args.csv and not args.json:
+        print_summary(stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())